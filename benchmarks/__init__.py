@@ -0,0 +1,22 @@
+"""
+Benchmarks do AG do Desafio de Einstein
+micro: custo por chamada das funções do caminho quente (fitness, seleção, cruzamento,
+busca local...); macro: gerações por segundo com população fixa e tempo até a solução
+por semente para src/main.py e para o laço simples de Bastos.py. Os resultados são
+salvos em JSON e comparados com uma linha de base com limiar de regressão.
+
+Uso (na raiz do repositório):
+    python -m benchmarks --saida resultados.json --baseline benchmarks/baseline.json
+    python -m benchmarks --salvar-baseline benchmarks/baseline.json
+"""
+
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(RAIZ, "src")
+
+# os módulos de src/ se importam pelo nome (como em python src/main.py); o caminho
+# entra antes de qualquer import de benchmarks.micro/macro
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
@@ -0,0 +1,70 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from benchmarks.comparacao import LIMIAR_REGRESSAO, comparar, imprimir_comparacao
+from benchmarks.macro import SEMENTES_PADRAO, TEMPO_LIMITE_BASTOS, executar_macro
+from benchmarks.micro import executar_micro
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks do AG: micro (funções) e macro (gerações/s e tempo "
+        "até a solução)",
+    )
+    parser.add_argument("--somente", choices=("micro", "macro"))
+    parser.add_argument(
+        "--funcoes", nargs="*", default=(), help="limita os microbenchmarks"
+    )
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument(
+        "--sementes", type=int, nargs="*", default=list(SEMENTES_PADRAO)
+    )
+    parser.add_argument(
+        "--tempo-limite-bastos", type=float, default=TEMPO_LIMITE_BASTOS
+    )
+    parser.add_argument("--saida", help="arquivo JSON com os resultados")
+    parser.add_argument("--baseline", help="JSON de resultados usado como referência")
+    parser.add_argument(
+        "--salvar-baseline", help="grava os resultados também como linha de base"
+    )
+    parser.add_argument("--limiar", type=float, default=LIMIAR_REGRESSAO)
+    argumentos = parser.parse_args(argv)
+
+    resultados = {
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "maquina": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "processadores": os.cpu_count(),
+        },
+    }
+    if argumentos.somente != "macro":
+        print("⏱️  MICROBENCHMARKS")
+        resultados["micro"] = executar_micro(argumentos.repeticoes, argumentos.funcoes)
+    if argumentos.somente != "micro":
+        print("\n🏁 MACROBENCHMARKS")
+        resultados["macro"] = executar_macro(
+            argumentos.sementes, argumentos.tempo_limite_bastos
+        )
+
+    for caminho in (argumentos.saida, argumentos.salvar_baseline):
+        if caminho:
+            with open(caminho, "w", encoding="utf-8") as arquivo:
+                json.dump(resultados, arquivo, ensure_ascii=False, indent=2)
+            print(f"\n💾 Resultados gravados em {caminho}")
+
+    if argumentos.baseline:
+        with open(argumentos.baseline, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+        linhas = comparar(resultados, base, argumentos.limiar)
+        if imprimir_comparacao(linhas, argumentos.limiar):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
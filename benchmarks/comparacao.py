@@ -0,0 +1,75 @@
+"""
+Comparação de resultados de benchmark com uma linha de base
+Os resultados são achatados em métricas com sentido conhecido (tempo: menor é melhor;
+vazão e taxa de sucesso: maior é melhor) e cada métrica presente nos dois lados é
+marcada como regressão quando piora mais que o limiar relativo.
+"""
+
+from typing import Dict, List, Tuple
+
+LIMIAR_REGRESSAO = 0.10
+
+MENOR_MELHOR = "menor"
+MAIOR_MELHOR = "maior"
+
+
+# métrica -> (valor, sentido) a partir do JSON de resultados
+def metricas(resultados: dict) -> Dict[str, Tuple[float, str]]:
+    achatadas = {}
+    for nome, medida in resultados.get("micro", {}).items():
+        achatadas[f"micro.{nome}"] = (medida["ns_por_chamada"], MENOR_MELHOR)
+
+    macro = resultados.get("macro", {})
+    for tamanho, medida in macro.get("geracoes_por_segundo", {}).items():
+        achatadas[f"macro.geracoes_por_segundo.{tamanho}"] = (
+            medida["geracoes_por_segundo"],
+            MAIOR_MELHOR,
+        )
+    for programa in ("main", "bastos"):
+        resumo = macro.get(f"tempo_solucao_{programa}")
+        if resumo is None:
+            continue
+        achatadas[f"macro.{programa}.taxa_sucesso"] = (
+            resumo["taxa_sucesso"],
+            MAIOR_MELHOR,
+        )
+        if resumo["mediana_tempo_ate_15"] is not None:
+            achatadas[f"macro.{programa}.mediana_tempo_ate_15"] = (
+                resumo["mediana_tempo_ate_15"],
+                MENOR_MELHOR,
+            )
+    return achatadas
+
+
+# variação relativa no sentido "positivo = pior"
+def piora_relativa(atual: float, base: float, sentido: str) -> float:
+    if base == 0:
+        return 0.0 if atual == base else float("inf")
+    variacao = (atual - base) / abs(base)
+    return variacao if sentido == MENOR_MELHOR else -variacao
+
+
+# compara as métricas em comum // retorna linhas (métrica, base, atual, piora, regressão)
+def comparar(atual: dict, base: dict, limiar: float = LIMIAR_REGRESSAO) -> List[tuple]:
+    metricas_atuais = metricas(atual)
+    metricas_base = metricas(base)
+    linhas = []
+    for nome in sorted(metricas_atuais.keys() & metricas_base.keys()):
+        valor, sentido = metricas_atuais[nome]
+        valor_base, _ = metricas_base[nome]
+        piora = piora_relativa(valor, valor_base, sentido)
+        linhas.append((nome, valor_base, valor, piora, piora > limiar))
+    return linhas
+
+
+def imprimir_comparacao(linhas: List[tuple], limiar: float) -> int:
+    print(f"\n📊 COMPARAÇÃO COM A LINHA DE BASE (limiar de regressão {limiar:.0%})")
+    print(f"   {'Métrica':48s} {'Base':>14s} {'Atual':>14s} {'Ganho':>9s}")
+    for nome, valor_base, valor, piora, regressao in linhas:
+        marca = "❌ regressão" if regressao else ("✅" if piora < -limiar else "")
+        print(
+            f"   {nome:48s} {valor_base:14,.3f} {valor:14,.3f} {0.0 - piora:+9.1%} {marca}"
+        )
+    regressoes = sum(1 for linha in linhas if linha[4])
+    print(f"   {regressoes} regressões em {len(linhas)} métricas")
+    return regressoes
@@ -0,0 +1,161 @@
+"""
+Macrobenchmarks: vazão do laço de gerações e tempo até a solução
+- gerações por segundo do AlgoritmoGeneticoAvancado com população inicial fixa (1800 e
+  5000), com a completação exata desligada para medir só o laço evolutivo
+- tempo até a solução por semente de src/main.py (mesma execução silenciosa da campanha
+  de experimentos) e de Bastos.py (processo separado, com tempo limite, já que o laço
+  simples roda até achar a solução e pode estagnar)
+"""
+
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks import RAIZ
+from einstein_rules import definir_backend_fitness
+from experimentos import executar_configuracao
+from configuracao_ag import BACKEND_FITNESS
+from main import AlgoritmoGeneticoAvancado
+
+SEMENTES_PADRAO = (1, 2, 3, 4, 5)
+TEMPO_LIMITE_BASTOS = 60.0
+
+_PADRAO_GERACAO_BASTOS = re.compile(r"Geração\s+(\d+) \| Melhor:\s+(\d+)/15")
+_PADRAO_TEMPO_BASTOS = re.compile(r"Tempo total: ([\d.]+) segundos")
+_PADRAO_SOLUCAO_BASTOS = re.compile(r"SOLUÇÃO ENCONTRADA NA GERAÇÃO (\d+)")
+
+
+# gerações por segundo com a população inicial fixada em `tamanho_populacao`
+# (a adaptação de parâmetros ainda pode mudar o tamanho ao longo da execução)
+def geracoes_por_segundo(
+    tamanho_populacao: int, geracoes: int = 30, semente: int = 1
+) -> dict:
+    random.seed(semente)
+    definir_backend_fitness(BACKEND_FITNESS)
+    algoritmo = AlgoritmoGeneticoAvancado(
+        tamanho_populacao=tamanho_populacao,
+        limiar_completacao_exata=None,
+        limite_geracoes=geracoes,
+    )
+
+    inicio = time.perf_counter()
+    algoritmo.executar()
+    tempo = time.perf_counter() - inicio
+
+    executadas = algoritmo.geracoes_executadas
+    return {
+        "geracoes": executadas,
+        "tempo": tempo,
+        "geracoes_por_segundo": executadas / tempo,
+        "tamanho_populacao_final": algoritmo.tamanho_populacao,
+    }
+
+
+def _resumo_solucao(execucoes: List[dict]) -> dict:
+    tempos = [e["tempo_ate_15"] for e in execucoes if e["sucesso"]]
+    return {
+        "execucoes": execucoes,
+        "taxa_sucesso": len(tempos) / len(execucoes),
+        "mediana_tempo_ate_15": statistics.median(tempos) if tempos else None,
+    }
+
+
+# tempo até a solução do AG de src/main.py para cada semente
+def tempo_solucao_main(sementes=SEMENTES_PADRAO) -> dict:
+    execucoes = []
+    for semente in sementes:
+        execucao = executar_configuracao("main", {}, semente)
+        execucoes.append(
+            {
+                chave: execucao[chave]
+                for chave in (
+                    "semente",
+                    "sucesso",
+                    "fitness",
+                    "geracoes",
+                    "tempo_ate_15",
+                    "tempo_total",
+                )
+            }
+        )
+        print(
+            f"   main.py   semente {semente}: {execucao['fitness']}/15 em "
+            f"{execucao['tempo_total']:.2f}s ({execucao['geracoes']} gerações)"
+        )
+    return _resumo_solucao(execucoes)
+
+
+# roda Bastos.py com random.seed(semente) num processo separado // sem solução dentro
+# do tempo limite, registra a última geração e o melhor fitness registrados no log
+def _executar_bastos(semente: int, tempo_limite: float) -> dict:
+    comando = (
+        "import random, runpy; "
+        f"random.seed({semente}); "
+        "runpy.run_path('Bastos.py', run_name='__main__')"
+    )
+    inicio = time.perf_counter()
+    try:
+        processo = subprocess.run(
+            [sys.executable, "-u", "-c", comando],
+            cwd=RAIZ,
+            capture_output=True,
+            timeout=tempo_limite,
+        )
+        saida = processo.stdout
+    except subprocess.TimeoutExpired as expirado:
+        saida = expirado.stdout or b""
+    tempo_total = time.perf_counter() - inicio
+    texto = saida.decode("utf-8", errors="replace")
+
+    registros = _PADRAO_GERACAO_BASTOS.findall(texto)
+    tempo_solucao = _PADRAO_TEMPO_BASTOS.search(texto)
+    geracao, melhor = registros[-1] if registros else (0, 0)
+    solucao = _PADRAO_SOLUCAO_BASTOS.search(texto)
+    if solucao:
+        geracao = solucao.group(1)
+    return {
+        "semente": semente,
+        "sucesso": tempo_solucao is not None,
+        "fitness": 15 if tempo_solucao else int(melhor),
+        "geracoes": int(geracao),
+        "tempo_ate_15": float(tempo_solucao.group(1)) if tempo_solucao else None,
+        "tempo_total": tempo_total,
+    }
+
+
+def tempo_solucao_bastos(
+    sementes=SEMENTES_PADRAO, tempo_limite: float = TEMPO_LIMITE_BASTOS
+) -> dict:
+    execucoes = []
+    for semente in sementes:
+        execucao = _executar_bastos(semente, tempo_limite)
+        execucoes.append(execucao)
+        print(
+            f"   Bastos.py semente {semente}: {execucao['fitness']}/15 em "
+            f"{execucao['tempo_total']:.2f}s ({execucao['geracoes']} gerações)"
+        )
+    return _resumo_solucao(execucoes)
+
+
+def executar_macro(
+    sementes=SEMENTES_PADRAO,
+    tempo_limite_bastos: float = TEMPO_LIMITE_BASTOS,
+    geracoes: int = 30,
+) -> Dict[str, dict]:
+    resultados = {"geracoes_por_segundo": {}}
+    for tamanho in (1800, 5000):
+        medida = geracoes_por_segundo(tamanho, geracoes)
+        resultados["geracoes_por_segundo"][str(tamanho)] = medida
+        print(
+            f"   população {tamanho}: {medida['geracoes_por_segundo']:.2f} gerações/s "
+            f"({medida['geracoes']} gerações em {medida['tempo']:.2f}s)"
+        )
+    resultados["tempo_solucao_main"] = tempo_solucao_main(sementes)
+    resultados["tempo_solucao_bastos"] = tempo_solucao_bastos(
+        sementes, tempo_limite_bastos
+    )
+    return resultados
@@ -0,0 +1,89 @@
+"""
+Microbenchmarks das funções do caminho quente do AG
+Cada função roda sobre um conjunto fixo de entradas (semente fixa), percorrido em ciclo
+para não medir sempre o mesmo cromossomo; o resultado é o tempo por chamada em
+nanossegundos (mediana e mínimo de várias repetições cronometradas com timeit).
+"""
+
+import random
+import statistics
+import timeit
+from itertools import cycle
+from typing import Callable, Dict, List, Tuple
+
+from einstein_rules import (
+    definir_backend_fitness,
+    fitness,
+    fitness_ponderado,
+    obter_regras_faltantes,
+)
+from genetic_algorithm import (
+    busca_local,
+    cromossomo_aleatorio,
+    cruzamento,
+    cruzamento_avancado,
+    reparar_cromossomo,
+    selecao_roleta,
+    selecao_torneio,
+)
+from configuracao_ag import BACKEND_FITNESS, MODO_BUSCA_LOCAL
+from main import AlgoritmoGeneticoAvancado
+
+SEMENTE = 2024
+NUMERO_ENTRADAS = 1000
+
+
+# monta os benchmarks: nome -> função sem argumentos que faz uma chamada
+def preparar() -> Dict[str, Callable[[], object]]:
+    random.seed(SEMENTE)
+    definir_backend_fitness(BACKEND_FITNESS)
+
+    cromossomos = [cromossomo_aleatorio() for _ in range(NUMERO_ENTRADAS)]
+    pares = list(zip(cromossomos, reversed(cromossomos)))
+    # corte por casa sem reparo: a maioria das colunas deixa de ser permutação
+    invalidos = [pai1[:10] + pai2[10:] for pai1, pai2 in pares]
+    populacao = cromossomos[:200]
+    valores_fitness = sorted((fitness(c) for c in populacao), reverse=True)
+    algoritmo = AlgoritmoGeneticoAvancado()
+
+    proximo_cromossomo = cycle(cromossomos).__next__
+    proximo_par = cycle(pares).__next__
+    proximo_invalido = cycle(invalidos).__next__
+
+    return {
+        "fitness": lambda: fitness(proximo_cromossomo()),
+        "fitness_ponderado": lambda: fitness_ponderado(proximo_cromossomo()),
+        "obter_regras_faltantes": lambda: obter_regras_faltantes(proximo_cromossomo()),
+        "reparar_cromossomo": lambda: reparar_cromossomo(proximo_invalido()),
+        "cruzamento": lambda: cruzamento(*proximo_par(), 1.0),
+        "cruzamento_avancado": lambda: cruzamento_avancado(*proximo_par(), 1.0),
+        "selecao_roleta": lambda: selecao_roleta(populacao, valores_fitness),
+        "selecao_torneio": lambda: selecao_torneio(populacao, valores_fitness, 5),
+        "busca_local": lambda: busca_local(
+            proximo_cromossomo(), fitness, 15, MODO_BUSCA_LOCAL, incremental=True
+        ),
+        "criar_populacao_especializada_1800": lambda: (
+            algoritmo.criar_populacao_especializada(1800)
+        ),
+    }
+
+
+def _medir(funcao: Callable[[], object], repeticoes: int) -> Tuple[float, float]:
+    temporizador = timeit.Timer(funcao)
+    numero, _ = temporizador.autorange()  # chamadas por medição (>= 0,2 s)
+    tempos = [
+        tempo / numero * 1e9
+        for tempo in temporizador.repeat(repeat=repeticoes, number=numero)
+    ]
+    return statistics.median(tempos), min(tempos)
+
+
+def executar_micro(repeticoes: int = 5, filtro: List[str] = ()) -> Dict[str, dict]:
+    resultados = {}
+    for nome, funcao in preparar().items():
+        if filtro and nome not in filtro:
+            continue
+        mediana, minimo = _medir(funcao, repeticoes)
+        resultados[nome] = {"ns_por_chamada": mediana, "ns_minimo": minimo}
+        print(f"   {nome:36s} {mediana:14,.0f} ns/chamada (mín. {minimo:,.0f})")
+    return resultados
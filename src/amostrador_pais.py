@@ -0,0 +1,114 @@
+"""
+Amostrador de pais construído uma vez por geração
+Pré-calcula as estruturas de seleção sobre o vetor de fitness e devolve lotes de
+índices de pais: roleta por tabela de alias (O(1)) ou busca binária nas somas
+acumuladas (O(log n)), amostragem universal estocástica e torneios por índice.
+"""
+
+import random
+from bisect import bisect_left
+from itertools import accumulate
+from typing import List, Optional, Sequence
+
+
+class AmostradorPais:
+
+    def __init__(self, valores_fitness: Sequence[int]):
+        if not valores_fitness:
+            raise ValueError("AmostradorPais precisa de ao menos um indivíduo")
+
+        self.valores_fitness = valores_fitness
+        self.tamanho = len(valores_fitness)
+        self.fitness_maximo = max(valores_fitness)
+
+        # mesmos pesos de selecao_roleta: valores positivos para a roleta
+        pesos = [max(0, f) + 1 for f in valores_fitness]
+        self.acumulado = list(accumulate(pesos))
+        self.total = self.acumulado[-1]
+        self._probabilidade, self._alias = self._construir_alias(pesos)
+
+    # tabela de alias (método de Vose): cada célula guarda um índice, a probabilidade de
+    # ficar com ele e o índice alternativo
+    def _construir_alias(self, pesos: List[int]):
+        n = self.tamanho
+        escalados = [peso * n / self.total for peso in pesos]
+        probabilidade = [1.0] * n
+        alias = list(range(n))
+
+        pequenos = [i for i, p in enumerate(escalados) if p < 1.0]
+        grandes = [i for i, p in enumerate(escalados) if p >= 1.0]
+        while pequenos and grandes:
+            menor = pequenos.pop()
+            maior = grandes[-1]
+            probabilidade[menor] = escalados[menor]
+            alias[menor] = maior
+            escalados[maior] -= 1.0 - escalados[menor]
+            if escalados[maior] < 1.0:
+                pequenos.append(grandes.pop())
+        # sobras (erro de arredondamento) ficam com probabilidade 1
+
+        return probabilidade, alias
+
+    # roleta O(1) pela tabela de alias
+    def roleta(self) -> int:
+        i = random.randrange(self.tamanho)
+        if random.random() < self._probabilidade[i]:
+            return i
+        return self._alias[i]
+
+    # roleta O(log n): mesmo sorteio de selecao_roleta, com busca binária no acumulado
+    def roleta_bisect(self) -> int:
+        return bisect_left(self.acumulado, random.uniform(0, self.total))
+
+    # torneio por índice entre os `limite` primeiros indivíduos
+    def torneio(self, tamanho_torneio: int, limite: Optional[int] = None) -> int:
+        candidatos = self.tamanho if limite is None else min(limite, self.tamanho)
+        tamanho_torneio = min(tamanho_torneio, candidatos)
+        # sorteio sem reposição por rejeição: bem mais barato que random.sample para
+        # torneios pequenos // a ordem do sorteio é mantida para que empates sejam
+        # decididos como em selecao_torneio (primeiro sorteado)
+        indices = []
+        while len(indices) < tamanho_torneio:
+            i = random.randrange(candidatos)
+            if i not in indices:
+                indices.append(i)
+        return max(indices, key=self.valores_fitness.__getitem__)
+
+    # mesma política de selecao_hibrida: torneio menor quanto maior o fitness máximo
+    def hibrida(self) -> int:
+        if self.fitness_maximo >= 14:
+            return self.torneio(3)
+        elif self.fitness_maximo >= 13:
+            return self.torneio(5)
+        elif self.fitness_maximo >= 10:
+            return self.torneio(7)
+        else:
+            return self.roleta()
+
+    # lotes de índices de pais
+    def roletas(self, quantidade: int) -> List[int]:
+        return [self.roleta() for _ in range(quantidade)]
+
+    def torneios(
+        self, quantidade: int, tamanho_torneio: int, limite: Optional[int] = None
+    ) -> List[int]:
+        return [self.torneio(tamanho_torneio, limite) for _ in range(quantidade)]
+
+    def hibridos(self, quantidade: int) -> List[int]:
+        return [self.hibrida() for _ in range(quantidade)]
+
+    # amostragem universal estocástica: `quantidade` ponteiros igualmente espaçados
+    # sobre o acumulado, com um único sorteio (menor variância que roletas independentes)
+    def sus(self, quantidade: int) -> List[int]:
+        if quantidade <= 0:
+            return []
+        passo = self.total / quantidade
+        inicio = random.uniform(0, passo)
+        indices = []
+        i = 0
+        for k in range(quantidade):
+            ponteiro = inicio + k * passo
+            while i < self.tamanho - 1 and self.acumulado[i] < ponteiro:
+                i += 1
+            indices.append(i)
+        return indices
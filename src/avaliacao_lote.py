@@ -0,0 +1,105 @@
+"""
+Avaliação vetorizada (NumPy) do fitness de uma população inteira
+A população é tratada como um array (N, 5, 5) de inteiros: indivíduo x casa x atributo.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from cromossomo import Cromossomo
+from einstein_rules import ATRIBUTOS_REGRAS, ESPECIFICACAO_REGRAS, PESOS_REGRAS
+from tabelas_permutacao import NUMERO_PERMUTACOES, TABELAS_REGRAS
+
+PESOS_VETOR = np.array(
+    [PESOS_REGRAS[i] for i in range(len(ESPECIFICACAO_REGRAS))], dtype=np.float64
+)
+BITS_REGRAS = 1 << np.arange(len(ESPECIFICACAO_REGRAS), dtype=np.int64)
+
+# tabelas de tabelas_permutacao como arrays, para consultas em lote sobre genomas
+_TABELAS_ARRAY = [
+    (np.frombuffer(tabela, dtype=np.uint8), atributos)
+    for tabela, atributos in zip(TABELAS_REGRAS, ATRIBUTOS_REGRAS)
+]
+
+
+# converte a lista de cromossomos (bytes) em um array (N, 5, 5) sem copiar gene a gene
+def populacao_para_array(populacao: List[Cromossomo]) -> np.ndarray:
+    return np.frombuffer(b"".join(populacao), dtype=np.uint8).reshape(-1, 5, 5)
+
+
+# máscara (N, 5) apenas com a primeira casa de cada indivíduo onde a presença é verdadeira
+def _primeira_ocorrencia(presenca: np.ndarray) -> np.ndarray:
+    return presenca & (np.cumsum(presenca, axis=1) == 1)
+
+
+# expande a máscara (N, 5) para as casas vizinhas
+def _vizinhanca(presenca: np.ndarray) -> np.ndarray:
+    vizinhos = np.zeros_like(presenca)
+    vizinhos[:, 1:] |= presenca[:, :-1]
+    vizinhos[:, :-1] |= presenca[:, 1:]
+    return vizinhos
+
+
+# avalia as 15 regras para todos os indivíduos de uma vez
+# retorna a matriz (N, 15) de regras satisfeitas, a contagem (fitness) e o fitness ponderado
+def avaliar_lote(
+    populacao_array: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    n = populacao_array.shape[0]
+    satisfeitas = np.empty((n, len(ESPECIFICACAO_REGRAS)), dtype=bool)
+
+    for indice, (tipo, atributo_a, valor_a, atributo_b, valor_b) in enumerate(
+        ESPECIFICACAO_REGRAS
+    ):
+        if tipo == "casa":
+            satisfeitas[:, indice] = populacao_array[:, valor_b, atributo_a] == valor_a
+            continue
+
+        presenca_a = populacao_array[:, :, atributo_a] == valor_a
+        presenca_b = populacao_array[:, :, atributo_b] == valor_b
+
+        if tipo == "mesma_casa":
+            satisfeitas[:, indice] = (presenca_a & presenca_b).any(axis=1)
+        elif tipo == "esquerda":
+            primeira_a = _primeira_ocorrencia(presenca_a)
+            primeira_b = _primeira_ocorrencia(presenca_b)
+            satisfeitas[:, indice] = (primeira_a[:, :-1] & primeira_b[:, 1:]).any(
+                axis=1
+            )
+        elif tipo == "ao_lado":
+            satisfeitas[:, indice] = (_vizinhanca(presenca_a) & presenca_b).any(axis=1)
+        else:  # ao_lado_primeira
+            primeira_a = _primeira_ocorrencia(presenca_a)
+            satisfeitas[:, indice] = (_vizinhanca(primeira_a) & presenca_b).any(axis=1)
+
+    contagem = satisfeitas.sum(axis=1)
+    ponderado = satisfeitas @ PESOS_VETOR
+
+    return satisfeitas, contagem, ponderado
+
+
+# atalho para o laço principal: lista de fitness simples da população
+def fitness_populacao(populacao: List[Cromossomo]) -> List[int]:
+    if not populacao:
+        return []
+    _, contagem, _ = avaliar_lote(populacao_para_array(populacao))
+    return contagem.tolist()
+
+
+# máscaras de satisfação (bit k = regra k + 1), compatíveis com einstein_rules.avaliar
+def mascaras_lote(populacao_array: np.ndarray) -> np.ndarray:
+    satisfeitas, _, _ = avaliar_lote(populacao_array)
+    return satisfeitas @ BITS_REGRAS
+
+
+# fitness simples de um array (N, 5) de genomas ranqueados (um rank por atributo)
+def fitness_genomas_lote(genomas: np.ndarray) -> np.ndarray:
+    contagem = np.zeros(genomas.shape[0], dtype=np.uint8)
+    for tabela, atributos in _TABELAS_ARRAY:
+        if len(atributos) == 1:
+            contagem += tabela[genomas[:, atributos[0]]]
+        else:
+            a, b = atributos
+            contagem += tabela[genomas[:, a] * NUMERO_PERMUTACOES + genomas[:, b]]
+    return contagem
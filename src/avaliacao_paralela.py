@@ -0,0 +1,201 @@
+"""
+Avaliação de fitness em lote dividida entre processos, com a população em memória
+compartilhada
+Os genes da população ficam num array uint8 (N, 25) em multiprocessing.shared_memory que
+os processos leem sem cópia; cada processo avalia um bloco de linhas com avaliar_lote e
+escreve as máscaras de regras no vetor compartilhado de saída. Só os nomes dos blocos
+de memória e os limites de cada bloco trafegam entre processos (nada de listas de
+cromossomos serializadas). Abaixo de `limiar_serial` indivíduos a avaliação é feita no
+próprio processo, e os tempos dos dois caminhos ficam registrados para localizar o
+ponto a partir do qual o paralelismo compensa.
+"""
+
+import math
+import os
+import time
+import weakref
+from multiprocessing import Pool, shared_memory
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from avaliacao_lote import mascaras_lote, populacao_para_array
+from cromossomo import TAMANHO_CROMOSSOMO, Cromossomo
+from dominios_reduzidos import amostrar_reduzidos
+from einstein_rules import CONTAGEM_REGRAS
+
+# ponto de equilíbrio medido com medir(): ~0.7 µs por indivíduo em série contra um custo
+# fixo de ~0.3 ms (2 processos) a ~0.8 ms (4 processos) por lote paralelo, ou seja,
+# ~900 a ~1500 indivíduos; abaixo da população base do AG (1800), que assim já divide
+# a avaliação quando há trabalhadores configurados
+LIMIAR_SERIAL = 1_500
+TAMANHO_MINIMO_BLOCO = 250
+
+# blocos de memória compartilhada abertos no processo trabalhador (nome -> bloco)
+_BLOCOS_ABERTOS = {}
+
+
+def _abrir(*nomes: str) -> List[shared_memory.SharedMemory]:
+    # o processo principal cresce os buffers recriando-os: fecha os que saíram de uso
+    for nome in [nome for nome in _BLOCOS_ABERTOS if nome not in nomes]:
+        _BLOCOS_ABERTOS.pop(nome).close()
+    for nome in nomes:
+        if nome not in _BLOCOS_ABERTOS:
+            _BLOCOS_ABERTOS[nome] = shared_memory.SharedMemory(nome)
+    return [_BLOCOS_ABERTOS[nome] for nome in nomes]
+
+
+# tarefa do trabalhador: avalia as linhas [inicio, fim) e grava as máscaras na saída
+def _avaliar_bloco(nome_genes, nome_saida, capacidade, inicio, fim):
+    bloco_genes, bloco_saida = _abrir(nome_genes, nome_saida)
+    genes = np.ndarray(
+        (capacidade, TAMANHO_CROMOSSOMO), dtype=np.uint8, buffer=bloco_genes.buf
+    )
+    saida = np.ndarray((capacidade,), dtype=np.int64, buffer=bloco_saida.buf)
+    saida[inicio:fim] = mascaras_lote(genes[inicio:fim].reshape(-1, 5, 5))
+    return fim - inicio
+
+
+def _liberar(pool, blocos):
+    if pool is not None:
+        pool.terminate()
+    for bloco in blocos:
+        bloco.close()
+        bloco.unlink()
+
+
+class AvaliadorParalelo:
+
+    def __init__(
+        self,
+        trabalhadores: Optional[int] = None,
+        limiar_serial: int = LIMIAR_SERIAL,
+        tamanho_bloco: Optional[int] = None,
+    ):
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self.limiar_serial = limiar_serial
+        self.tamanho_bloco = tamanho_bloco  # None: escolhido pelo tamanho da população
+
+        self._pool = None
+        self._genes = None
+        self._saida = None
+        self._capacidade = 0
+        self._finalizador = None
+
+        self.estatisticas = {
+            "lotes_serial": 0,
+            "lotes_paralelo": 0,
+            "individuos_serial": 0,
+            "individuos_paralelo": 0,
+            "tempo_serial": 0.0,
+            "tempo_paralelo": 0.0,
+            "tempo_copia": 0.0,
+        }
+
+    # blocos de ~N / trabalhadores linhas (nunca menores que TAMANHO_MINIMO_BLOCO):
+    # avaliar_lote é vetorizado, então poucos blocos grandes custam menos que muitos
+    def blocos(self, quantidade: int) -> List[range]:
+        tamanho = self.tamanho_bloco or max(
+            TAMANHO_MINIMO_BLOCO, math.ceil(quantidade / self.trabalhadores)
+        )
+        return [
+            range(inicio, min(inicio + tamanho, quantidade))
+            for inicio in range(0, quantidade, tamanho)
+        ]
+
+    # (re)cria o pool e os buffers compartilhados com folga para `quantidade` linhas
+    def _preparar(self, quantidade: int) -> None:
+        if quantidade <= self._capacidade:
+            return
+        if self._finalizador is not None:
+            self._finalizador()
+
+        self._capacidade = max(quantidade, 2 * self._capacidade)
+        self._genes = shared_memory.SharedMemory(
+            create=True, size=self._capacidade * TAMANHO_CROMOSSOMO
+        )
+        self._saida = shared_memory.SharedMemory(
+            create=True, size=self._capacidade * np.dtype(np.int64).itemsize
+        )
+        self._pool = Pool(self.trabalhadores)
+        self._finalizador = weakref.finalize(
+            self, _liberar, self._pool, [self._genes, self._saida]
+        )
+
+    # máscaras de regras de um array (N, 5, 5), como avaliacao_lote.mascaras_lote
+    def mascaras(self, populacao_array: np.ndarray) -> np.ndarray:
+        quantidade = populacao_array.shape[0]
+        if quantidade < self.limiar_serial or self.trabalhadores < 2:
+            return self._mascaras_serial(populacao_array)
+        return self._mascaras_paralelas(populacao_array)
+
+    def _mascaras_serial(self, populacao_array: np.ndarray) -> np.ndarray:
+        inicio = time.perf_counter()
+        resultado = mascaras_lote(populacao_array)
+        self.estatisticas["tempo_serial"] += time.perf_counter() - inicio
+        self.estatisticas["lotes_serial"] += 1
+        self.estatisticas["individuos_serial"] += populacao_array.shape[0]
+        return resultado
+
+    def _mascaras_paralelas(self, populacao_array: np.ndarray) -> np.ndarray:
+        inicio = time.perf_counter()
+        quantidade = populacao_array.shape[0]
+        self._preparar(quantidade)
+
+        genes = np.ndarray(
+            (self._capacidade, TAMANHO_CROMOSSOMO),
+            dtype=np.uint8,
+            buffer=self._genes.buf,
+        )
+        genes[:quantidade] = populacao_array.reshape(quantidade, TAMANHO_CROMOSSOMO)
+        self.estatisticas["tempo_copia"] += time.perf_counter() - inicio
+
+        tarefas = [
+            (
+                self._genes.name,
+                self._saida.name,
+                self._capacidade,
+                bloco.start,
+                bloco.stop,
+            )
+            for bloco in self.blocos(quantidade)
+        ]
+        self._pool.starmap(_avaliar_bloco, tarefas)
+
+        saida = np.ndarray((self._capacidade,), dtype=np.int64, buffer=self._saida.buf)
+        resultado = saida[:quantidade].copy()
+
+        self.estatisticas["tempo_paralelo"] += time.perf_counter() - inicio
+        self.estatisticas["lotes_paralelo"] += 1
+        self.estatisticas["individuos_paralelo"] += quantidade
+        return resultado
+
+    # mesmo contrato de avaliacao_lote.fitness_populacao
+    def fitness_populacao(self, populacao: List[Cromossomo]) -> List[int]:
+        if not populacao:
+            return []
+        mascaras = self.mascaras(populacao_para_array(populacao)).tolist()
+        return [CONTAGEM_REGRAS[mascara] for mascara in mascaras]
+
+    # mede os dois caminhos para cada tamanho de população // retorna linhas
+    # (tamanho, segundos em série, segundos em paralelo) com o melhor de `repeticoes`
+    def medir(self, tamanhos: Sequence[int], repeticoes: int = 3) -> List[tuple]:
+        medidas = []
+        for tamanho in tamanhos:
+            populacao_array = populacao_para_array(amostrar_reduzidos(tamanho))
+            tempos = []
+            for avaliar in (self._mascaras_serial, self._mascaras_paralelas):
+                melhor = float("inf")
+                for _ in range(repeticoes):
+                    inicio = time.perf_counter()
+                    avaliar(populacao_array)
+                    melhor = min(melhor, time.perf_counter() - inicio)
+                tempos.append(melhor)
+            medidas.append((tamanho, *tempos))
+        return medidas
+
+    def fechar(self) -> None:
+        if self._finalizador is not None:
+            self._finalizador()
+        self._pool = None
+        self._capacidade = 0
@@ -0,0 +1,220 @@
+"""
+Métodos de trajetória para o Desafio de Einstein: busca tabu e recozimento simulado
+Os dois motores usam o mesmo núcleo de fitness do AG (máscaras de einstein_rules) e os
+mesmos movimentos de troca (atributo, casa1, casa2) de gerar_vizinho. Como MotorBusca,
+recebem a ConfiguracaoAG (limites de tempo, avaliações e fitness alvo; limite_geracoes
+limita as iterações da busca tabu e os ciclos do recozimento), contam todas as
+avaliações, avisam os callbacks e devolvem um ResultadoAG (geracoes = iterações da
+busca tabu ou ciclos do recozimento).
+"""
+
+import math
+import random
+
+from cromossomo import trocar
+from dominios_reduzidos import amostrar_reduzidos
+from einstein_rules import (
+    MOVIMENTOS_TROCA,
+    NUMERO_REGRAS,
+    avaliar_troca,
+    avaliar_vizinhanca,
+    contar_regras,
+    ponderado_mascara,
+)
+from genetic_algorithm import gerar_movimento
+from motor_busca import MotorBusca
+
+
+# busca tabu com lista de movimentos recentes: a cada iteração avalia os 50 vizinhos,
+# anda para o melhor vizinho não tabu (critério de aspiração: tabu liberado se supera
+# o melhor global) e proíbe desfazer a troca por `duracao_tabu` iterações //
+# max_iteracoes (padrão: limite_geracoes da configuração)
+class BuscaTabu(MotorBusca):
+
+    nome = "Busca tabu"
+
+    def __init__(
+        self,
+        configuracao=None,
+        callbacks=None,
+        evento_parada=None,
+        duracao_tabu=8,
+        max_iteracoes=None,
+        iteracoes_para_reinicio=400,
+    ):
+        super().__init__(configuracao, callbacks, evento_parada)
+        self.duracao_tabu = duracao_tabu
+        if max_iteracoes is None:
+            max_iteracoes = self.configuracao.limite_geracoes
+        self.max_iteracoes = max_iteracoes
+        self.iteracoes_para_reinicio = iteracoes_para_reinicio
+
+    def descricao(self) -> str:
+        return "🔁 BUSCA TABU: vizinhança completa de trocas com lista tabu por recência"
+
+    def executar(self):
+        self._iniciar()
+
+        atual = amostrar_reduzidos(1)[0]
+        mascara = self.avaliar(atual)
+        melhor_cromossomo, melhor_mascara = atual, mascara
+        self._registrar_melhoria(0, contar_regras(mascara))
+        tabu_ate = [-1] * len(MOVIMENTOS_TROCA)
+        ultima_melhoria = 0
+        reinicios = 0
+        iteracao = 0
+        motivo_parada = "limite_geracoes"
+
+        for iteracao in range(1, self.max_iteracoes + 1):
+            motivo = self._motivo_parada(contar_regras(melhor_mascara))
+            if motivo is not None:
+                motivo_parada = motivo
+                iteracao -= 1  # a iteração não chegou a ser executada
+                break
+
+            # diversificação: recomeça de um ponto novo após muito tempo sem melhora
+            if iteracao - ultima_melhoria > self.iteracoes_para_reinicio:
+                atual = amostrar_reduzidos(1)[0]
+                mascara = self.avaliar(atual)
+                tabu_ate = [-1] * len(MOVIMENTOS_TROCA)
+                ultima_melhoria = iteracao
+                reinicios += 1
+
+            mascaras = avaliar_vizinhanca(atual, mascara)
+            self.contar(len(mascaras))
+            fitness_global = contar_regras(melhor_mascara)
+
+            # melhor vizinho permitido: fitness simples e, no empate, o ponderado
+            melhor_chave = None
+            escolhidos = []
+            for indice, mascara_vizinho in enumerate(mascaras):
+                fitness_vizinho = contar_regras(mascara_vizinho)
+                if tabu_ate[indice] >= iteracao and fitness_vizinho <= fitness_global:
+                    continue
+                chave = (fitness_vizinho, ponderado_mascara(mascara_vizinho))
+                if melhor_chave is None or chave > melhor_chave:
+                    melhor_chave = chave
+                    escolhidos = [indice]
+                elif chave == melhor_chave:
+                    escolhidos.append(indice)
+            if not escolhidos:
+                continue  # todos os movimentos tabu: espera a lista expirar
+
+            indice = random.choice(escolhidos)
+            atual = trocar(atual, *MOVIMENTOS_TROCA[indice])
+            mascara = mascaras[indice]
+            tabu_ate[indice] = iteracao + self.duracao_tabu
+
+            if contar_regras(mascara) > fitness_global:
+                melhor_cromossomo, melhor_mascara = atual, mascara
+                ultima_melhoria = iteracao
+                self._registrar_melhoria(iteracao, contar_regras(mascara))
+        else:
+            # última iteração executada: a solução ou o fitness alvo podem ter saído dela
+            motivo_parada = self._motivo_parada(contar_regras(melhor_mascara)) or (
+                "limite_geracoes"
+            )
+
+        self.estatisticas = {"iteracoes": iteracao, "reinicios": reinicios}
+        return self._finalizar(
+            melhor_cromossomo, contar_regras(melhor_mascara), iteracao, motivo_parada
+        )
+
+
+# agendas de resfriamento: temperatura em função do progresso (0 a 1) do ciclo
+RESFRIAMENTOS = {
+    "geometrico": lambda t0, tf, p: t0 * (tf / t0) ** p,
+    "linear": lambda t0, tf, p: t0 + (tf - t0) * p,
+    "logaritmico": lambda t0, tf, p: tf + (t0 - tf) / (1 + math.log1p(1000 * p)),
+}
+
+# no recozimento, o orçamento é consultado a cada PASSO_VERIFICACAO_RECOZIMENTO passos
+# (junto com o recálculo da temperatura)
+PASSO_VERIFICACAO_RECOZIMENTO = 100
+
+
+# recozimento simulado sobre os movimentos de gerar_movimento com avaliação delta;
+# aceita pioras com probabilidade exp(delta / T) e reaquece a cada ciclo sem solução
+# (até limite_geracoes ciclos)
+class RecozimentoSimulado(MotorBusca):
+
+    nome = "Recozimento simulado"
+
+    def __init__(
+        self,
+        configuracao=None,
+        callbacks=None,
+        evento_parada=None,
+        resfriamento="geometrico",
+        temperatura_inicial=1.5,
+        temperatura_final=0.05,
+        passos_por_ciclo=200_000,
+    ):
+        if resfriamento not in RESFRIAMENTOS:
+            raise ValueError(f"Resfriamento desconhecido: {resfriamento!r}")
+        super().__init__(configuracao, callbacks, evento_parada)
+        self.resfriamento = resfriamento
+        self.temperatura_inicial = temperatura_inicial
+        self.temperatura_final = temperatura_final
+        self.passos_por_ciclo = passos_por_ciclo
+
+    def descricao(self) -> str:
+        return f"🔥 RECOZIMENTO SIMULADO: resfriamento {self.resfriamento}, T {self.temperatura_inicial} → {self.temperatura_final}"
+
+    def executar(self):
+        self._iniciar()
+        agenda = RESFRIAMENTOS[self.resfriamento]
+
+        atual = amostrar_reduzidos(1)[0]
+        mascara = self.avaliar(atual)
+        fitness_atual = contar_regras(mascara)
+        melhor_cromossomo, melhor_fitness = atual, fitness_atual
+        self._registrar_melhoria(0, melhor_fitness)
+        aceitas_piores = 0
+        ciclos = 0
+
+        motivo_parada = self._motivo_parada(melhor_fitness)
+        while motivo_parada is None:
+            if ciclos == self.configuracao.limite_geracoes:
+                motivo_parada = "limite_geracoes"
+                break
+            ciclos += 1
+            for passo in range(self.passos_por_ciclo):
+                # temperatura e orçamento são recalculados em blocos de passos
+                if passo % PASSO_VERIFICACAO_RECOZIMENTO == 0:
+                    motivo_parada = self._motivo_parada(melhor_fitness)
+                    if motivo_parada is not None:
+                        break
+                    temperatura = agenda(
+                        self.temperatura_inicial,
+                        self.temperatura_final,
+                        passo / self.passos_por_ciclo,
+                    )
+
+                caracteristica, casa1, casa2 = gerar_movimento()
+                vizinho = trocar(atual, caracteristica, casa1, casa2)
+                mascara_vizinho = avaliar_troca(vizinho, mascara, caracteristica)
+                fitness_vizinho = contar_regras(mascara_vizinho)
+                self.contar(1)
+
+                delta = fitness_vizinho - fitness_atual
+                if delta >= 0 or random.random() < math.exp(delta / temperatura):
+                    if delta < 0:
+                        aceitas_piores += 1
+                    atual, mascara, fitness_atual = (
+                        vizinho,
+                        mascara_vizinho,
+                        fitness_vizinho,
+                    )
+                    if fitness_atual > melhor_fitness:
+                        melhor_cromossomo, melhor_fitness = atual, fitness_atual
+                        self._registrar_melhoria(ciclos, melhor_fitness)
+                        if melhor_fitness == NUMERO_REGRAS:
+                            break
+            if motivo_parada is None:
+                motivo_parada = self._motivo_parada(melhor_fitness)
+
+        self.estatisticas = {"ciclos": ciclos, "aceitas_piores": aceitas_piores}
+        return self._finalizar(
+            melhor_cromossomo, melhor_fitness, ciclos, motivo_parada
+        )
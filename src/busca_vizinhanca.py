@@ -0,0 +1,160 @@
+"""
+Busca local sobre a vizinhança completa de trocas
+Um cromossomo tem só 5 atributos x 10 pares de casas = 50 vizinhos por troca; em vez
+de sortear vizinhos (busca_local), a vizinhança inteira é avaliada de uma vez
+(avaliar_vizinhanca) e a busca anda para o melhor vizinho, para o primeiro que melhora
+ou caminha por platôs de mesmo fitness.
+"""
+
+import random
+from typing import Callable, Optional
+
+from cromossomo import Cromossomo, trocar
+from einstein_rules import (
+    MOVIMENTOS_TROCA,
+    NUMERO_REGRAS,
+    avaliar,
+    avaliar_troca,
+    avaliar_vizinhanca,
+    contar_regras,
+)
+from orcamento import Orcamento
+
+# "amostrada" é a busca_local original (vizinhos sorteados por gerar_movimento)
+MODOS_BUSCA_LOCAL = ("amostrada", "melhor", "primeira", "plato")
+
+
+# contadores acumulados entre chamadas (avaliações de vizinhos e melhorias aceitas)
+def novas_estatisticas_busca() -> dict:
+    return {"buscas": 0, "avaliacoes": 0, "melhorias": 0}
+
+
+def avaliacoes_por_melhoria(estatisticas: dict) -> float:
+    if not estatisticas["melhorias"]:
+        return float("inf")
+    return estatisticas["avaliacoes"] / estatisticas["melhorias"]
+
+
+# best-improvement: avalia os 50 vizinhos e anda para o melhor enquanto houver melhora
+# (empates entre os melhores vizinhos são sorteados)
+def _busca_melhor(cromossomo, mascara, max_iteracoes, estatisticas, orcamento):
+    fitness_atual = contar_regras(mascara)
+    for _ in range(max_iteracoes):
+        if orcamento is not None and orcamento.esgotado():
+            break
+        mascaras = avaliar_vizinhanca(cromossomo, mascara)
+        estatisticas["avaliacoes"] += len(mascaras)
+
+        valores = [contar_regras(m) for m in mascaras]
+        melhor_valor = max(valores)
+        if melhor_valor <= fitness_atual:
+            break  # ótimo local
+
+        indice = random.choice([i for i, v in enumerate(valores) if v == melhor_valor])
+        cromossomo = trocar(cromossomo, *MOVIMENTOS_TROCA[indice])
+        mascara = mascaras[indice]
+        fitness_atual = melhor_valor
+        estatisticas["melhorias"] += 1
+        if fitness_atual == NUMERO_REGRAS:
+            break
+    return cromossomo
+
+
+# first-improvement: percorre os vizinhos em ordem aleatória com avaliação delta e
+# aceita a primeira troca que melhora
+def _busca_primeira(cromossomo, mascara, max_iteracoes, estatisticas, orcamento):
+    fitness_atual = contar_regras(mascara)
+    for _ in range(max_iteracoes):
+        if orcamento is not None and orcamento.esgotado():
+            break
+        melhorou = False
+        for indice in random.sample(
+            range(len(MOVIMENTOS_TROCA)), len(MOVIMENTOS_TROCA)
+        ):
+            atributo, casa1, casa2 = MOVIMENTOS_TROCA[indice]
+            vizinho = trocar(cromossomo, atributo, casa1, casa2)
+            mascara_vizinho = avaliar_troca(vizinho, mascara, atributo)
+            estatisticas["avaliacoes"] += 1
+            if contar_regras(mascara_vizinho) > fitness_atual:
+                cromossomo = vizinho
+                mascara = mascara_vizinho
+                fitness_atual = contar_regras(mascara)
+                estatisticas["melhorias"] += 1
+                melhorou = True
+                break
+        if not melhorou or fitness_atual == NUMERO_REGRAS:
+            break
+    return cromossomo
+
+
+# best-improvement que, sem vizinho melhor, caminha para um vizinho de mesmo fitness
+# ainda não visitado (platô) // devolve o melhor cromossomo visto
+def _busca_plato(cromossomo, mascara, max_iteracoes, estatisticas, orcamento):
+    fitness_atual = contar_regras(mascara)
+    melhor_cromossomo = cromossomo
+    melhor_fitness = fitness_atual
+    visitados = {cromossomo}
+
+    for _ in range(max_iteracoes):
+        if orcamento is not None and orcamento.esgotado():
+            break
+        mascaras = avaliar_vizinhanca(cromossomo, mascara)
+        estatisticas["avaliacoes"] += len(mascaras)
+
+        valores = [contar_regras(m) for m in mascaras]
+        melhor_valor = max(valores)
+        if melhor_valor < fitness_atual:
+            break  # nenhum vizinho mantém o fitness: fim do platô
+
+        candidatos = [
+            i
+            for i, v in enumerate(valores)
+            if v == melhor_valor
+            and (
+                melhor_valor > fitness_atual
+                or trocar(cromossomo, *MOVIMENTOS_TROCA[i]) not in visitados
+            )
+        ]
+        if not candidatos:
+            break  # platô esgotado
+
+        indice = random.choice(candidatos)
+        cromossomo = trocar(cromossomo, *MOVIMENTOS_TROCA[indice])
+        mascara = mascaras[indice]
+        fitness_atual = melhor_valor
+        visitados.add(cromossomo)
+
+        if fitness_atual > melhor_fitness:
+            melhor_cromossomo = cromossomo
+            melhor_fitness = fitness_atual
+            estatisticas["melhorias"] += 1
+            if melhor_fitness == NUMERO_REGRAS:
+                break
+    return melhor_cromossomo
+
+
+_BUSCAS = {
+    "melhor": _busca_melhor,
+    "primeira": _busca_primeira,
+    "plato": _busca_plato,
+}
+
+
+# busca local pela vizinhança completa no modo escolhido ("melhor", "primeira" ou
+# "plato") // max_iteracoes limita os movimentos, não as avaliações; com `orcamento`,
+# a busca para entre movimentos quando ele se esgota e devolve o melhor até ali //
+# funcao_avaliar dá a máscara do ponto de partida (ex.: CacheFitness.avaliar)
+def busca_vizinhanca(
+    cromossomo: Cromossomo,
+    modo: str = "melhor",
+    max_iteracoes: int = 50,
+    estatisticas: Optional[dict] = None,
+    orcamento: Optional[Orcamento] = None,
+    funcao_avaliar: Callable[[Cromossomo], int] = avaliar,
+) -> Cromossomo:
+    if estatisticas is None:
+        estatisticas = novas_estatisticas_busca()
+    estatisticas["buscas"] += 1
+    return _BUSCAS[modo](
+        cromossomo, funcao_avaliar(cromossomo), max_iteracoes, estatisticas, orcamento
+    )
@@ -0,0 +1,101 @@
+"""
+Cache LRU de avaliações de fitness
+Guarda a máscara de regras satisfeitas de cada cromossomo (chave inteira compacta),
+de modo que fitness e fitness_ponderado saem da mesma entrada.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, List, Tuple
+
+from avaliacao_lote import mascaras_lote, populacao_para_array
+from cromossomo import Cromossomo, empacotar
+from einstein_rules import CONTAGEM_REGRAS, avaliar, ponderado_mascara
+
+
+class CacheFitness:
+
+    # avaliador_lote: função array (N, 5, 5) -> máscaras usada nas falhas em lote
+    # (ex.: AvaliadorParalelo.mascaras)
+    def __init__(self, tamanho_maximo: int = 100_000, avaliador_lote=mascaras_lote):
+        self.tamanho_maximo = tamanho_maximo
+        self.avaliador_lote = avaliador_lote
+        self._mascaras = OrderedDict()
+
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def _guardar(self, chave: int, mascara: int) -> None:
+        self._mascaras[chave] = mascara
+        if len(self._mascaras) > self.tamanho_maximo:
+            self._mascaras.popitem(last=False)  # remove o menos usado recentemente
+            self.remocoes += 1
+
+    # máscara de regras satisfeitas, avaliando só em caso de falha
+    def avaliar(self, cromossomo: Cromossomo) -> int:
+        chave = empacotar(cromossomo)
+        mascara = self._mascaras.get(chave)
+        if mascara is not None:
+            self._mascaras.move_to_end(chave)
+            self.acertos += 1
+            return mascara
+
+        self.falhas += 1
+        mascara = avaliar(cromossomo)
+        self._guardar(chave, mascara)
+        return mascara
+
+    def fitness(self, cromossomo: Cromossomo) -> int:
+        return CONTAGEM_REGRAS[self.avaliar(cromossomo)]
+
+    def fitness_ponderado(self, cromossomo: Cromossomo) -> float:
+        return ponderado_mascara(self.avaliar(cromossomo))
+
+    # fitness da população inteira: consulta o cache e avalia as falhas em lote (NumPy)
+    def fitness_populacao(self, populacao: List[Cromossomo]) -> List[int]:
+        chaves = [empacotar(cromossomo) for cromossomo in populacao]
+        mascaras = []
+        faltantes = []
+
+        for posicao, chave in enumerate(chaves):
+            mascara = self._mascaras.get(chave)
+            if mascara is None:
+                faltantes.append(posicao)
+            else:
+                self._mascaras.move_to_end(chave)
+            mascaras.append(mascara)
+
+        self.acertos += len(populacao) - len(faltantes)
+        self.falhas += len(faltantes)
+
+        if faltantes:
+            novas = self.avaliador_lote(
+                populacao_para_array([populacao[posicao] for posicao in faltantes])
+            ).tolist()
+            for posicao, mascara in zip(faltantes, novas):
+                mascaras[posicao] = mascara
+                self._guardar(chaves[posicao], mascara)
+
+        return [CONTAGEM_REGRAS[mascara] for mascara in mascaras]
+
+    # entradas (chave, máscara) da menos para a mais recentemente usada, na ordem em
+    # que restaurar() as recoloca (pontos de controle)
+    def entradas(self) -> List[Tuple[int, int]]:
+        return list(self._mascaras.items())
+
+    # com tamanho_maximo menor que o gravado, as menos usadas saem como remoções
+    def restaurar(self, entradas: Iterable[Tuple[int, int]]) -> None:
+        self._mascaras = OrderedDict(entradas)
+        while len(self._mascaras) > self.tamanho_maximo:
+            self._mascaras.popitem(last=False)
+            self.remocoes += 1
+
+    def estatisticas(self) -> dict:
+        consultas = self.acertos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "remocoes": self.remocoes,
+            "tamanho": len(self._mascaras),
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+        }
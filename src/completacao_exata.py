@@ -0,0 +1,169 @@
+"""
+Completação exata de um cromossomo quase resolvido (AG -> busca exaustiva)
+As colunas envolvidas nas regras que faltam (e colunas inválidas, com valores repetidos)
+são liberadas; as demais ficam congeladas e todas as combinações das colunas livres
+(no máximo 120^k, menos dentro dos domínios reduzidos) são avaliadas em lote por
+tabelas. Se o conjunto mínimo não resolver, colunas congeladas vão sendo liberadas até
+o limite de combinações avaliadas. O limite é uma contagem, não um prazo, então uma
+execução semeada dá o mesmo resultado em qualquer máquina. Cada combinação é uma
+avaliação de fitness: com um orçamento de avaliações, a enumeração não passa do que
+resta dele.
+"""
+
+import time
+from itertools import combinations
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from avaliacao_lote import fitness_genomas_lote
+from cromossomo import Cromossomo, NUMERO_ATRIBUTOS
+from dominios_reduzidos import DOMINIOS_REDUZIDOS
+from orcamento import Orcamento
+from einstein_rules import (
+    ATRIBUTOS_REGRAS,
+    NUMERO_REGRAS,
+    avaliar,
+    contar_regras,
+    regras_faltantes_mascara,
+)
+from tabelas_permutacao import RANK_COLUNA, desranquear
+
+TAMANHO_LOTE_COMPLETACAO = 1 << 16
+# combinações avaliadas por tentativa (~1 s a ~9 milhões de combinações/s)
+LIMITE_COMBINACOES_COMPLETACAO = 1 << 23
+
+
+# colunas a liberar: atributos das regras faltantes e colunas que não são permutações
+def colunas_livres(cromossomo: Cromossomo) -> List[int]:
+    livres = set()
+    for regra in regras_faltantes_mascara(avaliar(cromossomo)):
+        livres.update(ATRIBUTOS_REGRAS[regra - 1])
+    for atributo in range(NUMERO_ATRIBUTOS):
+        if cromossomo[atributo::NUMERO_ATRIBUTOS] not in RANK_COLUNA:
+            livres.add(atributo)
+    return sorted(livres)
+
+
+def _combinacoes(livres: Sequence[int]) -> int:
+    return int(np.prod([len(DOMINIOS_REDUZIDOS[atributo]) for atributo in livres]))
+
+
+# conjuntos de colunas livres em ordem de custo: o conjunto mínimo e, se ele não bastar,
+# os superconjuntos com mais colunas (as congeladas também podem estar erradas)
+def conjuntos_livres(cromossomo: Cromossomo) -> List[Tuple[int, ...]]:
+    minimo = set(colunas_livres(cromossomo))
+    congeladas = [a for a in range(NUMERO_ATRIBUTOS) if a not in minimo]
+    conjuntos = [
+        tuple(sorted(minimo | set(extras)))
+        for quantidade in range(len(congeladas) + 1)
+        for extras in combinations(congeladas, quantidade)
+    ]
+    # liberar todas as colunas deixa de ser completação (é resolver do zero), a menos
+    # que o próprio conjunto mínimo já seja esse
+    conjuntos = [
+        livres
+        for livres in conjuntos
+        if livres and (len(livres) < NUMERO_ATRIBUTOS or not congeladas)
+    ]
+    return sorted(conjuntos, key=_combinacoes)
+
+
+# avalia em lote as combinações das colunas livres sobre o genoma base, no máximo
+# `limite` delas // retorna o melhor genoma, seu fitness, quantas combinações foram
+# avaliadas e se a enumeração terminou (para no primeiro 15/15, no limite ou com o
+# orçamento esgotado)
+def _enumerar(
+    genoma_base: np.ndarray,
+    livres: Sequence[int],
+    limite: int,
+    orcamento: Optional[Orcamento] = None,
+) -> Tuple[np.ndarray, int, int, bool]:
+    dominios = [DOMINIOS_REDUZIDOS[atributo] for atributo in livres]
+    combinacoes = _combinacoes(livres)
+    fim = min(combinacoes, limite)
+
+    melhor_genoma = genoma_base
+    melhor_fitness = -1
+    avaliadas = 0
+
+    for primeiro in range(0, fim, TAMANHO_LOTE_COMPLETACAO):
+        if orcamento is not None and orcamento.esgotado():
+            break
+
+        # índice da combinação -> rank de cada coluna livre (a última varia mais rápido)
+        indices = np.arange(primeiro, min(primeiro + TAMANHO_LOTE_COMPLETACAO, fim))
+        genomas = np.tile(genoma_base, (len(indices), 1))
+        for atributo, dominio in zip(reversed(livres), reversed(dominios)):
+            indices, posicao = np.divmod(indices, len(dominio))
+            genomas[:, atributo] = dominio[posicao]
+
+        valores = fitness_genomas_lote(genomas)
+        avaliadas += len(genomas)
+
+        melhor_indice = int(valores.argmax())
+        if valores[melhor_indice] > melhor_fitness:
+            melhor_fitness = int(valores[melhor_indice])
+            melhor_genoma = genomas[melhor_indice]
+        if melhor_fitness == NUMERO_REGRAS:
+            break
+
+    return melhor_genoma, melhor_fitness, avaliadas, avaliadas == combinacoes
+
+
+# completa o cromossomo enumerando conjuntos crescentes de colunas livres até
+# limite_combinacoes avaliadas // retorna a melhor completação, seu fitness e as
+# estatísticas; `orcamento` (Orcamento da execução do AG) interrompe a enumeração
+# entre lotes e, com limite_avaliacoes, reduz o limite às avaliações que restam nele
+# (quem chama soma estatisticas["avaliadas"] às suas avaliações)
+def completar_exato(
+    cromossomo: Cromossomo,
+    limite_combinacoes: int = LIMITE_COMBINACOES_COMPLETACAO,
+    orcamento: Optional[Orcamento] = None,
+) -> Tuple[Cromossomo, int, dict]:
+    inicio = time.perf_counter()
+    fitness_inicial = contar_regras(avaliar(cromossomo))
+
+    genoma_base = np.array(
+        [
+            RANK_COLUNA.get(cromossomo[atributo::NUMERO_ATRIBUTOS], 0)
+            for atributo in range(NUMERO_ATRIBUTOS)
+        ],
+        dtype=np.int64,
+    )
+
+    if orcamento is not None and orcamento.limite_avaliacoes is not None:
+        limite_combinacoes = min(
+            limite_combinacoes,
+            orcamento.limite_avaliacoes - orcamento.contar_avaliacoes(),
+        )
+
+    melhor_cromossomo = cromossomo
+    melhor_fitness = fitness_inicial
+    estatisticas = {
+        "fitness_inicial": fitness_inicial,
+        "conjuntos_enumerados": [],
+        "colunas_livres": [],
+        "combinacoes": 0,
+        "avaliadas": 0,
+    }
+
+    for livres in conjuntos_livres(cromossomo):
+        restantes = limite_combinacoes - estatisticas["avaliadas"]
+        if restantes <= 0 or melhor_fitness == NUMERO_REGRAS:
+            break
+        genoma, valor, avaliadas, completa = _enumerar(
+            genoma_base, livres, restantes, orcamento
+        )
+
+        estatisticas["colunas_livres"] = list(livres)
+        estatisticas["combinacoes"] += _combinacoes(livres)
+        estatisticas["avaliadas"] += avaliadas
+        if completa:
+            estatisticas["conjuntos_enumerados"].append(livres)
+        if valor > melhor_fitness:
+            melhor_fitness = valor
+            melhor_cromossomo = desranquear(genoma.tolist())
+
+    estatisticas["tempo"] = time.perf_counter() - inicio
+    return melhor_cromossomo, melhor_fitness, estatisticas
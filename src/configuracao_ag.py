@@ -0,0 +1,148 @@
+"""
+Configuração e resultado das execuções
+ConfiguracaoAG (parâmetros de uma execução, com os padrões abaixo), ResultadoAG (o que
+uma execução devolve) e InstantaneoGeracao (o que o gerador evoluir() entrega a cada
+geração). Ficam fora de main.py para que os motores e o modelo de ilhas os importem
+sem depender do ponto de entrada.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from avaliacao_paralela import LIMIAR_SERIAL
+from busca_vizinhanca import MODOS_BUSCA_LOCAL
+from completacao_exata import LIMITE_COMBINACOES_COMPLETACAO
+from cromossomo import Cromossomo
+from einstein_rules import BACKENDS_FITNESS
+from operadores_permutacao import OPERADORES_COLUNA
+
+# CONFIG DO ALGORITMO GENÉTICO
+TAMANHO_POPULACAO_BASE = 1800
+TAXA_CRUZAMENTO_BASE = 0.85
+TAXA_MUTACAO_BASE = 0.15
+TAMANHO_MAXIMO_POPULACAO = 5000
+LIMITE_GERACOES = 1000
+TEMPO_MAXIMO = None  # segundos (None: só o limite de gerações)
+LIMITE_AVALIACOES = None  # avaliações de fitness (None: sem limite)
+FITNESS_ALVO = None  # para ao atingir este fitness (None: só na solução, 15)
+BACKEND_FITNESS = "bitboard"  # "regras" (funções r1..r15) ou "bitboard"
+USAR_CACHE_FITNESS = True  # cache LRU das avaliações (desligar para medir o efeito)
+TAMANHO_CACHE_FITNESS = 200_000
+# processos para o fitness em lote da população (None = sempre no processo principal)
+# e tamanho de população a partir do qual a avaliação é dividida entre eles
+TRABALHADORES_FITNESS = None
+LIMIAR_FITNESS_PARALELO = LIMIAR_SERIAL
+# "classico" (corte por casa + reparo) ou um operador por coluna: "pmx", "ox", "cx",
+# "uniforme_colunas" (filhos válidos sem reparo)
+OPERADOR_CRUZAMENTO = "classico"
+# busca local do refinamento da elite: "amostrada" (vizinhos sorteados, o padrão) ou
+# pela vizinhança completa de trocas: "melhor", "primeira" ou "plato" (--busca-local)
+MODO_BUSCA_LOCAL = "amostrada"
+
+# completação exata do melhor indivíduo a partir deste fitness (None desliga)
+LIMIAR_COMPLETACAO_EXATA = 14
+# combinações avaliadas por tentativa (contagem, não prazo: execuções semeadas repetíveis)
+LIMITE_COMBINACOES_COMPLETACAO_EXATA = LIMITE_COMBINACOES_COMPLETACAO
+
+# cronômetros por fase da geração (perf_counter_ns), impressos no fim da execução
+PERFIL_FASES = False
+
+# ponto de controle binário do estado completo, regravado no início de uma geração a
+# cada INTERVALO_PONTO_CONTROLE segundos (None: sem pontos de controle)
+CAMINHO_PONTO_CONTROLE = None
+INTERVALO_PONTO_CONTROLE = 5.0
+
+
+# configuração de uma execução do AG (os padrões são as constantes acima)
+@dataclass(frozen=True)
+class ConfiguracaoAG:
+    tamanho_populacao: int = TAMANHO_POPULACAO_BASE
+    tamanho_maximo_populacao: int = TAMANHO_MAXIMO_POPULACAO
+    taxa_cruzamento: float = TAXA_CRUZAMENTO_BASE
+    taxa_mutacao: float = TAXA_MUTACAO_BASE
+    limite_geracoes: int = LIMITE_GERACOES
+    tempo_maximo: Optional[float] = TEMPO_MAXIMO
+    limite_avaliacoes: Optional[int] = LIMITE_AVALIACOES
+    fitness_alvo: Optional[int] = FITNESS_ALVO
+    operador_cruzamento: str = OPERADOR_CRUZAMENTO
+    modo_busca_local: str = MODO_BUSCA_LOCAL
+    backend_fitness: str = BACKEND_FITNESS
+    usar_cache_fitness: bool = USAR_CACHE_FITNESS
+    tamanho_cache_fitness: int = TAMANHO_CACHE_FITNESS
+    trabalhadores_fitness: Optional[int] = TRABALHADORES_FITNESS
+    limiar_fitness_paralelo: int = LIMIAR_FITNESS_PARALELO
+    limiar_completacao_exata: Optional[int] = LIMIAR_COMPLETACAO_EXATA
+    limite_combinacoes_completacao: int = LIMITE_COMBINACOES_COMPLETACAO_EXATA
+    perfil_fases: bool = PERFIL_FASES
+    caminho_ponto_controle: Optional[str] = CAMINHO_PONTO_CONTROLE
+    intervalo_ponto_controle: float = INTERVALO_PONTO_CONTROLE
+
+    def __post_init__(self):
+        if self.operador_cruzamento != "classico" and (
+            self.operador_cruzamento not in OPERADORES_COLUNA
+        ):
+            raise ValueError(
+                f"Operador de cruzamento desconhecido: {self.operador_cruzamento!r}"
+            )
+        if self.modo_busca_local not in MODOS_BUSCA_LOCAL:
+            raise ValueError(
+                f"Modo de busca local desconhecido: {self.modo_busca_local!r}"
+            )
+        if self.backend_fitness not in BACKENDS_FITNESS:
+            raise ValueError(
+                f"Backend de fitness desconhecido: {self.backend_fitness!r}"
+            )
+        if not 0 < self.tamanho_populacao <= self.tamanho_maximo_populacao:
+            raise ValueError(
+                "O tamanho da população deve estar entre 1 e tamanho_maximo_populacao"
+            )
+        if not (0 <= self.taxa_cruzamento <= 1 and 0 <= self.taxa_mutacao <= 1):
+            raise ValueError("As taxas de cruzamento e mutação devem estar em [0, 1]")
+        if self.limite_geracoes < 1:
+            raise ValueError("O limite de gerações deve ser positivo")
+        if self.tempo_maximo is not None and self.tempo_maximo <= 0:
+            raise ValueError("O tempo máximo deve ser positivo")
+        if self.limite_avaliacoes is not None and self.limite_avaliacoes < 1:
+            raise ValueError("O limite de avaliações deve ser positivo")
+        if self.fitness_alvo is not None and not 1 <= self.fitness_alvo <= 15:
+            raise ValueError("O fitness alvo deve estar entre 1 e 15")
+        if self.limite_combinacoes_completacao < 1:
+            raise ValueError("O limite de combinações da completação deve ser positivo")
+        if self.intervalo_ponto_controle < 0:
+            raise ValueError(
+                "O intervalo entre pontos de controle não pode ser negativo"
+            )
+
+
+# resultado de uma execução do AG // motivo_parada: "solucao", "fitness_alvo",
+# "limite_geracoes", "tempo_maximo", "limite_avaliacoes" ou "interrompida"; marcos: fitness -> (geração, segundos) da primeira
+# vez em que o melhor global o atingiu
+@dataclass
+class ResultadoAG:
+    cromossomo: Optional[Cromossomo]
+    fitness: int
+    geracoes: int
+    avaliacoes: int
+    consultas_fitness: Optional[int]
+    tempo_total: float
+    tempo_ate_14: Optional[float]
+    tempo_ate_15: Optional[float]
+    marcos: Dict[int, Tuple[int, float]]
+    motivo_parada: str
+    semente: Optional[int] = None
+
+
+# estatísticas de uma geração entregues pelo gerador evoluir() // histograma: quantos
+# indivíduos há em cada fitness 0..15; diversidade: % de cromossomos distintos; tempo:
+# segundos desde o início da execução; avaliacoes: acumuladas até esta geração
+@dataclass(frozen=True)
+class InstantaneoGeracao:
+    geracao: int
+    melhor_fitness: int
+    melhor_cromossomo: Cromossomo
+    fitness_media: float
+    histograma: Tuple[int, ...]
+    diversidade: float
+    tamanho_populacao: int
+    tempo: float
+    avaliacoes: int
@@ -0,0 +1,79 @@
+"""
+Representação compacta dos cromossomos do Desafio de Einstein
+Cada cromossomo é um objeto bytes de 25 posições (5 casas x 5 atributos),
+onde cada valor é o índice do atributo na respectiva lista de nomes.
+"""
+
+from typing import List, Sequence, Tuple
+
+CORES = ["Vermelha", "Verde", "Branca", "Amarela", "Azul"]
+NACIONALIDADES = ["Inglês", "Sueco", "Dinamarquês", "Norueguês", "Alemão"]
+BEBIDAS = ["Chá", "Café", "Leite", "Cerveja", "Água"]
+CIGARROS = ["Pall Mall", "Dunhill", "Blends", "BlueMaster", "Prince"]
+ANIMAIS = ["Cachorros", "Pássaros", "Gatos", "Cavalos", "Peixes"]
+
+VALORES_ATRIBUTOS = [CORES, NACIONALIDADES, BEBIDAS, CIGARROS, ANIMAIS]
+
+# índice de cada atributo dentro da casa
+COR, NACIONALIDADE, BEBIDA, CIGARRO, ANIMAL = range(5)
+
+NUMERO_CASAS = 5
+NUMERO_ATRIBUTOS = 5
+TAMANHO_CROMOSSOMO = NUMERO_CASAS * NUMERO_ATRIBUTOS
+
+# códigos inteiros de cada valor (índice na lista do atributo)
+VERMELHA, VERDE, BRANCA, AMARELA, AZUL = range(5)
+INGLES, SUECO, DINAMARQUES, NORUEGUES, ALEMAO = range(5)
+CHA, CAFE, LEITE, CERVEJA, AGUA = range(5)
+PALL_MALL, DUNHILL, BLENDS, BLUEMASTER, PRINCE = range(5)
+CACHORROS, PASSAROS, GATOS, CAVALOS, PEIXES = range(5)
+
+Cromossomo = bytes
+
+
+# posição do gene (casa, atributo) dentro do cromossomo
+def gene(casa: int, atributo: int) -> int:
+    return casa * NUMERO_ATRIBUTOS + atributo
+
+
+# converte um cromossomo de tuplas de nomes para a forma compacta
+def codificar(casas: Sequence[Tuple[str, str, str, str, str]]) -> Cromossomo:
+    return bytes(
+        VALORES_ATRIBUTOS[atributo].index(valor)
+        for casa in casas
+        for atributo, valor in enumerate(casa)
+    )
+
+
+# converte um cromossomo compacto de volta para tuplas de nomes (apenas para exibição)
+def decodificar(cromossomo: Cromossomo) -> List[Tuple[str, str, str, str, str]]:
+    return [
+        tuple(
+            VALORES_ATRIBUTOS[atributo][cromossomo[inicio + atributo]]
+            for atributo in range(NUMERO_ATRIBUTOS)
+        )
+        for inicio in range(0, TAMANHO_CROMOSSOMO, NUMERO_ATRIBUTOS)
+    ]
+
+
+# coluna de um atributo: valor do atributo em cada uma das 5 casas
+def coluna(cromossomo: Cromossomo, atributo: int) -> bytes:
+    return cromossomo[atributo::NUMERO_ATRIBUTOS]
+
+
+# troca o valor de um atributo entre duas casas, retornando um novo cromossomo
+def trocar(cromossomo: Cromossomo, atributo: int, casa1: int, casa2: int) -> Cromossomo:
+    novo = bytearray(cromossomo)
+    gene1 = casa1 * NUMERO_ATRIBUTOS + atributo
+    gene2 = casa2 * NUMERO_ATRIBUTOS + atributo
+    novo[gene1], novo[gene2] = novo[gene2], novo[gene1]
+    return bytes(novo)
+
+
+# chave inteira compacta do cromossomo (25 genes de 8 bits), usada em caches e conjuntos
+def empacotar(cromossomo: Cromossomo) -> int:
+    return int.from_bytes(cromossomo, "little")
+
+
+def desempacotar(chave: int) -> Cromossomo:
+    return chave.to_bytes(TAMANHO_CROMOSSOMO, "little")
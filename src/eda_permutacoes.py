@@ -0,0 +1,178 @@
+"""
+Algoritmo de estimação de distribuição (EDA) para permutações, no estilo PBIL/UMDA
+Cada atributo tem uma matriz de probabilidades 5 x 5 (casa x valor). Populações
+inteiras de cromossomos válidos são sorteadas em lote dessas matrizes e as matrizes
+são atualizadas a partir dos melhores indivíduos pelo fitness ponderado: amostragem e
+atualização são só operações de matrizes (NumPy). Como MotorBusca, recebe a
+ConfiguracaoAG (limites de tempo, avaliações, gerações e fitness alvo), conta cada
+indivíduo sorteado como uma avaliação, avisa os callbacks e devolve um ResultadoAG.
+"""
+
+import random
+
+import numpy as np
+
+from avaliacao_lote import avaliar_lote
+from cromossomo import NUMERO_ATRIBUTOS, NUMERO_CASAS
+from dominios_reduzidos import DOMINIOS_REDUZIDOS, PERMUTACOES_ARRAY
+from motor_busca import MotorBusca
+
+
+# matrizes iniciais: frequência de cada valor em cada casa dentro dos domínios
+# reduzidos (ex.: Norueguês na casa 1 com probabilidade 1)
+def matrizes_iniciais() -> np.ndarray:
+    matrizes = np.zeros((NUMERO_ATRIBUTOS, NUMERO_CASAS, 5))
+    casas = np.arange(NUMERO_CASAS)
+    for atributo, dominio in enumerate(DOMINIOS_REDUZIDOS):
+        for permutacao in PERMUTACOES_ARRAY[dominio]:
+            matrizes[atributo, casas, permutacao] += 1
+        matrizes[atributo] /= len(dominio)
+    return matrizes
+
+
+# matrizes de reinício: as iniciais com ruído multiplicativo (gama) em cada célula,
+# para que cada reinício explore uma região diferente em vez de reconvergir ao mesmo
+# ótimo local
+def matrizes_perturbadas(
+    gerador: np.random.Generator, concentracao: float = 1.0
+) -> np.ndarray:
+    matrizes = matrizes_iniciais() * gerador.gamma(
+        concentracao, size=(NUMERO_ATRIBUTOS, NUMERO_CASAS, 5)
+    )
+    totais = matrizes.sum(axis=2, keepdims=True)
+    return matrizes / np.where(totais > 0, totais, 1)
+
+
+# sorteia `quantidade` cromossomos válidos: casa a casa (em ordem aleatória), cada
+# valor é escolhido entre os ainda livres com a probabilidade da matriz renormalizada
+# (sem reposição: só valores livres têm peso, inclusive quando o arredondamento leva o
+# sorteio ao total acumulado) // retorna o array (N, casa, atributo) no layout do
+# cromossomo
+def amostrar_matrizes(
+    matrizes: np.ndarray, quantidade: int, gerador: np.random.Generator
+) -> np.ndarray:
+    genes = np.empty((quantidade, NUMERO_CASAS, NUMERO_ATRIBUTOS), dtype=np.uint8)
+    linhas = np.arange(quantidade)
+
+    for atributo in range(NUMERO_ATRIBUTOS):
+        livres = np.ones((quantidade, 5), dtype=bool)
+        for casa in gerador.permutation(NUMERO_CASAS):
+            pesos = matrizes[atributo, casa] * livres
+            totais = pesos.sum(axis=1, keepdims=True)
+            # linhas sem massa de probabilidade nos valores livres: sorteio uniforme
+            pesos = np.where(totais > 0, pesos, livres)
+            acumulado = np.cumsum(pesos, axis=1)
+            sorteio = gerador.random((quantidade, 1)) * acumulado[:, -1:]
+            # sorteio == total (arredondamento): fica com o último valor de peso positivo
+            ultimo_livre = 4 - np.argmax(pesos[:, ::-1] > 0, axis=1)
+            valores = np.minimum((acumulado <= sorteio).sum(axis=1), ultimo_livre)
+            genes[:, casa, atributo] = valores
+            livres[linhas, valores] = False
+
+    return genes
+
+
+# frequência casa x valor de cada atributo no conjunto selecionado
+def frequencias(genes: np.ndarray) -> np.ndarray:
+    uns = np.zeros((NUMERO_ATRIBUTOS, NUMERO_CASAS, 5))
+    casas = np.arange(NUMERO_CASAS)
+    for atributo in range(NUMERO_ATRIBUTOS):
+        np.add.at(uns[atributo], (casas[None, :], genes[:, :, atributo]), 1)
+    return uns / len(genes)
+
+
+# max_geracoes (padrão: limite_geracoes da configuração)
+class AlgoritmoEDA(MotorBusca):
+
+    nome = "EDA"
+
+    def __init__(
+        self,
+        configuracao=None,
+        callbacks=None,
+        evento_parada=None,
+        tamanho_populacao=500,
+        fracao_selecionada=0.1,
+        taxa_aprendizado=0.3,
+        probabilidade_minima=0.01,
+        geracoes_para_reinicio=15,
+        max_geracoes=None,
+    ):
+        super().__init__(configuracao, callbacks, evento_parada)
+        self.tamanho_populacao = tamanho_populacao
+        self.numero_selecionados = max(2, int(tamanho_populacao * fracao_selecionada))
+        self.taxa_aprendizado = taxa_aprendizado
+        self.probabilidade_minima = probabilidade_minima
+        self.geracoes_para_reinicio = geracoes_para_reinicio
+        if max_geracoes is None:
+            max_geracoes = self.configuracao.limite_geracoes
+        self.max_geracoes = max_geracoes
+
+    def descricao(self) -> str:
+        return f"📐 EDA: matrizes casa x valor por atributo | população {self.tamanho_populacao} | seleção {self.numero_selecionados}"
+
+    # sem nenhuma geração executada (max_geracoes=0 ou orçamento já esgotado) o resultado
+    # fica sem cromossomo e com fitness 0, como no AG
+    def executar(self):
+        self._iniciar()
+        gerador = np.random.default_rng(random.getrandbits(64))
+
+        matrizes = matrizes_iniciais()
+        melhor_genes = None
+        melhor_fitness = 0
+        melhor_ponderado = -1.0
+        ultima_melhoria = 0
+        reinicios = 0
+        geracao = 0
+        motivo_parada = "limite_geracoes"
+
+        while geracao < self.max_geracoes:
+            motivo = self._motivo_parada(melhor_fitness)
+            if motivo is not None:
+                motivo_parada = motivo
+                break
+            geracao += 1
+
+            genes = amostrar_matrizes(matrizes, self.tamanho_populacao, gerador)
+            _, contagem, ponderado = avaliar_lote(genes)
+            self.contar(len(genes))
+
+            # seleção truncada pelo fitness ponderado
+            selecionados = np.argpartition(-ponderado, self.numero_selecionados - 1)[
+                : self.numero_selecionados
+            ]
+            indice = selecionados[np.argmax(ponderado[selecionados])]
+            if (contagem[indice], ponderado[indice]) > (
+                melhor_fitness,
+                melhor_ponderado,
+            ):
+                if contagem[indice] > melhor_fitness or melhor_genes is None:
+                    self._registrar_melhoria(geracao, int(contagem[indice]))
+                melhor_genes = genes[indice].copy()
+                melhor_fitness = int(contagem[indice])
+                melhor_ponderado = float(ponderado[indice])
+                ultima_melhoria = geracao
+
+            # PBIL: desloca as matrizes na direção das frequências dos selecionados e
+            # mantém um piso de probabilidade para não fixar valores cedo demais
+            alvo = frequencias(genes[selecionados])
+            matrizes = (1 - self.taxa_aprendizado) * matrizes + (
+                self.taxa_aprendizado * alvo
+            )
+            matrizes = np.maximum(matrizes, self.probabilidade_minima)
+            matrizes /= matrizes.sum(axis=2, keepdims=True)
+
+            # distribuição estagnada: recomeça de matrizes iniciais perturbadas
+            if geracao - ultima_melhoria > self.geracoes_para_reinicio:
+                matrizes = matrizes_perturbadas(gerador)
+                ultima_melhoria = geracao
+                reinicios += 1
+        else:
+            # a última geração pode ter achado a solução ou o fitness alvo
+            motivo_parada = self._motivo_parada(melhor_fitness) or motivo_parada
+
+        melhor_cromossomo = melhor_genes.tobytes() if melhor_genes is not None else None
+        self.estatisticas = {"geracoes": geracao, "reinicios": reinicios}
+        return self._finalizar(
+            melhor_cromossomo, melhor_fitness, geracao, motivo_parada
+        )
@@ -1,94 +1,178 @@
 """
 Regras do Desafio de Einstein
 Este módulo contém as 15 regras do desafio e funções auxiliares.
+As regras operam sobre o cromossomo compacto (bytes) definido em cromossomo.py.
 """
 
+from cromossomo import (
+    COR,
+    NACIONALIDADE,
+    BEBIDA,
+    CIGARRO,
+    ANIMAL,
+    VERMELHA,
+    VERDE,
+    BRANCA,
+    AMARELA,
+    AZUL,
+    INGLES,
+    SUECO,
+    DINAMARQUES,
+    NORUEGUES,
+    ALEMAO,
+    CHA,
+    CAFE,
+    LEITE,
+    CERVEJA,
+    AGUA,
+    PALL_MALL,
+    DUNHILL,
+    BLENDS,
+    BLUEMASTER,
+    PRINCE,
+    CACHORROS,
+    PASSAROS,
+    GATOS,
+    CAVALOS,
+)
+from regras_bitboard import avaliar_bitboard, compilar_regras, mascaras_posicao
+
+# início de cada casa dentro do cromossomo compacto
+CASAS = range(0, 25, 5)
+
 
 # encontra os vizinhos de uma casa
 def vizinhos(i: int) -> list[int]:
     return [j for j in (i - 1, i + 1) if 0 <= j < 5]
 
 
+# vizinhos já convertidos para o início de cada casa no cromossomo
+VIZINHOS_GENE = [[j * 5 for j in vizinhos(i)] for i in range(5)]
+
+
 def r1(h):  # O Norueguês vive na primeira casa
-    return h[0][1] == "Norueguês"
+    return h[NACIONALIDADE] == NORUEGUES
 
 
 def r2(h):  # O Inglês vive na casa Vermelha
-    return any(cor == "Vermelha" and nat == "Inglês" for cor, nat, *_ in h)
+    return any(h[k + COR] == VERMELHA and h[k + NACIONALIDADE] == INGLES for k in CASAS)
 
 
 def r3(h):  # O Sueco tem Cachorros
-    return any(nat == "Sueco" and animal == "Cachorros" for _, nat, _, _, animal in h)
+    return any(
+        h[k + NACIONALIDADE] == SUECO and h[k + ANIMAL] == CACHORROS for k in CASAS
+    )
 
 
 def r4(h):  # O Dinamarquês bebe Chá
-    return any(nat == "Dinamarquês" and bebida == "Chá" for _, nat, bebida, _, _ in h)
+    return any(
+        h[k + NACIONALIDADE] == DINAMARQUES and h[k + BEBIDA] == CHA for k in CASAS
+    )
 
 
 def r5(h):  # A casa Verde fica do lado esquerdo da casa Branca
-    idx_verde = next((i for i, (cor, *_) in enumerate(h) if cor == "Verde"), -1)
-    idx_branca = next((i for i, (cor, *_) in enumerate(h) if cor == "Branca"), -1)
-    return idx_verde != -1 and idx_branca == idx_verde + 1
+    cores = h[COR::5]
+    idx_verde = cores.find(VERDE)
+    return idx_verde != -1 and cores.find(BRANCA) == idx_verde + 1
 
 
 def r6(h):  # O homem que vive na casa Verde bebe Café
-    return any(cor == "Verde" and bebida == "Café" for cor, _, bebida, _, _ in h)
+    return any(h[k + COR] == VERDE and h[k + BEBIDA] == CAFE for k in CASAS)
 
 
 def r7(h):  # O homem que fuma Pall Mall cria Pássaros
-    return any(
-        cigarro == "Pall Mall" and animal == "Pássaros"
-        for _, _, _, cigarro, animal in h
-    )
+    return any(h[k + CIGARRO] == PALL_MALL and h[k + ANIMAL] == PASSAROS for k in CASAS)
 
 
 def r8(h):  # O homem que vive na casa Amarela fuma Dunhill
-    return any(cor == "Amarela" and cigarro == "Dunhill" for cor, _, _, cigarro, _ in h)
+    return any(h[k + COR] == AMARELA and h[k + CIGARRO] == DUNHILL for k in CASAS)
 
 
 def r9(h):  # O homem que vive na casa do meio bebe Leite
-    return h[2][2] == "Leite"
+    return h[10 + BEBIDA] == LEITE
 
 
 def r10(h):  # O homem que fuma Blends vive ao lado do que tem Gatos
-    for i, (_, _, _, cigarro, _) in enumerate(h):
-        if cigarro == "Blends" and any(h[j][4] == "Gatos" for j in vizinhos(i)):
+    for i, k in enumerate(CASAS):
+        if h[k + CIGARRO] == BLENDS and any(
+            h[j + ANIMAL] == GATOS for j in VIZINHOS_GENE[i]
+        ):
             return True
     return False
 
 
 def r11(h):  # O homem que cria Cavalos vive ao lado do que fuma Dunhill
-    for i, (_, _, _, _, animal) in enumerate(h):
-        if animal == "Cavalos" and any(h[j][3] == "Dunhill" for j in vizinhos(i)):
+    for i, k in enumerate(CASAS):
+        if h[k + ANIMAL] == CAVALOS and any(
+            h[j + CIGARRO] == DUNHILL for j in VIZINHOS_GENE[i]
+        ):
             return True
     return False
 
 
 def r12(h):  # O homem que fuma BlueMaster bebe Cerveja
-    return any(
-        cigarro == "BlueMaster" and bebida == "Cerveja"
-        for _, _, bebida, cigarro, _ in h
-    )
+    return any(h[k + CIGARRO] == BLUEMASTER and h[k + BEBIDA] == CERVEJA for k in CASAS)
 
 
 def r13(h):  # O Alemão fuma Prince
-    return any(nat == "Alemão" and cigarro == "Prince" for _, nat, _, cigarro, _ in h)
+    return any(
+        h[k + NACIONALIDADE] == ALEMAO and h[k + CIGARRO] == PRINCE for k in CASAS
+    )
 
 
 def r14(h):  # O Norueguês vive ao lado da casa Azul
-    idx_nor = next((i for i, (_, nat, *_) in enumerate(h) if nat == "Norueguês"), -1)
-    return idx_nor != -1 and any(h[j][0] == "Azul" for j in vizinhos(idx_nor))
+    idx_nor = h[NACIONALIDADE::5].find(NORUEGUES)
+    return idx_nor != -1 and any(h[j + COR] == AZUL for j in VIZINHOS_GENE[idx_nor])
 
 
 def r15(h):  # O homem que fuma Blends é vizinho do que bebe Água
-    for i, (_, _, _, cigarro, _) in enumerate(h):
-        if cigarro == "Blends" and any(h[j][2] == "Água" for j in vizinhos(i)):
+    for i, k in enumerate(CASAS):
+        if h[k + CIGARRO] == BLENDS and any(
+            h[j + BEBIDA] == AGUA for j in VIZINHOS_GENE[i]
+        ):
             return True
     return False
 
 
 REGRAS = [r1, r2, r3, r4, r5, r6, r7, r8, r9, r10, r11, r12, r13, r14, r15]
 
+# descrição declarativa das mesmas 15 regras, usada pelos avaliadores alternativos
+# formato: (tipo, atributo_a, valor_a, atributo_b, valor_b)
+# "casa": valor_a do atributo_a está na casa valor_b (atributo_b = None)
+# "mesma_casa": alguma casa tem valor_a e valor_b
+# "esquerda": a primeira casa com valor_b fica logo à direita da primeira com valor_a
+# "ao_lado": alguma casa com valor_a é vizinha de uma casa com valor_b
+# "ao_lado_primeira": a primeira casa com valor_a é vizinha de uma casa com valor_b
+ESPECIFICACAO_REGRAS = [
+    ("casa", NACIONALIDADE, NORUEGUES, None, 0),  # r1
+    ("mesma_casa", COR, VERMELHA, NACIONALIDADE, INGLES),  # r2
+    ("mesma_casa", NACIONALIDADE, SUECO, ANIMAL, CACHORROS),  # r3
+    ("mesma_casa", NACIONALIDADE, DINAMARQUES, BEBIDA, CHA),  # r4
+    ("esquerda", COR, VERDE, COR, BRANCA),  # r5
+    ("mesma_casa", COR, VERDE, BEBIDA, CAFE),  # r6
+    ("mesma_casa", CIGARRO, PALL_MALL, ANIMAL, PASSAROS),  # r7
+    ("mesma_casa", COR, AMARELA, CIGARRO, DUNHILL),  # r8
+    ("casa", BEBIDA, LEITE, None, 2),  # r9
+    ("ao_lado", CIGARRO, BLENDS, ANIMAL, GATOS),  # r10
+    ("ao_lado", ANIMAL, CAVALOS, CIGARRO, DUNHILL),  # r11
+    ("mesma_casa", CIGARRO, BLUEMASTER, BEBIDA, CERVEJA),  # r12
+    ("mesma_casa", NACIONALIDADE, ALEMAO, CIGARRO, PRINCE),  # r13
+    ("ao_lado_primeira", NACIONALIDADE, NORUEGUES, COR, AZUL),  # r14
+    ("ao_lado", CIGARRO, BLENDS, BEBIDA, AGUA),  # r15
+]
+
+# atributos (colunas) que cada regra consulta
+ATRIBUTOS_REGRAS = [
+    tuple(sorted({atributo_a} | ({atributo_b} if atributo_b is not None else set())))
+    for _, atributo_a, _, atributo_b, _ in ESPECIFICACAO_REGRAS
+]
+
+# máscara das regras afetadas pela troca de cada atributo entre duas casas
+REGRAS_POR_ATRIBUTO = [
+    sum(1 << k for k, atributos in enumerate(ATRIBUTOS_REGRAS) if atributo in atributos)
+    for atributo in range(5)
+]
+
 # Pesos para regras críticas
 PESOS_REGRAS = {
     0: 1.0,  # r1 - simples
@@ -109,46 +193,159 @@ PESOS_REGRAS = {
 }
 
 
+# motor usado por avaliar: "regras" (funções r1..r15) ou "bitboard"
+BACKENDS_FITNESS = ("regras", "bitboard")
+_backend_fitness = "regras"
+
+
+def definir_backend_fitness(nome):
+    global _backend_fitness
+    if nome not in BACKENDS_FITNESS:
+        raise ValueError(
+            f"Backend de fitness desconhecido: {nome} (opções: {BACKENDS_FITNESS})"
+        )
+    _backend_fitness = nome
+
+
+def backend_fitness():
+    return _backend_fitness
+
+
+NUMERO_REGRAS = len(REGRAS)
+MASCARA_COMPLETA = (1 << NUMERO_REGRAS) - 1
+
+# tabelas pré-calculadas sobre a máscara de satisfação
+# contagem de bits (fitness simples) para todas as 2^15 máscaras
+CONTAGEM_REGRAS = [bin(mascara).count("1") for mascara in range(1 << NUMERO_REGRAS)]
+# soma de pesos separada em byte baixo (regras 1-8) e alto (regras 9-15)
+_PONDERADO_BAIXO = [
+    sum((PESOS_REGRAS[i] for i in range(8) if parte >> i & 1), 0.0)
+    for parte in range(1 << 8)
+]
+_PONDERADO_ALTO = [
+    sum((PESOS_REGRAS[i + 8] for i in range(NUMERO_REGRAS - 8) if parte >> i & 1), 0.0)
+    for parte in range(1 << (NUMERO_REGRAS - 8))
+]
+
+
+# avaliação única das 15 regras // retorna a máscara de satisfação (bit k = regra k + 1)
+def avaliar(cromossomo):
+    if _backend_fitness == "bitboard":
+        return avaliar_bitboard(cromossomo)
+
+    mascara = 0
+    for i, regra in enumerate(REGRAS):
+        if regra(cromossomo):
+            mascara |= 1 << i
+    return mascara
+
+
+_REGRAS_COMPILADAS = compilar_regras(ESPECIFICACAO_REGRAS)
+_AFETADAS_POR_ATRIBUTO = [
+    [(1 << k, _REGRAS_COMPILADAS[k]) for k in range(NUMERO_REGRAS) if mascara >> k & 1]
+    for mascara in REGRAS_POR_ATRIBUTO
+]
+
+
+# avaliação incremental (delta) de uma troca de atributo entre duas casas:
+# mantém os bits do pai e reavalia só as regras que consultam o atributo trocado
+def avaliar_troca(filho, mascara_pai, atributo):
+    m = mascaras_posicao(filho)
+    mascara = mascara_pai & ~REGRAS_POR_ATRIBUTO[atributo]
+    for bit, regra in _AFETADAS_POR_ATRIBUTO[atributo]:
+        if regra(m):
+            mascara |= bit
+    return mascara
+
+
+# as 50 trocas possíveis (atributo, casa1, casa2) com casa1 < casa2
+MOVIMENTOS_TROCA = [
+    (atributo, casa1, casa2)
+    for atributo in range(5)
+    for casa1 in range(5)
+    for casa2 in range(casa1 + 1, 5)
+]
+
+
+# avalia a vizinhança inteira de trocas numa única chamada: as máscaras de posição do
+# cromossomo são calculadas uma vez e cada troca só move dois bits em duas máscaras
+# retorna a máscara de regras de cada vizinho, na ordem de MOVIMENTOS_TROCA
+def avaliar_vizinhanca(cromossomo, mascara):
+    m = list(mascaras_posicao(cromossomo))
+    mascaras = []
+    for atributo, casa1, casa2 in MOVIMENTOS_TROCA:
+        i1 = atributo * 5 + cromossomo[casa1 * 5 + atributo]
+        i2 = atributo * 5 + cromossomo[casa2 * 5 + atributo]
+        if i1 == i2:  # mesmo valor nas duas casas: vizinho idêntico
+            mascaras.append(mascara)
+            continue
+
+        bit1 = 1 << casa1
+        bit2 = 1 << casa2
+        original1 = m[i1]
+        original2 = m[i2]
+        m[i1] = original1 & ~bit1 | bit2
+        m[i2] = original2 & ~bit2 | bit1
+
+        vizinho = mascara & ~REGRAS_POR_ATRIBUTO[atributo]
+        for bit, regra in _AFETADAS_POR_ATRIBUTO[atributo]:
+            if regra(m):
+                vizinho |= bit
+        mascaras.append(vizinho)
+
+        m[i1] = original1
+        m[i2] = original2
+    return mascaras
+
+
+# visões baratas sobre a máscara, sem reexecutar as regras
+def contar_regras(mascara):
+    return CONTAGEM_REGRAS[mascara]
+
+
+def ponderado_mascara(mascara):
+    return _PONDERADO_BAIXO[mascara & 0xFF] + _PONDERADO_ALTO[mascara >> 8]
+
+
+# números (1 a 15) das regras não satisfeitas, percorrendo apenas os bits zerados
+def regras_faltantes_mascara(mascara):
+    faltantes = []
+    restantes = ~mascara & MASCARA_COMPLETA
+    while restantes:
+        bit = restantes & -restantes
+        faltantes.append(bit.bit_length())
+        restantes ^= bit
+    return faltantes
+
+
+def regras_satisfeitas_mascara(mascara):
+    return regras_faltantes_mascara(~mascara & MASCARA_COMPLETA)
+
+
 # fitness simples para contagem de regras satisfeitas
 def fitness(cromossomo):
-    return sum(regra(cromossomo) for regra in REGRAS)
+    return CONTAGEM_REGRAS[avaliar(cromossomo)]
 
 
 # fitness ponderado para regras críticas
 def fitness_ponderado(cromossomo):
-
-    total = 0.0
-    for i, regra in enumerate(REGRAS):
-        if regra(cromossomo):
-            total += PESOS_REGRAS[i]
-    return total
+    return ponderado_mascara(avaliar(cromossomo))
 
 
 # retorna os índices das regras que não estão sendo satisfeitas
 def obter_regras_faltantes(cromossomo):
-    faltantes = []
-    for i, regra in enumerate(REGRAS):
-        if not regra(cromossomo):
-            faltantes.append(i + 1)
-    return faltantes
+    return regras_faltantes_mascara(avaliar(cromossomo))
 
 
 # relatório do fitness
 def relatorio_detalhado_fitness(cromossomo):
-    satisfeitas = []
-    faltantes = []
-
-    for i, regra in enumerate(REGRAS):
-        if regra(cromossomo):
-            satisfeitas.append(i + 1)
-        else:
-            faltantes.append(i + 1)
+    mascara = avaliar(cromossomo)
 
     return {
-        "score": len(satisfeitas),
-        "satisfied": satisfeitas,
-        "missing": faltantes,
-        "weighted_score": fitness_ponderado(cromossomo),
+        "score": CONTAGEM_REGRAS[mascara],
+        "satisfied": regras_satisfeitas_mascara(mascara),
+        "missing": regras_faltantes_mascara(mascara),
+        "weighted_score": ponderado_mascara(mascara),
     }
 
 
@@ -160,6 +357,7 @@ def pontuacoes_parciais_fitness(cromossomo):
     regras_sequencia = [4]  # Regras sequenciais
     regras_vizinhanca = [9, 10, 13, 14]  # Regras de vizinhança
 
+    mascara = avaliar(cromossomo)
     pontuacoes = {}
 
     for categoria, indices_regras in [
@@ -168,7 +366,7 @@ def pontuacoes_parciais_fitness(cromossomo):
         ("sequencia", regras_sequencia),
         ("vizinhanca", regras_vizinhanca),
     ]:
-        satisfeitas = sum(1 for i in indices_regras if REGRAS[i](cromossomo))
+        satisfeitas = sum(1 for i in indices_regras if mascara >> i & 1)
         total = len(indices_regras)
         pontuacoes[categoria] = f"{satisfeitas}/{total}"
 
@@ -0,0 +1,275 @@
+"""
+Campanhas de experimentos: N sementes x M configurações do AG em paralelo
+Cada execução é silenciosa e determinística pela semente (random.seed antes de criar o
+AG) e vira uma linha com gerações, avaliações, tempo até 14, tempo até 15 e sucesso.
+As linhas são gravadas uma a uma em <saida>.jsonl assim que cada execução termina, de
+modo que uma campanha interrompida retoma só as execuções que faltam (linhas gravadas
+com outra VERSAO_CONTAGEM são refeitas). No fim são
+escritos <saida>.csv (uma linha por execução) e <saida>.json (execuções + agregados por
+configuração: taxa de sucesso, mediana/p90 do tempo até a solução e distribuições de
+tempo e de gerações até a solução).
+
+Uso:
+    python src/experimentos.py --sementes 30 --configuracoes configs.json --saida campanha
+O arquivo de configurações mapeia nome -> campos de ConfiguracaoAG, ex.:
+    {"padrao": {}, "pmx": {"operador_cruzamento": "pmx"}}
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from configuracao_ag import ConfiguracaoAG
+from einstein_rules import NUMERO_REGRAS
+from main import executar_ag
+
+# versão da contagem de avaliações gravada em cada linha: linhas de versões anteriores
+# (2: todas as avaliações do laço de descendentes contadas; 3: também as combinações da
+# completação exata e o ponto de partida da busca local) não são comparáveis e são
+# refeitas ao retomar a campanha
+VERSAO_CONTAGEM = 3
+
+CAMPOS_EXECUCAO = [
+    "configuracao",
+    "semente",
+    "sucesso",
+    "fitness",
+    "geracoes",
+    "avaliacoes",
+    "consultas_fitness",
+    "tempo_ate_14",
+    "tempo_ate_15",
+    "tempo_total",
+    "cromossomo",
+    "versao_contagem",
+]
+
+
+# uma execução do AG, silenciosa e determinística pela semente
+def executar_configuracao(nome: str, parametros: dict, semente: int) -> dict:
+    resultado = executar_ag(ConfiguracaoAG(**parametros), semente)
+    cromossomo = resultado.cromossomo
+    return {
+        "configuracao": nome,
+        "semente": semente,
+        "sucesso": resultado.fitness == NUMERO_REGRAS,
+        "fitness": resultado.fitness,
+        "geracoes": resultado.geracoes,
+        "avaliacoes": resultado.avaliacoes,
+        "consultas_fitness": resultado.consultas_fitness,
+        "tempo_ate_14": resultado.tempo_ate_14,
+        "tempo_ate_15": resultado.tempo_ate_15,
+        "tempo_total": resultado.tempo_total,
+        "cromossomo": cromossomo.hex() if cromossomo is not None else None,
+        "versao_contagem": VERSAO_CONTAGEM,
+    }
+
+
+# percentil pelo método do posto mais próximo (lista não vazia)
+def percentil(valores: List[float], p: float) -> float:
+    ordenados = sorted(valores)
+    posicao = max(1, math.ceil(p / 100 * len(ordenados)))
+    return ordenados[posicao - 1]
+
+
+def _resumo(valores: List[float]) -> Optional[dict]:
+    if not valores:
+        return None
+    return {
+        "minimo": min(valores),
+        "mediana": statistics.median(valores),
+        "p90": percentil(valores, 90),
+        "maximo": max(valores),
+    }
+
+
+# distribuição de comprimento de execução: fração de todas as execuções resolvidas até
+# cada valor (tempo ou gerações) das execuções bem-sucedidas
+def distribuicao_execucao(valores_sucesso: List[float], total: int) -> List[list]:
+    return [
+        [valor, (posicao + 1) / total]
+        for posicao, valor in enumerate(sorted(valores_sucesso))
+    ]
+
+
+def agregar(execucoes: List[dict]) -> Dict[str, dict]:
+    por_configuracao: Dict[str, List[dict]] = {}
+    for execucao in execucoes:
+        por_configuracao.setdefault(execucao["configuracao"], []).append(execucao)
+
+    agregados = {}
+    for nome, linhas in sorted(por_configuracao.items()):
+        sucessos = [linha for linha in linhas if linha["sucesso"]]
+        tempos_15 = [linha["tempo_ate_15"] for linha in sucessos]
+        geracoes_15 = [linha["geracoes"] for linha in sucessos]
+        agregados[nome] = {
+            "execucoes": len(linhas),
+            "sucessos": len(sucessos),
+            "taxa_sucesso": len(sucessos) / len(linhas),
+            "tempo_ate_15": _resumo(tempos_15),
+            "tempo_ate_14": _resumo(
+                [
+                    linha["tempo_ate_14"]
+                    for linha in linhas
+                    if linha["tempo_ate_14"] is not None
+                ]
+            ),
+            "geracoes": _resumo([linha["geracoes"] for linha in linhas]),
+            "avaliacoes": _resumo([linha["avaliacoes"] for linha in linhas]),
+            "distribuicao_tempo_ate_15": distribuicao_execucao(tempos_15, len(linhas)),
+            "distribuicao_geracoes_ate_15": distribuicao_execucao(
+                geracoes_15, len(linhas)
+            ),
+        }
+    return agregados
+
+
+# execuções já gravadas no arquivo incremental (linhas truncadas são ignoradas)
+def carregar_execucoes(caminho: str) -> List[dict]:
+    if not os.path.exists(caminho):
+        return []
+    execucoes = []
+    with open(caminho, encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            try:
+                execucoes.append(json.loads(linha))
+            except json.JSONDecodeError:
+                continue  # última linha cortada por uma interrupção
+    return execucoes
+
+
+# abre o arquivo incremental para acréscimo, terminando uma linha cortada para que a
+# próxima execução gravada não se junte a ela
+def _abrir_incremental(caminho: str):
+    arquivo = open(caminho, "a", encoding="utf-8")
+    if arquivo.tell() > 0:
+        with open(caminho, "rb") as leitura:
+            leitura.seek(-1, os.SEEK_END)
+            if leitura.read(1) != b"\n":
+                arquivo.write("\n")
+    return arquivo
+
+
+def _gravar_linha(arquivo, execucao: dict) -> None:
+    arquivo.write(json.dumps(execucao, ensure_ascii=False) + "\n")
+    arquivo.flush()
+    os.fsync(arquivo.fileno())
+
+
+def escrever_resultados(saida: str, execucoes: List[dict]) -> dict:
+    execucoes = sorted(execucoes, key=lambda e: (e["configuracao"], e["semente"]))
+    with open(f"{saida}.csv", "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=CAMPOS_EXECUCAO)
+        escritor.writeheader()
+        escritor.writerows(execucoes)
+
+    resultado = {"execucoes": execucoes, "agregados": agregar(execucoes)}
+    with open(f"{saida}.json", "w", encoding="utf-8") as arquivo:
+        json.dump(resultado, arquivo, ensure_ascii=False, indent=2)
+    return resultado
+
+
+# roda as execuções que ainda não estão em <saida>.jsonl e escreve os resultados finais
+def executar_campanha(
+    configuracoes: Dict[str, dict],
+    sementes: List[int],
+    saida: str,
+    trabalhadores: Optional[int] = None,
+) -> dict:
+    caminho_parcial = f"{saida}.jsonl"
+    execucoes = [
+        execucao
+        for execucao in carregar_execucoes(caminho_parcial)
+        if execucao["configuracao"] in configuracoes
+        and execucao["semente"] in sementes
+        and execucao.get("versao_contagem") == VERSAO_CONTAGEM
+    ]
+    feitas = {(execucao["configuracao"], execucao["semente"]) for execucao in execucoes}
+    pendentes = [
+        (nome, semente)
+        for nome in configuracoes
+        for semente in sementes
+        if (nome, semente) not in feitas
+    ]
+    total = len(configuracoes) * len(sementes)
+    print(
+        f"🧪 CAMPANHA: {len(configuracoes)} configurações x {len(sementes)} sementes | "
+        f"{total - len(pendentes)} já concluídas, {len(pendentes)} pendentes"
+    )
+
+    with _abrir_incremental(caminho_parcial) as arquivo, ProcessPoolExecutor(
+        trabalhadores
+    ) as executor:
+        futuros = [
+            executor.submit(executar_configuracao, nome, configuracoes[nome], semente)
+            for nome, semente in pendentes
+        ]
+        for concluidas, futuro in enumerate(as_completed(futuros), 1):
+            execucao = futuro.result()
+            _gravar_linha(arquivo, execucao)
+            execucoes.append(execucao)
+            print(
+                f"   [{total - len(pendentes) + concluidas:4d}/{total}] {execucao['configuracao']} "
+                f"semente {execucao['semente']}: {execucao['fitness']}/15 em "
+                f"{execucao['geracoes']} gerações ({execucao['tempo_total']:.1f}s)"
+            )
+
+    resultado = escrever_resultados(saida, execucoes)
+    _imprimir_agregados(resultado["agregados"])
+    return resultado
+
+
+def _imprimir_agregados(agregados: Dict[str, dict]) -> None:
+    print("\n   Configuração         | Sucesso          | Mediana até 15 | p90 até 15")
+    for nome, agregado in agregados.items():
+        tempo = agregado["tempo_ate_15"]
+        mediana = f"{tempo['mediana']:.2f}s" if tempo else "-"
+        p90 = f"{tempo['p90']:.2f}s" if tempo else "-"
+        print(
+            f"   {nome:20s} | {agregado['sucessos']:3d}/{agregado['execucoes']:<3d} "
+            f"({agregado['taxa_sucesso']*100:5.1f}%) | {mediana:>14s} | {p90:>10s}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Campanha de experimentos do AG: sementes x configurações"
+    )
+    parser.add_argument("--sementes", type=int, default=10, help="número de sementes")
+    parser.add_argument("--semente-inicial", type=int, default=1)
+    parser.add_argument(
+        "--configuracoes",
+        help="JSON nome -> campos de ConfiguracaoAG (padrão: só a "
+        "configuração padrão)",
+    )
+    parser.add_argument(
+        "--saida",
+        default="campanha",
+        help="prefixo dos arquivos .jsonl (incremental), .csv e .json",
+    )
+    parser.add_argument("--trabalhadores", type=int, default=None)
+    argumentos = parser.parse_args(argv)
+
+    configuracoes = {"padrao": {}}
+    if argumentos.configuracoes:
+        with open(argumentos.configuracoes, encoding="utf-8") as arquivo:
+            configuracoes = json.load(arquivo)
+
+    sementes = list(
+        range(
+            argumentos.semente_inicial,
+            argumentos.semente_inicial + argumentos.sementes,
+        )
+    )
+    executar_campanha(
+        configuracoes, sementes, argumentos.saida, argumentos.trabalhadores
+    )
+
+
+if __name__ == "__main__":
+    main()
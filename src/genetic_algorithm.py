@@ -4,61 +4,51 @@ Implementamos operadores genéticos e estratégias de busca local
 """
 
 import random
-import copy
-from typing import List, Tuple, Callable
-
-
-CORES = ["Vermelha", "Verde", "Branca", "Amarela", "Azul"]
-NACIONALIDADES = ["Inglês", "Sueco", "Dinamarquês", "Norueguês", "Alemão"]
-BEBIDAS = ["Chá", "Café", "Leite", "Cerveja", "Água"]
-CIGARROS = ["Pall Mall", "Dunhill", "Blends", "BlueMaster", "Prince"]
-ANIMAIS = ["Cachorros", "Pássaros", "Gatos", "Cavalos", "Peixes"]
+from typing import List, Optional, Tuple, Callable
+
+from cromossomo import (
+    CORES,
+    COR,
+    NACIONALIDADE,
+    VERDE,
+    BRANCA,
+    AZUL,
+    NORUEGUES,
+    Cromossomo,
+    coluna,
+    decodificar,
+    trocar,
+)
+from busca_vizinhanca import busca_vizinhanca
+from dominios_reduzidos import amostrar_reduzidos
+from einstein_rules import avaliar, avaliar_troca, contar_regras
+from orcamento import Orcamento
 
 
 # método para gerar um cromossomo aleatório para uma config válida
-def cromossomo_aleatorio() -> List[Tuple[str, str, str, str, str]]:
-    cores = CORES.copy()
-    nacionalidades = NACIONALIDADES.copy()
-    bebidas = BEBIDAS.copy()
-    cigarros = CIGARROS.copy()
-    animais = ANIMAIS.copy()
-
-    random.shuffle(cores)
-    random.shuffle(nacionalidades)
-    random.shuffle(bebidas)
-    random.shuffle(cigarros)
-    random.shuffle(animais)
+def cromossomo_aleatorio() -> Cromossomo:
+    colunas = [random.sample(range(5), 5) for _ in range(5)]
 
-    return [
-        (cores[i], nacionalidades[i], bebidas[i], cigarros[i], animais[i])
-        for i in range(5)
-    ]
+    return bytes(colunas[atributo][casa] for casa in range(5) for atributo in range(5))
 
 
 # método para mutar um cromossomo com uma taxa de aleatória // args: cromossomo(config atual das casas) e taxa de mutação / return dess metodo é o cromossomo mutado
-def mutacao(cromossomo: List[Tuple], taxa_mutacao: float) -> List[Tuple]:
+def mutacao(cromossomo: Cromossomo, taxa_mutacao: float) -> Cromossomo:
     if random.random() > taxa_mutacao:
         return cromossomo
 
-    novo_cromossomo = [list(casa) for casa in cromossomo]
-
     casa1, casa2 = random.sample(range(5), 2)  # escolhe duas casas aleatórias
 
     caracteristica = random.randint(0, 4)  # '' config aleatória
 
     # trocou a característica entre as duas casas
-    novo_cromossomo[casa1][caracteristica], novo_cromossomo[casa2][caracteristica] = (
-        novo_cromossomo[casa2][caracteristica],
-        novo_cromossomo[casa1][caracteristica],
-    )
-
-    return [tuple(casa) for casa in novo_cromossomo]
+    return trocar(cromossomo, caracteristica, casa1, casa2)
 
 
 # metodo adaptativo para mutação no current fitness, baseado em tecnicas de comp paralela com mpi e openmp / para cromossomo de alto fitness aplica mutações suaves e para cromossomo de baixo fitness aplica mutação padrão
 def mutacao_inteligente(
-    cromossomo: List[Tuple], taxa_mutacao: float, fitness_atual: int
-) -> List[Tuple]:
+    cromossomo: Cromossomo, taxa_mutacao: float, fitness_atual: int
+) -> Cromossomo:
     if random.random() > taxa_mutacao:
         return cromossomo
 
@@ -75,14 +65,12 @@ def mutacao_inteligente(
 
 
 # metodo para mutação dirigida que foca nas regras que ainda não foram satisfeitas // tenta priorizar regras de maior peso para melhorar essa resolução.
-def mutacao_dirigida(
-    cromossomo: List[Tuple], regras_faltantes: List[int]
-) -> List[Tuple]:
+def mutacao_dirigida(cromossomo: Cromossomo, regras_faltantes: List[int]) -> Cromossomo:
 
     if not regras_faltantes:
         return cromossomo
 
-    novo_cromossomo = [list(casa) for casa in cromossomo]
+    novo_cromossomo = cromossomo
 
     # regras de vizinhança / maior peso
     regras_vizinhanca = [10, 11, 14, 15]
@@ -95,41 +83,32 @@ def mutacao_dirigida(
             if random.random() < 0.5:
                 # troca característica entre casas adjacentes para melhor tentativa de resolver
                 caracteristica = random.randint(0, 4)
-                (
-                    novo_cromossomo[posicao][caracteristica],
-                    novo_cromossomo[posicao + 1][caracteristica],
-                ) = (
-                    novo_cromossomo[posicao + 1][caracteristica],
-                    novo_cromossomo[posicao][caracteristica],
+                novo_cromossomo = trocar(
+                    novo_cromossomo, caracteristica, posicao, posicao + 1
                 )
     else:
         casa1, casa2 = random.sample(
             range(5), 2
         )  # para outras regras, aplica mutação padrão
         caracteristica = random.randint(0, 4)
-        (
-            novo_cromossomo[casa1][caracteristica],
-            novo_cromossomo[casa2][caracteristica],
-        ) = (
-            novo_cromossomo[casa2][caracteristica],
-            novo_cromossomo[casa1][caracteristica],
-        )
+        novo_cromossomo = trocar(novo_cromossomo, caracteristica, casa1, casa2)
 
-    return [tuple(casa) for casa in novo_cromossomo]
+    return novo_cromossomo
 
 
 # operador de cruzamento de um ponto aleatório // args: pai1 e pai2 e probabilidade de cruzamento / return: tupla com dois filhos gerados
 def cruzamento(
-    pai1: List[Tuple], pai2: List[Tuple], taxa_cruzamento: float
-) -> Tuple[List[Tuple], List[Tuple]]:
+    pai1: Cromossomo, pai2: Cromossomo, taxa_cruzamento: float
+) -> Tuple[Cromossomo, Cromossomo]:
 
     if random.random() > taxa_cruzamento:
         return pai1, pai2
 
     ponto_corte = random.randint(1, 4)
 
-    filho1 = pai1[:ponto_corte] + pai2[ponto_corte:]
-    filho2 = pai2[:ponto_corte] + pai1[ponto_corte:]
+    corte = ponto_corte * 5  # cada casa ocupa 5 genes
+    filho1 = pai1[:corte] + pai2[corte:]
+    filho2 = pai2[:corte] + pai1[corte:]
 
     # reparacao para os cromossomos validos
     filho1 = reparar_cromossomo(filho1)
@@ -140,21 +119,18 @@ def cruzamento(
 
 # cruzamento uniforme com reparação inteligente, cada gene é herdado independentemente com 50% de probabilidade de cada pai
 def cruzamento_avancado(
-    pai1: List[Tuple], pai2: List[Tuple], taxa_cruzamento: float
-) -> Tuple[List[Tuple], List[Tuple]]:
+    pai1: Cromossomo, pai2: Cromossomo, taxa_cruzamento: float
+) -> Tuple[Cromossomo, Cromossomo]:
     if random.random() > taxa_cruzamento:
         return pai1, pai2
 
-    filho1 = []
-    filho2 = []
+    filho1 = bytearray(pai1)
+    filho2 = bytearray(pai2)
 
-    for i in range(5):
-        if random.random() < 0.5:
-            filho1.append(pai1[i])
-            filho2.append(pai2[i])
-        else:
-            filho1.append(pai2[i])
-            filho2.append(pai1[i])
+    for i in range(0, 25, 5):
+        if random.random() >= 0.5:
+            filho1[i : i + 5] = pai2[i : i + 5]
+            filho2[i : i + 5] = pai1[i : i + 5]
 
     # de novo, usei a funcao reparar_cromossomo para cromossomos válidos
     filho1 = reparar_cromossomo(filho1)
@@ -164,19 +140,16 @@ def cruzamento_avancado(
 
 
 # funcao para reparar cromossomos válidos, logo com cada característica apareça exatamente uma vez. // resolve tambem as duplicatas pela troca aleatória
-def reparar_cromossomo(cromossomo: List[Tuple]) -> List[Tuple]:
+def reparar_cromossomo(cromossomo: Cromossomo) -> Cromossomo:
 
-    novo_cromossomo = [list(casa) for casa in cromossomo]
+    novo_cromossomo = bytearray(cromossomo)
 
     for caracteristica_idx in range(5):
-        valores_atuais = [casa[caracteristica_idx] for casa in novo_cromossomo]
-        valores_unicos = list(set(valores_atuais))
+        valores_atuais = novo_cromossomo[caracteristica_idx::5]
+        valores_unicos = set(valores_atuais)
 
         if len(valores_unicos) < 5:
-            todos_valores = [CORES, NACIONALIDADES, BEBIDAS, CIGARROS, ANIMAIS][
-                caracteristica_idx
-            ]
-            valores_faltantes = [v for v in todos_valores if v not in valores_unicos]
+            valores_faltantes = [v for v in range(5) if v not in valores_unicos]
 
             contagem = {}
             for i, valor in enumerate(valores_atuais):
@@ -191,18 +164,18 @@ def reparar_cromossomo(cromossomo: List[Tuple]) -> List[Tuple]:
                     # mantém a ocorrencia certa e substitui as outras
                     for pos in posicoes[1:]:
                         if idx_faltante < len(valores_faltantes):
-                            novo_cromossomo[pos][caracteristica_idx] = (
+                            novo_cromossomo[pos * 5 + caracteristica_idx] = (
                                 valores_faltantes[idx_faltante]
                             )
                             idx_faltante += 1
 
-    return [tuple(casa) for casa in novo_cromossomo]
+    return bytes(novo_cromossomo)
 
 
 # seleção por roleta baseada no fitness (proporcional a ele) // diversificação - exploração ampla
 def selecao_roleta(
-    populacao: List[List[Tuple]], valores_fitness: List[int]
-) -> List[Tuple]:
+    populacao: List[Cromossomo], valores_fitness: List[int]
+) -> Cromossomo:
     if not valores_fitness or max(valores_fitness) == 0:
         return random.choice(populacao)
 
@@ -214,8 +187,8 @@ def selecao_roleta(
     r = random.uniform(0, fitness_total)
     acumulado = 0
 
-    for i, fitness in enumerate(fitness_ajustado):
-        acumulado += fitness
+    for i, valor in enumerate(fitness_ajustado):
+        acumulado += valor
         if acumulado >= r:
             return populacao[i]
 
@@ -225,8 +198,8 @@ def selecao_roleta(
 # seleção por torneio com tamanho configurável // args: populacao e valores de fitness e tamanho do torneio - numero de individuos competindo ( maior = mais seletivo)
 # return com o maior fitness --  melhor_indice // conceito de intensificação: busca local -  mais elitista, pode convergir mais rapido
 def selecao_torneio(
-    populacao: List[List[Tuple]], valores_fitness: List[int], tamanho_torneio: int = 5
-) -> List[Tuple]:
+    populacao: List[Cromossomo], valores_fitness: List[int], tamanho_torneio: int = 5
+) -> Cromossomo:
     if len(populacao) < tamanho_torneio:
         tamanho_torneio = len(populacao)
 
@@ -240,8 +213,8 @@ def selecao_torneio(
 # alto fitness máximo: torneio pequeno (intensificação)
 # baixo fitness máximo: roleta (diversificação)
 def selecao_hibrida(
-    populacao: List[List[Tuple]], valores_fitness: List[int]
-) -> List[Tuple]:
+    populacao: List[Cromossomo], valores_fitness: List[int]
+) -> Cromossomo:
     fitness_maximo = max(valores_fitness) if valores_fitness else 0
 
     if fitness_maximo >= 14:
@@ -256,13 +229,37 @@ def selecao_hibrida(
 
 # busca local tipo hill-climbing (um algoritmo de busca local que se inspira na escalada ao pico de uma montanha,encontrar a melhor solução a partir de um conjunto de soluções possíveis.
 # Para esse caso do refinamento de soluções,eficaz para cromossomos com fitness ≥ 13, ele explora sistematicamente vizinhanças através de trocas pequenas.
+# modo "amostrada" sorteia vizinhos; "melhor", "primeira" e "plato" usam a vizinhança
+# completa (busca_vizinhanca) // estatisticas acumula avaliações e melhorias; com
+# `orcamento` (Orcamento da execução), para entre iterações quando ele se esgota
+# incremental: o fitness é a contagem de regras (fitness ou CacheFitness.fitness), então
+# a máscara inicial vem de funcao_avaliar (ex.: CacheFitness.avaliar) e os vizinhos são
+# avaliados por delta sobre ela (avaliar_troca), sem chamar funcao_fitness
 def busca_local(
-    cromossomo: List[Tuple], funcao_fitness: Callable, max_iteracoes: int = 50
-) -> List[Tuple]:
+    cromossomo: Cromossomo,
+    funcao_fitness: Callable,
+    max_iteracoes: int = 50,
+    modo: str = "amostrada",
+    estatisticas: Optional[dict] = None,
+    orcamento: Optional[Orcamento] = None,
+    incremental: bool = False,
+    funcao_avaliar: Callable[[Cromossomo], int] = avaliar,
+) -> Cromossomo:
+    if incremental:
+        if modo != "amostrada":
+            return busca_vizinhanca(
+                cromossomo, modo, max_iteracoes, estatisticas, orcamento, funcao_avaliar
+            )
+        return busca_local_incremental(
+            cromossomo, max_iteracoes, estatisticas, orcamento, funcao_avaliar
+        )
+
     melhor_cromossomo = cromossomo
     melhor_fitness = funcao_fitness(cromossomo)
 
     for _ in range(max_iteracoes):
+        if orcamento is not None and orcamento.esgotado():
+            break  # orçamento da execução esgotado: devolve o melhor até aqui
         vizinho = gerar_vizinho(
             melhor_cromossomo
         )  # gera vizinho através de pequena perturbação
@@ -278,51 +275,76 @@ def busca_local(
     return melhor_cromossomo
 
 
-# gera vizinho através de uma pequena modificação aleatória, troca entre casas adjacentes ou troca de característica específica.
-def gerar_vizinho(cromossomo: List[Tuple]) -> List[Tuple]:
-    novo_cromossomo = [list(casa) for casa in cromossomo]
+# mesmo hill-climbing da busca_local, mas cada vizinho é uma troca (atributo, casa1, casa2):
+# a máscara de regras do melhor atual é mantida e só as regras que consultam o atributo
+# trocado são reavaliadas (avaliar_troca)
+def busca_local_incremental(
+    cromossomo: Cromossomo,
+    max_iteracoes: int = 50,
+    estatisticas: Optional[dict] = None,
+    orcamento: Optional[Orcamento] = None,
+    funcao_avaliar: Callable[[Cromossomo], int] = avaliar,
+) -> Cromossomo:
+    melhor_cromossomo = cromossomo
+    melhor_mascara = funcao_avaliar(cromossomo)
+    melhor_fitness = contar_regras(melhor_mascara)
+    avaliacoes = 0
+    melhorias = 0
+
+    for _ in range(max_iteracoes):
+        if orcamento is not None and orcamento.esgotado():
+            break
+        caracteristica, casa1, casa2 = gerar_movimento()
+        vizinho = trocar(melhor_cromossomo, caracteristica, casa1, casa2)
+        mascara_vizinho = avaliar_troca(vizinho, melhor_mascara, caracteristica)
+        fitness_vizinho = contar_regras(mascara_vizinho)
+        avaliacoes += 1
+
+        if fitness_vizinho > melhor_fitness:  # so vai aceitar se tem a melhoria
+            melhor_cromossomo = vizinho
+            melhor_mascara = mascara_vizinho
+            melhor_fitness = fitness_vizinho
+            melhorias += 1
+
+            if melhor_fitness == 15:  # achou o resultado, para o loop
+                break
+
+    if estatisticas is not None:
+        estatisticas["buscas"] += 1
+        estatisticas["avaliacoes"] += avaliacoes
+        estatisticas["melhorias"] += melhorias
+
+    return melhor_cromossomo
+
 
+# sorteia o movimento de vizinhança (caracteristica, casa1, casa2): troca entre casas adjacentes ou troca de característica específica.
+def gerar_movimento() -> Tuple[int, int, int]:
     estrategia = random.choice(
         ["troca_adjacente", "troca_caracteristica", "troca_aleatoria"]
     )
 
-    if estrategia == "troca_adjacente" and len(novo_cromossomo) > 1:
+    if estrategia == "troca_adjacente":
         posicao = random.randint(0, 3)  # troca entre casas adjacentes
         caracteristica = random.randint(0, 4)
-        (
-            novo_cromossomo[posicao][caracteristica],
-            novo_cromossomo[posicao + 1][caracteristica],
-        ) = (
-            novo_cromossomo[posicao + 1][caracteristica],
-            novo_cromossomo[posicao][caracteristica],
-        )
+        return caracteristica, posicao, posicao + 1
 
     elif estrategia == "troca_caracteristica":
         casa1, casa2 = random.sample(
             range(5), 2
         )  # Troca uma característica específica entre duas casas quaisquer
         caracteristica = random.randint(0, 4)
-        (
-            novo_cromossomo[casa1][caracteristica],
-            novo_cromossomo[casa2][caracteristica],
-        ) = (
-            novo_cromossomo[casa2][caracteristica],
-            novo_cromossomo[casa1][caracteristica],
-        )
+        return caracteristica, casa1, casa2
 
     else:  # troca_aleatoria
         # mutação padrão
         casa1, casa2 = random.sample(range(5), 2)
         caracteristica = random.randint(0, 4)
-        (
-            novo_cromossomo[casa1][caracteristica],
-            novo_cromossomo[casa2][caracteristica],
-        ) = (
-            novo_cromossomo[casa2][caracteristica],
-            novo_cromossomo[casa1][caracteristica],
-        )
+        return caracteristica, casa1, casa2
 
-    return [tuple(casa) for casa in novo_cromossomo]
+
+# gera vizinho através de uma pequena modificação aleatória (ver gerar_movimento)
+def gerar_vizinho(cromossomo: Cromossomo) -> Cromossomo:
+    return trocar(cromossomo, *gerar_movimento())
 
 
 # cria descendentes de alta qualidade através de cruzamento dirigido da elite
@@ -330,16 +352,23 @@ def gerar_vizinho(cromossomo: List[Tuple]) -> List[Tuple]:
 # 2. Aplica cruzamento avançado
 # 3. Refinamento via busca local
 def criar_descendentes_elite(
-    populacao_elite: List[List[Tuple]],
+    populacao_elite: List[Cromossomo],
     valores_fitness: List[int],
     funcao_fitness: Callable,
-) -> List[List[Tuple]]:
+    modo_busca: str = "amostrada",
+    estatisticas_busca: Optional[dict] = None,
+    orcamento: Optional[Orcamento] = None,
+    incremental: bool = False,
+    funcao_avaliar: Callable[[Cromossomo], int] = avaliar,
+) -> List[Cromossomo]:
     descendentes = []
 
     if len(populacao_elite) < 2:  # população minima para operação
         return descendentes
 
     for _ in range(min(20, len(populacao_elite))):
+        if orcamento is not None and orcamento.esgotado():
+            break
         pai1 = selecao_torneio(
             populacao_elite, valores_fitness, 3
         )  # seleção dirigida: prioriza indivíduos de alto fitness
@@ -349,8 +378,11 @@ def criar_descendentes_elite(
             pai1, pai2, 0.95
         )  # cruzamento avançado com alta probabilidade
 
-        filho1 = busca_local(filho1, funcao_fitness, 10)  # busca hill-climbing
-        filho2 = busca_local(filho2, funcao_fitness, 10)
+        refinamento = (
+            modo_busca, estatisticas_busca, orcamento, incremental, funcao_avaliar
+        )
+        filho1 = busca_local(filho1, funcao_fitness, 10, *refinamento)  # hill-climbing
+        filho2 = busca_local(filho2, funcao_fitness, 10, *refinamento)
 
         descendentes.extend([filho1, filho2])
 
@@ -358,44 +390,41 @@ def criar_descendentes_elite(
 
 
 # mutação especializada para resolver a Regra 5 (otimizacao)
-def mutacao_especializada_regra5(cromossomo: List[Tuple]) -> List[Tuple]:
+def mutacao_especializada_regra5(cromossomo: Cromossomo) -> Cromossomo:
 
-    novo_cromossomo = [list(casa) for casa in cromossomo]
+    novo_cromossomo = bytearray(cromossomo)
 
     posicoes_validas = [(0, 1), (1, 2), (2, 3), (3, 4)]
     pos_verde, pos_branca = random.choice(posicoes_validas)
 
-    cor_atual_verde = novo_cromossomo[pos_verde][0]
-    cor_atual_branca = novo_cromossomo[pos_branca][0]
+    cor_atual_verde = novo_cromossomo[pos_verde * 5 + COR]
+    cor_atual_branca = novo_cromossomo[pos_branca * 5 + COR]
 
-    pos_atual_verde = next(
-        (i for i, casa in enumerate(novo_cromossomo) if casa[0] == "Verde"), -1
-    )
-    pos_atual_branca = next(
-        (i for i, casa in enumerate(novo_cromossomo) if casa[0] == "Branca"), -1
-    )
+    cores = coluna(cromossomo, COR)
+    pos_atual_verde = cores.find(VERDE)
+    pos_atual_branca = cores.find(BRANCA)
 
     if pos_atual_verde != -1:
-        novo_cromossomo[pos_atual_verde][0] = cor_atual_verde
+        novo_cromossomo[pos_atual_verde * 5 + COR] = cor_atual_verde
     if pos_atual_branca != -1:
-        novo_cromossomo[pos_atual_branca][0] = cor_atual_branca
+        novo_cromossomo[pos_atual_branca * 5 + COR] = cor_atual_branca
 
-    novo_cromossomo[pos_verde][0] = "Verde"
-    novo_cromossomo[pos_branca][0] = "Branca"
+    novo_cromossomo[pos_verde * 5 + COR] = VERDE
+    novo_cromossomo[pos_branca * 5 + COR] = BRANCA
 
-    return [tuple(casa) for casa in novo_cromossomo]
+    return bytes(novo_cromossomo)
 
 
 # debug
-def debug_status_regra5(cromossomo: List[Tuple]) -> dict:
+def debug_status_regra5(cromossomo: Cromossomo) -> dict:
 
-    cores_casas = [casa[0] for casa in cromossomo]
+    cores_casas = coluna(cromossomo, COR)
 
-    pos_verde = next((i for i, cor in enumerate(cores_casas) if cor == "Verde"), -1)
-    pos_branca = next((i for i, cor in enumerate(cores_casas) if cor == "Branca"), -1)
+    pos_verde = cores_casas.find(VERDE)
+    pos_branca = cores_casas.find(BRANCA)
 
     info = {
-        "sequencia_cores": cores_casas,
+        "sequencia_cores": [CORES[cor] for cor in cores_casas],
         "posicao_verde": pos_verde + 1 if pos_verde != -1 else None,
         "posicao_branca": pos_branca + 1 if pos_branca != -1 else None,
         "regra5_satisfeita": False,
@@ -413,8 +442,8 @@ def debug_status_regra5(cromossomo: List[Tuple]) -> dict:
 
 # reparacao intensiva (otimizacao) // tenta múltiplas configurações Verde-Branca sequenciais até encontrar uma válida.
 def reparacao_intensiva_regra5(
-    cromossomo: List[Tuple], max_tentativas: int = 100
-) -> List[Tuple]:
+    cromossomo: Cromossomo, max_tentativas: int = 100
+) -> Cromossomo:
 
     melhor_cromossomo = cromossomo
 
@@ -431,60 +460,58 @@ def reparacao_intensiva_regra5(
 
 # caso o debug e a mutação inteligente falhe, força a configuração Verde-Branca sequencial // teste explicitamente para todas as posições possíveis
 def forca_bruta_regra5(
-    cromossomo: List[Tuple], funcao_fitness: Callable
-) -> List[List[Tuple]]:
+    cromossomo: Cromossomo, funcao_fitness: Callable
+) -> List[Cromossomo]:
 
     configuracoes_geradas = []
     posicoes_verde_branca = [(0, 1), (1, 2), (2, 3), (3, 4)]
 
     for pos_verde, pos_branca in posicoes_verde_branca:
-        candidato = [list(casa) for casa in cromossomo]
+        candidato = bytearray(cromossomo)
 
-        cor_original_verde = candidato[pos_verde][0]
-        cor_original_branca = candidato[pos_branca][0]
+        cor_original_verde = candidato[pos_verde * 5 + COR]
+        cor_original_branca = candidato[pos_branca * 5 + COR]
 
-        pos_atual_verde = next(
-            (i for i, casa in enumerate(candidato) if casa[0] == "Verde"), -1
-        )
-        pos_atual_branca = next(
-            (i for i, casa in enumerate(candidato) if casa[0] == "Branca"), -1
-        )
+        cores = coluna(cromossomo, COR)
+        pos_atual_verde = cores.find(VERDE)
+        pos_atual_branca = cores.find(BRANCA)
 
         if pos_atual_verde != -1 and pos_atual_verde != pos_verde:
-            candidato[pos_atual_verde][0] = cor_original_verde
+            candidato[pos_atual_verde * 5 + COR] = cor_original_verde
         if pos_atual_branca != -1 and pos_atual_branca != pos_branca:
-            candidato[pos_atual_branca][0] = cor_original_branca
+            candidato[pos_atual_branca * 5 + COR] = cor_original_branca
 
-        candidato[pos_verde][0] = "Verde"
-        candidato[pos_branca][0] = "Branca"
+        candidato[pos_verde * 5 + COR] = VERDE
+        candidato[pos_branca * 5 + COR] = BRANCA
 
-        candidato_final = [tuple(casa) for casa in candidato]
-        configuracoes_geradas.append(candidato_final)
+        configuracoes_geradas.append(bytes(candidato))
 
     return configuracoes_geradas
 
 
 # analise científica completa de um cromossomo // retorna um dicionário com métricas de qualidade e satisfação de restrições
 def analisar_cromossomo_detalhado(
-    cromossomo: List[Tuple], funcao_fitness: Callable
+    cromossomo: Cromossomo, funcao_fitness: Callable
 ) -> dict:
 
     fitness_total = funcao_fitness(cromossomo)
 
+    casas = decodificar(cromossomo)
+
     analise = {
         "fitness_total": fitness_total,
-        "configuracao": cromossomo,
-        "cores": [casa[0] for casa in cromossomo],
-        "nacionalidades": [casa[1] for casa in cromossomo],
-        "bebidas": [casa[2] for casa in cromossomo],
-        "cigarros": [casa[3] for casa in cromossomo],
-        "animais": [casa[4] for casa in cromossomo],
+        "configuracao": casas,
+        "cores": [casa[0] for casa in casas],
+        "nacionalidades": [casa[1] for casa in casas],
+        "bebidas": [casa[2] for casa in casas],
+        "cigarros": [casa[3] for casa in casas],
+        "animais": [casa[4] for casa in casas],
         "validacao_estrutural": {
-            "cores_unicas": len(set(casa[0] for casa in cromossomo)) == 5,
-            "nacionalidades_unicas": len(set(casa[1] for casa in cromossomo)) == 5,
-            "bebidas_unicas": len(set(casa[2] for casa in cromossomo)) == 5,
-            "cigarros_unicos": len(set(casa[3] for casa in cromossomo)) == 5,
-            "animais_unicos": len(set(casa[4] for casa in cromossomo)) == 5,
+            "cores_unicas": len(set(cromossomo[0::5])) == 5,
+            "nacionalidades_unicas": len(set(cromossomo[1::5])) == 5,
+            "bebidas_unicas": len(set(cromossomo[2::5])) == 5,
+            "cigarros_unicos": len(set(cromossomo[3::5])) == 5,
+            "animais_unicos": len(set(cromossomo[4::5])) == 5,
         },
     }
 
@@ -492,7 +519,7 @@ def analisar_cromossomo_detalhado(
 
 
 # debug específico para cada regra individual - 1 a 15 // retorna um dicionário com análise detalhada da regra específica
-def debug_regra_especifica(cromossomo: List[Tuple], numero_regra: int) -> dict:
+def debug_regra_especifica(cromossomo: Cromossomo, numero_regra: int) -> dict:
 
     descricoes_regras = {
         1: "O Norueguês vive na primeira casa",
@@ -528,12 +555,8 @@ def debug_regra_especifica(cromossomo: List[Tuple], numero_regra: int) -> dict:
 
     # Análise para regra 14 regras críticas
     elif numero_regra == 14:  # Norueguês vizinho da casa Azul
-        pos_noruegues = next(
-            (i for i, casa in enumerate(cromossomo) if casa[1] == "Norueguês"), -1
-        )
-        pos_azul = next(
-            (i for i, casa in enumerate(cromossomo) if casa[0] == "Azul"), -1
-        )
+        pos_noruegues = coluna(cromossomo, NACIONALIDADE).find(NORUEGUES)
+        pos_azul = coluna(cromossomo, COR).find(AZUL)
         analise["detailed_analysis"] = (
             f"Norueguês na posição {pos_noruegues+1 if pos_noruegues != -1 else 'N/A'}, "
             f"Casa Azul na posição {pos_azul+1 if pos_azul != -1 else 'N/A'}"
@@ -543,7 +566,7 @@ def debug_regra_especifica(cromossomo: List[Tuple], numero_regra: int) -> dict:
 
 
 # imprime representação visual limpa do cromossomo para análise
-def imprimir_cromossomo_visual(cromossomo: List[Tuple]) -> None:
+def imprimir_cromossomo_visual(cromossomo: Cromossomo) -> None:
 
     print("\nCONFIGURAÇÃO DAS CASAS:")
     print("-" * 80)
@@ -552,7 +575,7 @@ def imprimir_cromossomo_visual(cromossomo: List[Tuple]) -> None:
     )
     print("-" * 80)
 
-    for i, casa in enumerate(cromossomo, 1):
+    for i, casa in enumerate(decodificar(cromossomo), 1):
         cor, nacionalidade, bebida, cigarro, animal = casa
         print(
             f"{i:<6} {cor:<10} {nacionalidade:<12} {bebida:<8} {cigarro:<12} {animal:<10}"
@@ -562,7 +585,7 @@ def imprimir_cromossomo_visual(cromossomo: List[Tuple]) -> None:
 
 # analise dos melhores indivíduos da população
 def analise_profunda_populacao(
-    populacao: List[List[Tuple]], funcao_fitness: Callable, top_n: int = 5
+    populacao: List[Cromossomo], funcao_fitness: Callable, top_n: int = 5
 ) -> None:
     print(f"\nANÁLISE APROFUNDADA DOS TOP {top_n} INDIVÍDUOS:")
     print("=" * 60)
@@ -577,7 +600,7 @@ def analise_profunda_populacao(
         analise = analisar_cromossomo_detalhado(cromossomo, funcao_fitness)
 
         # mostra configuração compacta
-        for j, casa in enumerate(cromossomo, 1):
+        for j, casa in enumerate(analise["configuracao"], 1):
             print(
                 f"Casa {j}: {casa[0]:<8} {casa[1]:<10} {casa[2]:<6} {casa[3]:<10} {casa[4]}"
             )
@@ -587,20 +610,20 @@ def analise_profunda_populacao(
 
 
 # apresenta a solução final
-def mostrar_solucao(cromossomo: List[Tuple]) -> None:
+def mostrar_solucao(cromossomo: Cromossomo) -> None:
     print("\nSOLUÇÃO ENCONTRADA:")
     print("=" * 50)
 
     imprimir_cromossomo_visual(cromossomo)
-    for i, casa in enumerate(cromossomo, 1):
+    for i, casa in enumerate(decodificar(cromossomo), 1):
         if casa[4] == "Peixes":
             print(f"\nRESPOSTA: O {casa[1]} possui os Peixes (Casa {i})")
             break
 
 
 def correcao_controlada_regra5(
-    cromossomo: List[Tuple], tentativas: int = 50
-) -> List[Tuple]:
+    cromossomo: Cromossomo, tentativas: int = 50
+) -> Cromossomo:
     melhor_cromossomo = cromossomo
 
     for _ in range(tentativas):
@@ -615,8 +638,8 @@ def correcao_controlada_regra5(
 
 # solucionador de emergência para casos extremos da Regra 5
 def solucionador_emergencia_regra5(
-    cromossomo: List[Tuple], funcao_fitness: Callable
-) -> List[Tuple]:
+    cromossomo: Cromossomo, funcao_fitness: Callable
+) -> Cromossomo:
 
     configuracoes_candidatas = forca_bruta_regra5(cromossomo, funcao_fitness)
 
@@ -634,7 +657,7 @@ def solucionador_emergencia_regra5(
 
 # debug fail final, falhas persistentes na regra 5
 def ultra_debug_falha_mutacao(
-    cromossomo: List[Tuple],
+    cromossomo: Cromossomo,
     funcao_fitness: Callable,
     regra_problema: int,
     tentativas: int = 1000,
@@ -669,7 +692,7 @@ def ultra_debug_falha_mutacao(
 
 # analisa se a população está em estagnação (convergência prematura), retorna True se está estagnada
 def analisar_estagnacao_populacao(
-    populacao: List[List[Tuple]], funcao_fitness: Callable
+    populacao: List[Cromossomo], funcao_fitness: Callable
 ) -> bool:
     fitness_values = [funcao_fitness(cromossomo) for cromossomo in populacao]
     fitness_maximo = max(fitness_values)
@@ -678,7 +701,7 @@ def analisar_estagnacao_populacao(
     count_maximo = fitness_values.count(fitness_maximo)
 
     # calcula diversidade única
-    configuracoes_unicas = len(set(str(cromossomo) for cromossomo in populacao))
+    configuracoes_unicas = len(set(populacao))
     percentual_diversidade = configuracoes_unicas / len(populacao)
 
     # critérios de estagnação
@@ -692,8 +715,8 @@ def analisar_estagnacao_populacao(
 
 # estratégia de explosão de diversidade para escape de ótimos locais, cria nova população diversificada mantendo algumas cópias da melhor solução
 def explosao_diversidade(
-    melhor_cromossomo: List[Tuple], tamanho_populacao: int, funcao_fitness: Callable
-) -> List[List[Tuple]]:
+    melhor_cromossomo: Cromossomo, tamanho_populacao: int, funcao_fitness: Callable
+) -> List[Cromossomo]:
     nova_populacao = []
 
     # preserva algumas cópias do melhor cromossomo (5%)
@@ -709,18 +732,17 @@ def explosao_diversidade(
             variacao = mutacao(variacao, 0.8)
         nova_populacao.append(variacao)
 
-    # preenche resto com cromossomos completamente aleatórios (65%)
+    # preenche resto com cromossomos aleatórios dos domínios reduzidos (65%)
     restantes = tamanho_populacao - len(nova_populacao)
-    for _ in range(restantes):
-        nova_populacao.append(cromossomo_aleatorio())
+    nova_populacao.extend(amostrar_reduzidos(restantes))
 
     return nova_populacao
 
 
 # força variações específicas focadas em resolver uma regra particular
 def forcar_variacoes_regra_especifica(
-    cromossomo: List[Tuple], regra_numero: int, quantidade: int
-) -> List[List[Tuple]]:
+    cromossomo: Cromossomo, regra_numero: int, quantidade: int
+) -> List[Cromossomo]:
     variacoes = []
 
     for _ in range(quantidade):
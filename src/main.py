@@ -6,17 +6,25 @@ Prof. Tiago Bonini Borchartt
 VERSÃO 2.0
 """
 
+import argparse
 import time
 import random
-import copy
-from typing import List
-
+from dataclasses import asdict, replace
+from time import perf_counter_ns
+
+from cromossomo import (
+    COR,
+    VERDE,
+    BRANCA,
+    AMARELA,
+    AZUL,
+    VERMELHA,
+    desempacotar,
+    empacotar,
+)
 from genetic_algorithm import (
-    cromossomo_aleatorio,
     mutacao,
     cruzamento,
-    selecao_hibrida,
-    selecao_torneio,
     mutacao_inteligente,
     mutacao_dirigida,
     busca_local,
@@ -27,46 +35,158 @@ from genetic_algorithm import (
     reparacao_intensiva_regra5,
     forca_bruta_regra5,
     analisar_cromossomo_detalhado,
-    debug_regra_especifica,
     imprimir_cromossomo_visual,
-    analise_profunda_populacao,
-    mostrar_solucao,
     correcao_controlada_regra5,
     solucionador_emergencia_regra5,
-    ultra_debug_falha_mutacao,
     analisar_estagnacao_populacao,
     explosao_diversidade,
     forcar_variacoes_regra_especifica,
 )
+from amostrador_pais import AmostradorPais
+from configuracao_ag import (
+    BACKEND_FITNESS,
+    CAMINHO_PONTO_CONTROLE,
+    FITNESS_ALVO,
+    INTERVALO_PONTO_CONTROLE,
+    LIMITE_AVALIACOES,
+    LIMITE_GERACOES,
+    MODO_BUSCA_LOCAL,
+    PERFIL_FASES,
+    TEMPO_MAXIMO,
+    ConfiguracaoAG,
+    InstantaneoGeracao,
+    ResultadoAG,
+)
+from avaliacao_lote import fitness_populacao, mascaras_lote
+from avaliacao_paralela import AvaliadorParalelo
+from operadores_permutacao import cruzamento_permutacao
+from ranking_populacao import RankingPopulacao
+from cache_fitness import CacheFitness
+from busca_trajetoria import RESFRIAMENTOS, BuscaTabu, RecozimentoSimulado
+from eda_permutacoes import AlgoritmoEDA
+from modelo_ilhas import TOPOLOGIAS, ModeloIlhas
+from perfil_fases import PASSO_AMOSTRA_PARES, PerfilDesligado, PerfilFases
+from orcamento import PASSO_VERIFICACAO_PARES, Orcamento
+from ponto_controle import carregar_ponto_controle, salvar_ponto_controle
+from relatorio_console import RelatorioConsole
+from busca_vizinhanca import (
+    MODOS_BUSCA_LOCAL,
+    novas_estatisticas_busca,
+)
+from completacao_exata import completar_exato
+from dominios_reduzidos import amostrar_reduzidos
+from solucionador_exato import resolver_exato, verificar_solucoes
 from einstein_rules import (
+    backend_fitness,
+    definir_backend_fitness,
+    avaliar,
+    contar_regras,
+    regras_faltantes_mascara,
     fitness,
     fitness_ponderado,
-    obter_regras_faltantes,
-    relatorio_detalhado_fitness,
-    pontuacoes_parciais_fitness,
 )
 
-# CONFIG DO ALGORITMO GENÉTICO
-TAMANHO_POPULACAO_BASE = 1800
-TAXA_CRUZAMENTO_BASE = 0.85
-TAXA_MUTACAO_BASE = 0.15
-TAMANHO_MAXIMO_POPULACAO = 5000
+# motores disponíveis no ponto de entrada (--motor)
+MOTORES = ("ag", "exato", "tabu", "recozimento", "eda", "ilhas")
 
 
 class AlgoritmoGeneticoAvancado:
 
-    def __init__(self):
-        self.tamanho_populacao = TAMANHO_POPULACAO_BASE
-        self.taxa_cruzamento = TAXA_CRUZAMENTO_BASE
-        self.taxa_mutacao = TAXA_MUTACAO_BASE
+    # `configuracao` (ConfiguracaoAG) com campos sobrescritos pelos argumentos nomeados,
+    # ex.: AlgoritmoGeneticoAvancado(operador_cruzamento="pmx") // callbacks: funções
+    # (evento, dados) chamadas a cada etapa; sem callbacks a execução é silenciosa //
+    # ponto_controle: estado lido por carregar_ponto_controle, de onde a execução continua
+    def __init__(
+        self,
+        configuracao=None,
+        callbacks=None,
+        migracao=None,
+        evento_parada=None,
+        ponto_controle=None,
+        **parametros,
+    ):
+        configuracao = replace(configuracao or ConfiguracaoAG(), **parametros)
+        if migracao is not None and configuracao.caminho_ponto_controle is not None:
+            raise ValueError("Pontos de controle não cobrem a migração entre ilhas")
+        self.configuracao = configuracao
+        self.callbacks = list(callbacks or ())
+        self.resultado = None
+        self.ponto_controle = ponto_controle
+
+        self.operador_cruzamento = configuracao.operador_cruzamento
+        self.modo_busca_local = configuracao.modo_busca_local
+        self.estatisticas_busca_local = novas_estatisticas_busca()
+
+        self.limiar_completacao_exata = configuracao.limiar_completacao_exata
+        self.limite_combinacoes_completacao = (
+            configuracao.limite_combinacoes_completacao
+        )
+        self.completacoes_tentadas = set()
+        self.avaliacoes_completacao = 0
+
+        self.perfil = PerfilFases() if configuracao.perfil_fases else PerfilDesligado()
+
+        # ganchos do modelo de ilhas: migracao(geracao, populacao_ordenada) devolve os
+        # imigrantes que substituem os piores; evento_parada (is_set) interrompe a execução
+        self.migracao = migracao
+        self.evento_parada = evento_parada
+        # Orcamento da execução em andamento (None sem limites além das gerações)
+        self.orcamento = None
+
+        self.tamanho_populacao = configuracao.tamanho_populacao
+        self.taxa_cruzamento = configuracao.taxa_cruzamento
+        self.taxa_mutacao = configuracao.taxa_mutacao
 
         self.geracoes_sem_melhoria = 0
         self.melhor_fitness_atual = 0
         self.geracoes_no_fitness_14 = 0
         self.geracoes_no_fitness_13 = 0
 
-        self.historico_fitness = []
-        self.historico_diversidade = []
+        self.geracoes_executadas = 0
+        # primeira vez em que cada melhor fitness global foi atingido: (geração, segundos)
+        self.marcos_fitness = {}
+
+        # avaliação em lote dividida entre processos (memória compartilhada)
+        if configuracao.trabalhadores_fitness:
+            self.avaliador_paralelo = AvaliadorParalelo(
+                configuracao.trabalhadores_fitness,
+                configuracao.limiar_fitness_paralelo,
+            )
+            mascaras_populacao = self.avaliador_paralelo.mascaras
+            fitness_lote = self.avaliador_paralelo.fitness_populacao
+        else:
+            self.avaliador_paralelo = None
+            mascaras_populacao = mascaras_lote
+            fitness_lote = fitness_populacao
+
+        # memoização opcional das avaliações (chave = cromossomo empacotado)
+        if configuracao.usar_cache_fitness:
+            self.cache_fitness = CacheFitness(
+                configuracao.tamanho_cache_fitness, mascaras_populacao
+            )
+            self.fitness = self.cache_fitness.fitness
+            self.avaliar = self.cache_fitness.avaliar
+            self.fitness_populacao = self.cache_fitness.fitness_populacao
+        else:
+            # sem cache, as avaliações são contadas aqui (orçamento e ResultadoAG)
+            self.cache_fitness = None
+            self.avaliacoes_diretas = 0
+            self._fitness_lote = fitness_lote
+            self.fitness = self._fitness_direto
+            self.avaliar = self._avaliar_direto
+            self.fitness_populacao = self._fitness_populacao_direto
+
+    def _fitness_direto(self, cromossomo):
+        self.avaliacoes_diretas += 1
+        return fitness(cromossomo)
+
+    def _avaliar_direto(self, cromossomo):
+        self.avaliacoes_diretas += 1
+        return avaliar(cromossomo)
+
+    def _fitness_populacao_direto(self, populacao):
+        self.avaliacoes_diretas += len(populacao)
+        return self._fitness_lote(populacao)
 
     # adaptação dinâmica dos parâmetros do algoritmo baseada no progresso
     # estrategia: intensificação vs diversificação // para alto fitness: intensificação (busca local intensiva)
@@ -76,7 +196,8 @@ class AlgoritmoGeneticoAvancado:
         # fase de intensificação quando chega nos 14
         if melhor_fitness >= 14:
             self.tamanho_populacao = min(
-                TAMANHO_MAXIMO_POPULACAO, self.tamanho_populacao + 100
+                self.configuracao.tamanho_maximo_populacao,
+                self.tamanho_populacao + 100,
             )
             self.taxa_mutacao = 0.4  # mutação intensiva para escape de ótimos locais
             self.taxa_cruzamento = 0.95
@@ -108,116 +229,203 @@ class AlgoritmoGeneticoAvancado:
     # 70% população aleatória (exploração) // estratégia 1: população aleatória para exploração ampla
     # 20% população com heurísticas (satisfaz regras fáceis) // estratégia 2: população com heurísticas aplicadas
     # 10% população híbrida
+    # novos indivíduos (população inicial e imigrantes) sorteados em lote nos domínios
+    # reduzidos: todos válidos e já satisfazendo as regras 1, 5 e 9
     def criar_populacao_especializada(self, tamanho):
-        populacao = []
-        individuos_aleatorios = int(tamanho * 0.7)
-        populacao.extend([cromossomo_aleatorio() for _ in range(individuos_aleatorios)])
-
-        individuos_heuristicos = int(tamanho * 0.2)
-        for _ in range(individuos_heuristicos):
-            cromossomo = cromossomo_aleatorio()
-            # Aplica heurística: Regra 1 (Norueguês na primeira casa)
-            casas = [list(casa) for casa in cromossomo]
-            for i, casa in enumerate(casas):
-                if casa[1] == "Norueguês":
-                    casas[0][1], casas[i][1] = casas[i][1], casas[0][1]
-                    break
-
-            casas[2][2] = "Leite"
-
-            cromossomo = [tuple(casa) for casa in casas]
-            populacao.append(cromossomo)
-
-        restantes = tamanho - len(populacao)
-        populacao.extend([cromossomo_aleatorio() for _ in range(restantes)])
-
-        return populacao
+        return amostrar_reduzidos(tamanho)
 
+    # roda até o fim e devolve (cromossomo, fitness); o ResultadoAG fica em self.resultado
     def executar(self):
-        print("=" * 80)
-        print("🧬 ALGORITMO GENÉTICO PARA O DESAFIO LÓGICO DE EINSTEIN")
-        print("=" * 80)
-        print("OBJETIVO: Resolver o puzzle de satisfação de 15 restrições")
-        print("METODOLOGIA: Algoritmo Genético com Estratégias Adaptativas")
-        print("LIMITE COMPUTACIONAL: 1000 gerações")
-        print("CRITÉRIO DE SUCESSO: Fitness = 15/15 (todas as regras satisfeitas)")
-        print("=" * 80)
-
+        for _ in self.evoluir():
+            pass
+        return self.resultado.cromossomo, self.resultado.fitness
+
+    # laço de gerações como gerador: entrega um InstantaneoGeracao por geração e, ao
+    # terminar, devolve (cromossomo, fitness) // fechar o gerador encerra a execução
+    # como interrompida; em qualquer saída o pool e a memória compartilhada da
+    # avaliação paralela são liberados (recriados se o AG rodar de novo) // o backend
+    # de fitness da configuração vale só enquanto o AG roda: quem consome os yields
+    # (e quem chamou, ao fim) continua com o backend que tinha
+    def evoluir(self):
+        backend = self.configuracao.backend_fitness
+        backend_externo = backend_fitness()
+        definir_backend_fitness(backend)
+        geracoes = self._geracoes()
+        try:
+            while True:
+                try:
+                    instantaneo = next(geracoes)
+                except StopIteration as fim:
+                    return fim.value
+                definir_backend_fitness(backend_externo)
+                try:
+                    yield instantaneo
+                finally:
+                    backend_externo = backend_fitness()
+                    definir_backend_fitness(backend)
+        finally:
+            geracoes.close()
+            definir_backend_fitness(backend_externo)
+            if self.avaliador_paralelo is not None:
+                self.avaliador_paralelo.fechar()
+
+    def _geracoes(self):
         tempo_inicio = time.time()
-        LIMITE_GERACOES = 1000
-
-        print("\n🚀 FASE 1: INICIALIZAÇÃO DA POPULAÇÃO DIVERSIFICADA")
-        populacao = self.criar_populacao_especializada(self.tamanho_populacao)
-        print(f"   População inicial criada: {len(populacao)} indivíduos")
+        configuracao = self.configuracao
+        estado = self.ponto_controle
+        if estado is not None:
+            tempo_inicio -= estado["tempo_decorrido"]
+
+        # limites consultados também dentro da geração (busca local, laço de descendentes)
+        if (
+            configuracao.tempo_maximo is None
+            and configuracao.limite_avaliacoes is None
+            and self.evento_parada is None
+        ):
+            self.orcamento = None
+        else:
+            tempo_maximo = configuracao.tempo_maximo
+            if tempo_maximo is not None:
+                tempo_maximo -= time.time() - tempo_inicio
+            self.orcamento = Orcamento(
+                tempo_maximo,
+                configuracao.limite_avaliacoes,
+                self.evento_parada,
+                self.avaliacoes_realizadas,
+            )
+        orcamento = self.orcamento
 
-        geracao = 0
-        melhor_fitness_global = 0
-        melhor_cromossomo_global = None
-        tempo_atingiu_14 = None
+        if estado is None:
+            populacao = self.criar_populacao_especializada(self.tamanho_populacao)
+            self._notificar("inicio", algoritmo=self, populacao=populacao)
 
-        print("\n📊 EVOLUÇÃO DO ALGORITMO:")
-        print(
-            "   Geração | Fitness | Tamanho Pop | Diversidade | Tempo | Status Evolutivo"
+            geracao = 0
+            melhor_fitness_global = 0
+            melhor_cromossomo_global = None
+            tempo_atingiu_14 = None
+            percentual_diversidade = 100.0
+        else:
+            self._restaurar(estado)
+            populacao = list(estado["populacao"])
+            self._notificar("inicio", algoritmo=self, populacao=populacao)
+            self._notificar("retomada", geracao=estado["geracao"])
+            # o random volta por último: nada entre a gravação e este ponto o consome
+            random.setstate(estado["estado_random"])
+
+            geracao = estado["geracao"] - 1  # a geração gravada ainda não foi executada
+            melhor_fitness_global = estado["melhor_fitness_global"]
+            melhor_cromossomo_global = estado["melhor_cromossomo"]
+            tempo_atingiu_14 = estado["tempo_atingiu_14"]
+            percentual_diversidade = estado["percentual_diversidade"]
+        proximo_ponto_controle = time.perf_counter() + (
+            configuracao.intervalo_ponto_controle
         )
-        print("-" * 85)
 
         while True:
             geracao += 1
+            self.perfil.iniciar_geracao()
+
+            motivo_parada = None
+            if geracao > configuracao.limite_geracoes:
+                motivo_parada = "limite_geracoes"
+            elif orcamento is not None:
+                motivo_parada = orcamento.esgotado(ler_evento=True)
+            if motivo_parada is not None:
+                return self._finalizar(
+                    melhor_cromossomo_global,
+                    melhor_fitness_global,
+                    motivo_parada,
+                    tempo_inicio,
+                    populacao,
+                    percentual_diversidade,
+                )
 
-            if geracao > LIMITE_GERACOES:
-                tempo_total = time.time() - tempo_inicio
-                print(
-                    f"\n⏰ EXPERIMENTO CONCLUÍDO: {LIMITE_GERACOES} gerações executadas"
+            # início de geração completo (sem saídas pelo meio por orçamento): o estado
+            # aqui é exatamente o que a execução contínua teria
+            if (
+                configuracao.caminho_ponto_controle is not None
+                and time.perf_counter() >= proximo_ponto_controle
+            ):
+                tamanho = salvar_ponto_controle(
+                    configuracao.caminho_ponto_controle,
+                    self._estado(
+                        geracao,
+                        populacao,
+                        melhor_cromossomo_global,
+                        melhor_fitness_global,
+                        tempo_atingiu_14,
+                        percentual_diversidade,
+                        time.time() - tempo_inicio,
+                    ),
                 )
-                print(f"   Melhor fitness encontrada: {melhor_fitness_global}/15")
-                print(f"   Tempo computacional total: {tempo_total:.1f} segundos")
-                print(f"   Eficiência: {tempo_total/geracao:.3f}s por geração")
-
-                if melhor_fitness_global == 14:
-                    regras_faltantes = obter_regras_faltantes(melhor_cromossomo_global)
-                    print(
-                        f"   Análise final: Faltou satisfazer apenas a Regra {regras_faltantes[0]}"
-                    )
-                    print("\nCONFIGURAÇÃO FINAL:")
-                    imprimir_cromossomo_visual(melhor_cromossomo_global)
+                self._notificar(
+                    "ponto_controle",
+                    geracao=geracao,
+                    caminho=configuracao.caminho_ponto_controle,
+                    tamanho=tamanho,
+                )
+                proximo_ponto_controle = (
+                    time.perf_counter() + configuracao.intervalo_ponto_controle
+                )
+                self.perfil.marcar("ponto_controle")
 
-                return melhor_cromossomo_global, melhor_fitness_global
+            valores_fitness = self.fitness_populacao(populacao)
+            self.perfil.marcar("avaliacao")
 
-            valores_fitness = [fitness(cromossomo) for cromossomo in populacao]
+            # ordenação por fitness (seleção por ranking) via baldes de fitness, O(n)
+            ranking = RankingPopulacao(populacao, valores_fitness)
+            populacao, valores_fitness = ranking.ordenada()
+            self.perfil.marcar("ranking")
 
-            # ordenação por fitness (seleção por ranking)
-            indices_ordenados = sorted(
-                range(len(populacao)), key=lambda i: valores_fitness[i], reverse=True
+            # completação exata: congela as colunas do melhor e enumera as demais
+            completado = self._tentar_completacao_exata(
+                populacao[0], valores_fitness[0]
             )
-            populacao = [populacao[i] for i in indices_ordenados]
-            valores_fitness = [valores_fitness[i] for i in indices_ordenados]
+            if completado is not None:
+                populacao.append(completado[0])
+                valores_fitness.append(completado[1])
+                ranking = RankingPopulacao(populacao, valores_fitness)
+                populacao, valores_fitness = ranking.ordenada()
+            self.perfil.marcar("completacao_exata")
+
+            # migração entre ilhas: os imigrantes recebidos entram no lugar dos piores
+            if self.migracao is not None:
+                imigrantes = self.migracao(geracao, populacao)[: len(populacao) // 2]
+                if imigrantes:
+                    populacao = populacao[: len(populacao) - len(imigrantes)]
+                    populacao.extend(imigrantes)
+                    valores_fitness = self.fitness_populacao(populacao)
+                    ranking = RankingPopulacao(populacao, valores_fitness)
+                    populacao, valores_fitness = ranking.ordenada()
+                self.perfil.marcar("migracao")
 
             # análise estatística da geração atual
             melhor_cromossomo = populacao[0]
-            melhor_fitness = valores_fitness[0]
-            fitness_media = sum(valores_fitness) / len(valores_fitness)
-            diversidade_populacional = len(
-                set(str(cromossomo) for cromossomo in populacao)
-            )
+            melhor_fitness = ranking.melhor_fitness
+            fitness_media = ranking.media()
+            diversidade_populacional = len(set(populacao))
             percentual_diversidade = (diversidade_populacional / len(populacao)) * 100
             tempo_decorrido = time.time() - tempo_inicio
 
-            # att do histórico acadêmico
-            self.historico_fitness.append(melhor_fitness)
-            self.historico_diversidade.append(percentual_diversidade)
+            self.geracoes_executadas = geracao
+            self.perfil.marcar("diversidade")
 
             # controle de progresso evolutivo
             if melhor_fitness > melhor_fitness_global:
                 melhor_fitness_global = melhor_fitness
-                melhor_cromossomo_global = copy.deepcopy(melhor_cromossomo)
+                melhor_cromossomo_global = melhor_cromossomo
                 self.geracoes_sem_melhoria = 0
+                self.marcos_fitness[melhor_fitness] = (geracao, tempo_decorrido)
 
                 if melhor_fitness == 14 and tempo_atingiu_14 is None:
                     tempo_atingiu_14 = tempo_decorrido
                     self.geracoes_no_fitness_14 = 0
-                    print(
-                        f"\n🎯 MARCO : Fitness 14/15 atingido em {tempo_decorrido:.1f}s!"
-                    )
+                self._notificar(
+                    "marco",
+                    geracao=geracao,
+                    fitness=melhor_fitness,
+                    tempo=tempo_decorrido,
+                )
             else:
                 self.geracoes_sem_melhoria += 1
 
@@ -228,343 +436,162 @@ class AlgoritmoGeneticoAvancado:
                 self.geracoes_no_fitness_14 += 1
 
             self.adaptar_parametros(melhor_fitness, diversidade_populacional)
-
-            if melhor_fitness == 15:
-                tempo_total = time.time() - tempo_inicio
-                print(f"\n" + "🎉" * 20)
-                print("✅ SOLUÇÃO ÓTIMA ENCONTRADA!")
-                print("🎉" * 20)
-                print("=" * 80)
-                print("🏆 RESULTADO : Problema de Satisfação de Restrições RESOLVIDO")
-                print("=" * 80)
-
-                print(f"\n📈 MÉTRICAS DE PERFORMANCE COMPUTACIONAL:")
-                print(f"   • Tempo de convergência: {tempo_total:.2f} segundos")
-                print(f"   • Gerações necessárias: {geracao:,}")
-                print(
-                    f"   • Eficiência computacional: {tempo_total/geracao:.3f}s por geração"
+            self.perfil.marcar("adaptacao")
+
+            try:
+                yield InstantaneoGeracao(
+                    geracao=geracao,
+                    melhor_fitness=melhor_fitness,
+                    melhor_cromossomo=melhor_cromossomo,
+                    fitness_media=fitness_media,
+                    histograma=tuple(ranking.contagem),
+                    diversidade=percentual_diversidade,
+                    tamanho_populacao=len(populacao),
+                    tempo=tempo_decorrido,
+                    avaliacoes=self.avaliacoes_realizadas(),
                 )
-                print(f"   • Tamanho final da população: {len(populacao):,} indivíduos")
-                print(f"   • Diversidade final: {percentual_diversidade:.1f}%")
-                print(f"   • Taxa de mutação final: {self.taxa_mutacao*100:.1f}%")
-                print(f"   • Taxa de cruzamento final: {self.taxa_cruzamento*100:.1f}%")
-
-                if tempo_atingiu_14:
-                    print(f"   • Tempo para atingir 14/15: {tempo_atingiu_14:.2f}s")
-                    print(
-                        f"   • Tempo para otimização final (14→15): {tempo_total - tempo_atingiu_14:.2f}s"
-                    )
-                    print(
-                        f"   • Eficiência da fase final: {((tempo_total - tempo_atingiu_14)/1):.2f}s"
-                    )
-
-                print(f"\n🏠 CONFIGURAÇÃO DA SOLUÇÃO ENCONTRADA:")
-                print("=" * 80)
-                print("✨ Todas as 15 regras do Desafio de Einstein foram satisfeitas!")
-                print("=" * 80)
-
-                print(f"\n📋 TABELA COMPLETA DA SOLUÇÃO:")
-                print("┌" + "─" * 78 + "┐")
-                print(
-                    "│"
-                    + "CASA │ COR       │ NACIONALIDADE │ BEBIDA  │ CIGARRO    │ ANIMAL    │".center(
-                        78
-                    )
-                    + "│"
+            except GeneratorExit:
+                self._finalizar(
+                    melhor_cromossomo_global,
+                    melhor_fitness_global,
+                    "interrompida",
+                    tempo_inicio,
+                    populacao,
+                    percentual_diversidade,
                 )
-                print("├" + "─" * 78 + "┤")
-
-                for i, casa in enumerate(melhor_cromossomo, 1):
-                    cor, nacionalidade, bebida, cigarro, animal = casa
-                    linha = f"│ {i:2d}   │ {cor:9s} │ {nacionalidade:13s} │ {bebida:7s} │ {cigarro:10s} │ {animal:9s} │"
-                    print(linha)
-
-                print("└" + "─" * 78 + "┘")
-
-                print(f"\n✅ VERIFICAÇÃO DETALHADA DAS 15 REGRAS:")
-                print("=" * 80)
-
-                regras_descricoes = [
-                    "R1: O Norueguês vive na primeira casa",
-                    "R2: O Inglês vive na casa Vermelha",
-                    "R3: O Sueco tem Cachorros",
-                    "R4: O Dinamarquês bebe Chá",
-                    "R5: A casa Verde fica do lado esquerdo da casa Branca",
-                    "R6: O homem que vive na casa Verde bebe Café",
-                    "R7: O homem que fuma Pall Mall cria Pássaros",
-                    "R8: O homem que vive na casa Amarela fuma Dunhill",
-                    "R9: O homem que vive na casa do meio bebe Leite",
-                    "R10: O homem que fuma Blends vive ao lado do que tem Gatos",
-                    "R11: O homem que cria Cavalos vive ao lado do que fuma Dunhill",
-                    "R12: O homem que fuma BlueMaster bebe Cerveja",
-                    "R13: O Alemão fuma Prince",
-                    "R14: O Norueguês vive ao lado da casa Azul",
-                    "R15: O homem que fuma Blends é vizinho do que bebe Água",
-                ]
-
-                from einstein_rules import REGRAS
+                raise
+            # o tempo parado no yield é do consumidor, não de uma fase do AG
+            self.perfil.descartar()
 
-                for i, (regra, descricao) in enumerate(zip(REGRAS, regras_descricoes)):
-                    status = (
-                        "✅ SATISFEITA"
-                        if regra(melhor_cromossomo)
-                        else "❌ NÃO SATISFEITA"
-                    )
-                    print(f"{descricao:55s} {status}")
-
-                # RESPOSTA
-                print(f"\n🐟 RESPOSTA AO DESAFIO LÓGICO DE EINSTEIN:")
-                print("=" * 50)
-                for posicao, casa in enumerate(melhor_cromossomo, 1):
-                    if casa[4] == "Peixes":
-                        print(f"🎯 RESPOSTA FINAL: O {casa[1]} possui os Peixes!")
-                        print(f"   → Localização: Casa {posicao}")
-                        print(f"   → Características completas da casa:")
-                        print(f"     • Cor: {casa[0]}")
-                        print(f"     • Nacionalidade: {casa[1]}")
-                        print(f"     • Bebida: {casa[2]}")
-                        print(f"     • Cigarro: {casa[3]}")
-                        print(f"     • Animal: {casa[4]}")
-                        break
-
-                print(f"\n🔬 ANÁLISE DETALHADA:")
-                print("=" * 50)
-
-                relatorio_detalhado = relatorio_detalhado_fitness(melhor_cromossomo)
-                pontuacoes_parciais = pontuacoes_parciais_fitness(melhor_cromossomo)
-
-                print(
-                    f"   • Fitness total alcançado: {relatorio_detalhado['score']}/15 (100%)"
-                )
-                print(
-                    f"   • Fitness ponderado: {relatorio_detalhado['weighted_score']:.1f}"
+            if melhor_fitness == 15:
+                return self._finalizar(
+                    melhor_cromossomo,
+                    15,
+                    "solucao",
+                    tempo_inicio,
+                    populacao,
+                    percentual_diversidade,
                 )
-                print(f"   • Regras satisfeitas: {relatorio_detalhado['satisfied']}")
-                print(f"   • Análise por categorias:")
-
-                categorias_nomes = {
-                    "simples": "Regras Simples (atribuição direta)",
-                    "posicao": "Regras de Posição (localização fixa)",
-                    "sequencia": "Regras Sequenciais (ordem específica)",
-                    "vizinhanca": "Regras de Vizinhança (adjacência)",
-                }
-
-                for categoria, pontuacao in pontuacoes_parciais.items():
-                    nome_categoria = categorias_nomes.get(categoria, categoria)
-                    print(f"     → {nome_categoria}: {pontuacao}")
-
-                print(f"\n📈 HISTÓRICO DE EVOLUÇÃO DO ALGORITMO:")
-                print("=" * 50)
-
-                fitness_marcos = {}
-                for i, fitness_hist in enumerate(self.historico_fitness):
-                    if fitness_hist not in fitness_marcos:
-                        fitness_marcos[fitness_hist] = i + 1
-
-                print(f"   • Marcos de fitness atingidos:")
-                for fitness_val in sorted(fitness_marcos.keys()):
-                    geracao_marco = fitness_marcos[fitness_val]
-                    percentual = (fitness_val / 15) * 100
-                    print(
-                        f"     → Fitness {fitness_val:2d}/15 ({percentual:5.1f}%): Geração {geracao_marco:4d}"
-                    )
 
-                print(f"\n🧠 ESTRATÉGIAS DE ALGORITMO GENÉTICO UTILIZADAS:")
-                print("=" * 50)
-                print(f"   • Seleção Híbrida: Combinação de torneio e roleta")
-                print(f"   • Mutação Inteligente: Adaptativa baseada no fitness")
-                print(f"   • Cruzamento Avançado: Uniforme com reparo automático")
-                print(f"   • Busca Local: Hill-climbing para refinamento")
-                print(
-                    f"   • Adaptação Paramétrica: Taxas dinâmicas baseadas no progresso"
-                )
-                print(
-                    f"   • Diversificação: Explosão populacional para escape de ótimos locais"
+            if (
+                configuracao.fitness_alvo is not None
+                and melhor_fitness_global >= configuracao.fitness_alvo
+            ):
+                return self._finalizar(
+                    melhor_cromossomo_global,
+                    melhor_fitness_global,
+                    "fitness_alvo",
+                    tempo_inicio,
+                    populacao,
+                    percentual_diversidade,
                 )
-                print(f"   • Elite Preservation: Preservação dos melhores indivíduos")
-                print(
-                    f"   • Mutação Dirigida: Foco em regras específicas não satisfeitas"
-                )
-
-                print("=" * 80)
 
-                return melhor_cromossomo, 15
-
-            # Logging
-            deve_registrar_log = (
-                geracao % 25 == 0
-                or geracao < 50
-                or melhor_fitness >= 13
-                or self.geracoes_sem_melhoria % 200 == 0
+            self._notificar(
+                "geracao",
+                geracao=geracao,
+                populacao=populacao,
+                ranking=ranking,
+                melhor_cromossomo=melhor_cromossomo,
+                melhor_fitness=melhor_fitness,
+                fitness_media=fitness_media,
+                percentual_diversidade=percentual_diversidade,
+                tempo=tempo_decorrido,
             )
-
-            if deve_registrar_log:
-                print(
-                    f"   {geracao:7d} | {melhor_fitness:2d}/15   | {len(populacao):6d} | {percentual_diversidade:8.1f}% | {tempo_decorrido:6.1f}s | ",
-                    end="",
-                )
-
-                # Status evolutivo
-                if melhor_fitness == 15:
-                    print("SOLUÇÃO ÓTIMA ENCONTRADA!")
-                elif melhor_fitness == 14:
-                    regras_faltantes = obter_regras_faltantes(melhor_cromossomo)
-
-                    if geracao % 10 == 0 or self.geracoes_no_fitness_14 == 1:
-                        regra_faltante = regras_faltantes[0]
-                        analise_regra = debug_regra_especifica(
-                            melhor_cromossomo, regra_faltante
-                        )
-
-                        print(f"Refinamento: Regra {regra_faltante} pendente")
-                        print(f"    Descrição: {analise_regra['description']}")
-                        print(f"    Análise: {analise_regra['detailed_analysis']}")
-
-                        if (
-                            self.geracoes_no_fitness_14 % 50 == 0
-                            and self.geracoes_no_fitness_14 > 0
-                        ):
-                            print(
-                                f"\nANÁLISE: Estagnação detectada na Regra {regra_faltante} ({self.geracoes_no_fitness_14} gerações)"
-                            )
-                            analise_profunda_populacao(populacao[:10], fitness, 3)
-                    else:
-                        regra_faltante = regras_faltantes[0]
-                        print(
-                            f"Otimização local: R{regra_faltante} | Parâmetros: Mut={self.taxa_mutacao*100:.0f}% | Pop={len(populacao)}"
-                        )
-
-                elif melhor_fitness == 13:
-                    regras_faltantes = obter_regras_faltantes(melhor_cromossomo)
-                    print(
-                        f"Convergência intermediária: {len(regras_faltantes)} regras pendentes ({self.geracoes_no_fitness_13} gerações)"
-                    )
-                elif melhor_fitness >= 11:
-                    tendencia = (
-                        "Progresso positivo"
-                        if self.geracoes_sem_melhoria < 100
-                        else "Estabilização"
-                    )
-                    print(
-                        f"Exploração: {tendencia} | Mutação={self.taxa_mutacao*100:.0f}%"
-                    )
-                else:
-                    print(
-                        f"Busca inicial | Mutação={self.taxa_mutacao*100:.0f}% | Fitness média={fitness_media:.1f}"
-                    )
+            self.perfil.marcar("registro")
 
             if melhor_fitness == 14:
-                regras_faltantes = obter_regras_faltantes(melhor_cromossomo)
+                regras_faltantes = regras_faltantes_mascara(
+                    self.avaliar(melhor_cromossomo)
+                )
                 regra_pendente = regras_faltantes[0] if regras_faltantes else None
 
                 if regra_pendente:
-                    # análise de convergência prematura
-                    if geracao % 25 == 0:
-                        print(f"\nANÁLISE DE CONVERGÊNCIA:")
-                        print(f"   Regra pendente: {regra_pendente}")
-                        regra_debug = debug_regra_especifica(
-                            melhor_cromossomo, regra_pendente
-                        )
-                        print(f"   {regra_debug['description']}")
-                        print(f"   {regra_debug['detailed_analysis']}")
-                        imprimir_cromossomo_visual(melhor_cromossomo)
-
-                    if self.geracoes_no_fitness_14 > 20:  # busca dirigida
-                        print(
-                            f"   {geracao:7d} | {melhor_fitness:2d}/15   | {len(populacao):6d} | {percentual_diversidade:3.0f}% | {tempo_decorrido:6.1f}s | Busca dirigida (Regra {regra_pendente})"
-                        )
+                    if self.geracoes_no_fitness_14 > 20:
+                        estrategia = "busca_dirigida"
+                    elif self.geracoes_no_fitness_14 > 50:
+                        estrategia = "busca_local"
+                    elif self.geracoes_no_fitness_14 > 100:
+                        estrategia = "escape"
+                    else:
+                        estrategia = None
+                    self._notificar(
+                        "resgate_14",
+                        geracao=geracao,
+                        melhor_cromossomo=melhor_cromossomo,
+                        regra_pendente=regra_pendente,
+                        estrategia=estrategia,
+                    )
 
+                    if estrategia == "busca_dirigida":
                         # mutação dirigida na elite
                         for i in range(min(50, len(populacao))):
-                            if fitness(populacao[i]) == 14:
-                                regras_falt = obter_regras_faltantes(populacao[i])
+                            mascara = self.avaliar(populacao[i])
+                            if contar_regras(mascara) == 14:
+                                regras_falt = regras_faltantes_mascara(mascara)
                                 if regras_falt:
                                     populacao[i] = mutacao_dirigida(
                                         populacao[i], regras_falt
                                     )
 
-                    elif self.geracoes_no_fitness_14 > 50:
-                        print(
-                            f"   {geracao:7d} | {melhor_fitness:2d}/15   | {len(populacao):6d} | {percentual_diversidade:3.0f}% | {tempo_decorrido:6.1f}s | Busca local intensiva (Regra {regra_pendente})"
-                        )
-
+                    elif estrategia == "busca_local":
                         for i in range(min(30, len(populacao))):
-                            if fitness(populacao[i]) == 14:
+                            if self.fitness(populacao[i]) == 14:
                                 candidato_melhorado = busca_local(
-                                    populacao[i], fitness, 30
+                                    populacao[i],
+                                    self.fitness,
+                                    30,
+                                    self.modo_busca_local,
+                                    self.estatisticas_busca_local,
+                                    orcamento,
+                                    incremental=True,
+                                    funcao_avaliar=self.avaliar,
                                 )
-                                if fitness(candidato_melhorado) > fitness(populacao[i]):
+                                if self.fitness(candidato_melhorado) > self.fitness(
+                                    populacao[i]
+                                ):
                                     populacao[i] = candidato_melhorado
 
-                    elif self.geracoes_no_fitness_14 > 100:
-                        print(
-                            f"   {geracao:7d} | {melhor_fitness:2d}/15   | {len(populacao):6d} | {percentual_diversidade:3.0f}% | {tempo_decorrido:6.1f}s | Estratégia de escape de ótimo local"
-                        )
-
+                    elif estrategia == "escape":
                         versoes_especializadas = (
-                            forca_bruta_regra5(melhor_cromossomo, fitness)
+                            forca_bruta_regra5(melhor_cromossomo, self.fitness)
                             if regra_pendente == 5
                             else []
                         )
 
                         if versoes_especializadas:
                             populacao.extend(versoes_especializadas[:50])
+            self.perfil.marcar("resgate_14")
+            if orcamento is not None and orcamento.esgotado():
+                continue  # orçamento esgotado: o início da próxima geração encerra
 
             if geracao % 50 == 0:
-                print(f"\nANÁLISE POPULACIONAL DETALHADA - GERAÇÃO {geracao}")
-                print(f"   Tamanho da população: {len(populacao)} indivíduos")
-                print(
-                    f"   Diversidade genética: {diversidade_populacional}/{len(populacao)} = {percentual_diversidade:.1f}%"
-                )
-                print(
-                    f"   Indivíduos de alta fitness (14/15): {sum(1 for f in valores_fitness if f == 14)}"
-                )
-                print(
-                    f"   Indivíduos de fitness intermediária (13/15): {sum(1 for f in valores_fitness if f == 13)}"
-                )
-                print(
-                    f"   Indivíduos de baixa fitness (<13): {sum(1 for f in valores_fitness if f < 13)}"
-                )
-
                 # análise de convergência prematura
                 solucoes_14 = [
-                    cromossomo for cromossomo in populacao if fitness(cromossomo) == 14
+                    cromossomo
+                    for cromossomo in populacao
+                    if self.fitness(cromossomo) == 14
                 ]
+                self._notificar(
+                    "analise_populacional",
+                    geracao=geracao,
+                    populacao=populacao,
+                    ranking=ranking,
+                    diversidade_populacional=diversidade_populacional,
+                    percentual_diversidade=percentual_diversidade,
+                    solucoes_14=solucoes_14,
+                )
                 if solucoes_14:
-                    regras_faltantes_distribuicao = {}
-                    for cromossomo in solucoes_14[:100]:
-                        regras_faltantes = obter_regras_faltantes(cromossomo)
-                        if regras_faltantes:
-                            regra_num = regras_faltantes[0]
-                            regras_faltantes_distribuicao[regra_num] = (
-                                regras_faltantes_distribuicao.get(regra_num, 0) + 1
-                            )
-
-                    configuracoes_unicas = set(
-                        str(cromossomo) for cromossomo in solucoes_14[:100]
-                    )
-                    print(
-                        f"   Configurações únicas (14/15): {len(configuracoes_unicas)}"
-                    )
-                    print(
-                        f"   Distribuição de regras pendentes: {regras_faltantes_distribuicao}"
-                    )
+                    configuracoes_unicas = set(solucoes_14[:100])
 
                     # detecção de convergência prematura
                     if len(configuracoes_unicas) < 10:
-                        print(f"   ALERTA ACADÊMICO: Convergência prematura detectada!")
-                        print(
-                            f"   Interpretação: População convergiu para soluções similares"
-                        )
+                        self._notificar("convergencia_prematura")
 
                         # teste de força bruta
                         if melhor_fitness == 14:
-                            print(f"\nEXPERIMENTO: Teste de otimalidade local")
-                            melhor_14 = max(solucoes_14, key=fitness)
-                            imprimir_cromossomo_visual(melhor_14)
-
-                            print(f"Testando configurações alternativas para escape:")
-                            candidato_teste = [list(casa) for casa in melhor_14]
+                            melhor_14 = max(solucoes_14, key=self.fitness)
+                            self._notificar("teste_otimalidade", cromossomo=melhor_14)
+                            candidato_teste = melhor_14
 
                             # teste sistemático das 4 configurações Verde-Branca
                             for pos_verde, pos_branca in [
@@ -573,12 +600,12 @@ class AlgoritmoGeneticoAvancado:
                                 (2, 3),
                                 (3, 4),
                             ]:
-                                copia_teste = [list(casa) for casa in candidato_teste]
+                                copia_teste = bytearray(candidato_teste)
 
-                                copia_teste[pos_verde][0] = "Verde"
-                                copia_teste[pos_branca][0] = "Branca"
+                                copia_teste[pos_verde * 5 + COR] = VERDE
+                                copia_teste[pos_branca * 5 + COR] = BRANCA
 
-                                outras_cores = ["Amarela", "Azul", "Vermelha"]
+                                outras_cores = [AMARELA, AZUL, VERMELHA]
                                 posicoes_restantes = [
                                     i
                                     for i in range(5)
@@ -587,32 +614,35 @@ class AlgoritmoGeneticoAvancado:
 
                                 for i, pos in enumerate(posicoes_restantes[:3]):
                                     if i < len(outras_cores):
-                                        copia_teste[pos][0] = outras_cores[i]
-
-                                fitness_teste = fitness(
-                                    [tuple(casa) for casa in copia_teste]
-                                )
-                                print(
-                                    f"      Configuração Verde:{pos_verde+1}->Branca:{pos_branca+1} = Fitness {fitness_teste}/15"
+                                        copia_teste[pos * 5 + COR] = outras_cores[i]
+
+                                fitness_teste = self.fitness(bytes(copia_teste))
+                                self._notificar(
+                                    "configuracao_testada",
+                                    pos_verde=pos_verde,
+                                    pos_branca=pos_branca,
+                                    fitness=fitness_teste,
                                 )
 
                                 if fitness_teste == 15:
-                                    print(f"\nDESCOBERTA: Solução ótima identificada!")
-                                    return [tuple(casa) for casa in copia_teste], 15
+                                    return self._finalizar(
+                                        bytes(copia_teste),
+                                        15,
+                                        "solucao",
+                                        tempo_inicio,
+                                        populacao,
+                                        percentual_diversidade,
+                                    )
 
                     convergencia_detectada = analisar_estagnacao_populacao(
-                        populacao[:100], fitness
+                        populacao[:100], self.fitness
                     )
 
                     if convergencia_detectada:
-                        print(f"\nAPLICANDO ESTRATÉGIA DE DIVERSIFICAÇÃO")
-                        print(
-                            f"   Justificativa: Escape de ótimo local via perturbação"
-                        )
-                        print(f"   Metodologia: Explosão de diversidade guiada")
+                        self._notificar("explosao_diversidade")
 
                         populacao = explosao_diversidade(
-                            melhor_cromossomo, len(populacao), fitness
+                            melhor_cromossomo, len(populacao), self.fitness
                         )
 
                         if regra_pendente:
@@ -623,9 +653,7 @@ class AlgoritmoGeneticoAvancado:
                             )
                             populacao.extend(variacoes_especializadas)
 
-                        valores_fitness = [
-                            fitness(cromossomo) for cromossomo in populacao
-                        ]
+                        valores_fitness = self.fitness_populacao(populacao)
                         melhor_fitness = max(valores_fitness)
                         melhor_cromossomo = populacao[
                             valores_fitness.index(melhor_fitness)
@@ -635,31 +663,28 @@ class AlgoritmoGeneticoAvancado:
                             self.geracoes_no_fitness_14 = 0
                             self.geracoes_sem_melhoria = 0
 
-                        print(
-                            f"   Diversificação concluída: Nova fitness máxima = {melhor_fitness}/15"
+                        self._notificar(
+                            "explosao_concluida", melhor_fitness=melhor_fitness
                         )
 
-                # Debug para casos extremos
-                if melhor_fitness == 14 and self.geracoes_no_fitness_14 > 0:
-                    if self.geracoes_no_fitness_14 % 100 == 0:
-                        print(
-                            f"\nANÁLISE APROFUNDADA - Estagnação de {self.geracoes_no_fitness_14} gerações"
-                        )
-                        ultra_debug_falha_mutacao(
-                            melhor_cromossomo, fitness, regra_pendente, 500
-                        )
+                if melhor_fitness == 14:
+                    self._notificar(
+                        "fim_analise_populacional",
+                        melhor_cromossomo=melhor_cromossomo,
+                        melhor_fitness=melhor_fitness,
+                        regra_pendente=regra_pendente,
+                    )
+            self.perfil.marcar("analise_populacional")
+            if orcamento is not None and orcamento.esgotado():
+                continue
 
             if self.geracoes_sem_melhoria > 1000:
                 if melhor_fitness >= 14:
                     elite_preservada = int(len(populacao) * 0.15)  # 15% elite
-                    print(
-                        f"   {geracao:7d} | {melhor_fitness:2d}/15   | {len(populacao):6d} | {percentual_diversidade:3.0f}% | {tempo_decorrido:6.1f}s | Diversificação conservadora (preserva 15% elite)"
-                    )
+                    self._notificar("diversificacao", elite_preservada="conservadora")
                 else:
                     elite_preservada = int(len(populacao) * 0.08)  # 8% elite
-                    print(
-                        f"   {geracao:7d} | {melhor_fitness:2d}/15   | {len(populacao):6d} | {percentual_diversidade:3.0f}% | {tempo_decorrido:6.1f}s | Diversificação agressiva (preserva 8% elite)"
-                    )
+                    self._notificar("diversificacao", elite_preservada="agressiva")
 
                 populacao = populacao[
                     :elite_preservada
@@ -667,6 +692,7 @@ class AlgoritmoGeneticoAvancado:
                     len(populacao) - elite_preservada
                 )
                 self.geracoes_sem_melhoria = 0
+                self.perfil.marcar("diversificacao")
                 continue
 
             taxa_sobrevivencia = 0.10
@@ -677,12 +703,22 @@ class AlgoritmoGeneticoAvancado:
                 elite_para_refinamento = populacao[: min(5, len(populacao))]
                 elite_refinada = []
                 for cromossomo in elite_para_refinamento:
-                    if fitness(cromossomo) >= 13:
-                        cromossomo_melhorado = busca_local(cromossomo, fitness, 15)
+                    if self.fitness(cromossomo) >= 13:
+                        cromossomo_melhorado = busca_local(
+                            cromossomo,
+                            self.fitness,
+                            15,
+                            self.modo_busca_local,
+                            self.estatisticas_busca_local,
+                            orcamento,
+                            incremental=True,
+                            funcao_avaliar=self.avaliar,
+                        )
                         elite_refinada.append(cromossomo_melhorado)
                     else:
                         elite_refinada.append(cromossomo)
                 elite_sobrevivente[: len(elite_refinada)] = elite_refinada
+                self.perfil.marcar("refinamento_elite")
 
             descendentes = []
             taxa_imigracao = 0.15
@@ -695,44 +731,93 @@ class AlgoritmoGeneticoAvancado:
             if melhor_fitness >= 13:
                 descendentes_elite_count = int(numero_descendentes * 0.2)
                 descendentes_elite = criar_descendentes_elite(
-                    populacao[:20], valores_fitness[:20], fitness
+                    populacao[:20],
+                    valores_fitness[:20],
+                    self.fitness,
+                    self.modo_busca_local,
+                    self.estatisticas_busca_local,
+                    orcamento,
+                    incremental=True,
+                    funcao_avaliar=self.avaliar,
                 )[:descendentes_elite_count]
                 descendentes.extend(descendentes_elite)
+                self.perfil.marcar("descendentes_elite")
+            if orcamento is not None and orcamento.esgotado():
+                continue
+
+            # seleção adaptativa de pais: um amostrador por geração sobre os 200
+            # melhores, com todos os índices de pais sorteados em lote
+            amostrador = AmostradorPais(valores_fitness[:200])
+            numero_pares = max(0, (numero_descendentes - len(descendentes) + 1) // 2)
+            if melhor_fitness >= 14:
+                # seleção por torneio restrita (busca local intensiva)
+                indices_pais = amostrador.torneios(2 * numero_pares, 3, limite=10)
+            elif melhor_fitness >= 13:
+                # seleção por torneio moderada
+                indices_pais = amostrador.torneios(2 * numero_pares, 5, limite=50)
+            else:
+                # seleção híbrida (exploração ampla)
+                indices_pais = amostrador.hibridos(2 * numero_pares)
+            self.perfil.marcar("selecao_pais")
 
             # reprodução principal via seleção e crossover
-            while len(descendentes) < numero_descendentes:
-                # seleção adaptativa de pais
-                if melhor_fitness >= 14:
-                    # seleção por torneio restrita (busca local intensiva)
-                    pai1 = selecao_torneio(populacao[:10], valores_fitness[:10], 3)
-                    pai2 = selecao_torneio(populacao[:10], valores_fitness[:10], 3)
-                elif melhor_fitness >= 13:
-                    # seleção por torneio moderada
-                    pai1 = selecao_torneio(populacao[:50], valores_fitness[:50], 5)
-                    pai2 = selecao_torneio(populacao[:50], valores_fitness[:50], 5)
-                else:
-                    # seleção híbrida (exploração ampla)
-                    pai1 = selecao_hibrida(populacao[:200], valores_fitness[:200])
-                    pai2 = selecao_hibrida(populacao[:200], valores_fitness[:200])
+            # (com o perfil ligado, 1 a cada PASSO_AMOSTRA_PARES pares é cronometrado por
+            # etapa e o tempo do laço é dividido entre cruzamento e mutação nessa proporção)
+            cronometrar = self.perfil.ativo
+            amostra_cruzamento = amostra_mutacao = 0
+            for par in range(numero_pares):
+                if (
+                    orcamento is not None
+                    and par % PASSO_VERIFICACAO_PARES == 0
+                    and orcamento.esgotado()
+                ):
+                    break
+                amostrar = cronometrar and par % PASSO_AMOSTRA_PARES == 0
+                if amostrar:
+                    inicio_par = perf_counter_ns()
 
-                if melhor_fitness >= 13:
+                pai1 = populacao[indices_pais[2 * par]]
+                pai2 = populacao[indices_pais[2 * par + 1]]
+
+                if self.operador_cruzamento != "classico":
+                    filho1, filho2 = cruzamento_permutacao(
+                        pai1, pai2, self.taxa_cruzamento, self.operador_cruzamento
+                    )
+                elif melhor_fitness >= 13:
                     filho1, filho2 = cruzamento_avancado(
                         pai1, pai2, self.taxa_cruzamento
                     )
                 else:
                     filho1, filho2 = cruzamento(pai1, pai2, self.taxa_cruzamento)
-
-                regras_faltantes_f1 = obter_regras_faltantes(filho1)
-                regras_faltantes_f2 = obter_regras_faltantes(filho2)
-
-                filho1 = mutacao_inteligente(filho1, self.taxa_mutacao, fitness(filho1))
-                filho2 = mutacao_inteligente(filho2, self.taxa_mutacao, fitness(filho2))
+                if amostrar:
+                    fim_cruzamento = perf_counter_ns()
+                    amostra_cruzamento += fim_cruzamento - inicio_par
+
+                # avaliação única por filho: faltantes e fitness saem da mesma máscara
+                mascara_f1 = self.avaliar(filho1)
+                mascara_f2 = self.avaliar(filho2)
+                regras_faltantes_f1 = regras_faltantes_mascara(mascara_f1)
+                regras_faltantes_f2 = regras_faltantes_mascara(mascara_f2)
+
+                filho1 = mutacao_inteligente(
+                    filho1, self.taxa_mutacao, contar_regras(mascara_f1)
+                )
+                filho2 = mutacao_inteligente(
+                    filho2, self.taxa_mutacao, contar_regras(mascara_f2)
+                )
 
                 if melhor_fitness >= 12:
                     filho1 = mutacao_dirigida(filho1, regras_faltantes_f1)
                     filho2 = mutacao_dirigida(filho2, regras_faltantes_f2)
 
                 descendentes.extend([filho1, filho2])
+                if amostrar:
+                    amostra_mutacao += perf_counter_ns() - fim_cruzamento
+            self.perfil.dividir(
+                {"cruzamento": amostra_cruzamento, "mutacao": amostra_mutacao}
+            )
+            if orcamento is not None and orcamento.esgotado():
+                continue
 
             numero_imigrantes = int(len(populacao) * taxa_imigracao)
             imigrantes = self.criar_populacao_especializada(numero_imigrantes)
@@ -743,67 +828,433 @@ class AlgoritmoGeneticoAvancado:
 
             if len(populacao) > self.tamanho_populacao:
                 populacao = populacao[: self.tamanho_populacao]
+            self.perfil.marcar("imigracao")
+
+    # roda a completação exata uma vez por melhor indivíduo acima do limiar
+    # retorna (cromossomo, fitness) quando a completação supera o indivíduo
+    def _tentar_completacao_exata(self, cromossomo, fitness_atual):
+        if (
+            self.limiar_completacao_exata is None
+            or not self.limiar_completacao_exata <= fitness_atual < 15
+            or cromossomo in self.completacoes_tentadas
+        ):
+            return None
+        self.completacoes_tentadas.add(cromossomo)
+
+        completado, fitness_completado, estatisticas = completar_exato(
+            cromossomo, self.limite_combinacoes_completacao, self.orcamento
+        )
+        self.avaliacoes_completacao += estatisticas["avaliadas"]
+        self._notificar(
+            "completacao_exata",
+            estatisticas=estatisticas,
+            fitness_atual=fitness_atual,
+            fitness_completado=fitness_completado,
+        )
+        if fitness_completado <= fitness_atual:
+            return None
+        return completado, fitness_completado
 
-    def _apresentar_resultados_finais(
+    # estado completo no início de `geracao` (campos descritos em ponto_controle)
+    def _estado(
         self,
-        melhor_cromossomo,
-        melhor_fitness,
-        geracoes_executadas,
-        tempo_inicio,
-        tempo_14,
+        geracao,
+        populacao,
+        melhor_cromossomo_global,
+        melhor_fitness_global,
+        tempo_atingiu_14,
+        percentual_diversidade,
+        tempo_decorrido,
     ):
-        print("\n" + "=" * 80)
-        print("                    📊 RELATÓRIO FINAL DE RESULTADOS")
-        print("=" * 80)
-
-        mostrar_solucao(melhor_cromossomo)
-
-        relatorio_detalhado = relatorio_detalhado_fitness(melhor_cromossomo)
-        pontuacoes_parciais = pontuacoes_parciais_fitness(melhor_cromossomo)
-
-        print(f"\n🔬 ANÁLISE DOS RESULTADOS:")
-        print(f"   Regras de satisfação cumpridas: {relatorio_detalhado['satisfied']}")
-        if relatorio_detalhado["missing"]:
-            print(
-                f"   Regras pendentes de satisfação: {relatorio_detalhado['missing']}"
+        entradas_cache = (
+            self.cache_fitness.entradas() if self.cache_fitness is not None else []
+        )
+        return {
+            "configuracao": asdict(self.configuracao),
+            "geracao": geracao,
+            "geracoes_executadas": self.geracoes_executadas,
+            "melhor_fitness_global": melhor_fitness_global,
+            "melhor_cromossomo": melhor_cromossomo_global,
+            "tempo_decorrido": tempo_decorrido,
+            "tempo_atingiu_14": tempo_atingiu_14,
+            "percentual_diversidade": percentual_diversidade,
+            "tamanho_populacao": self.tamanho_populacao,
+            "taxa_cruzamento": self.taxa_cruzamento,
+            "taxa_mutacao": self.taxa_mutacao,
+            "geracoes_sem_melhoria": self.geracoes_sem_melhoria,
+            "melhor_fitness_atual": self.melhor_fitness_atual,
+            "geracoes_no_fitness_14": self.geracoes_no_fitness_14,
+            "geracoes_no_fitness_13": self.geracoes_no_fitness_13,
+            "buscas_locais": self.estatisticas_busca_local["buscas"],
+            "avaliacoes_busca_local": self.estatisticas_busca_local["avaliacoes"],
+            "melhorias_busca_local": self.estatisticas_busca_local["melhorias"],
+            "acertos_cache": getattr(self.cache_fitness, "acertos", 0),
+            "falhas_cache": getattr(self.cache_fitness, "falhas", 0),
+            "remocoes_cache": getattr(self.cache_fitness, "remocoes", 0),
+            "avaliacoes_diretas": getattr(self, "avaliacoes_diretas", 0),
+            "avaliacoes_completacao": self.avaliacoes_completacao,
+            "marcos": dict(self.marcos_fitness),
+            "populacao": populacao,
+            "completacoes_tentadas": self.completacoes_tentadas,
+            "cache_cromossomos": [desempacotar(chave) for chave, _ in entradas_cache],
+            "cache_mascaras": [mascara for _, mascara in entradas_cache],
+            "estado_random": random.getstate(),
+        }
+
+    # devolve ao AG os parâmetros adaptativos, contadores e estatísticas do estado
+    def _restaurar(self, estado):
+        self.geracoes_executadas = estado["geracoes_executadas"]
+        self.tamanho_populacao = estado["tamanho_populacao"]
+        self.taxa_cruzamento = estado["taxa_cruzamento"]
+        self.taxa_mutacao = estado["taxa_mutacao"]
+        self.geracoes_sem_melhoria = estado["geracoes_sem_melhoria"]
+        self.melhor_fitness_atual = estado["melhor_fitness_atual"]
+        self.geracoes_no_fitness_14 = estado["geracoes_no_fitness_14"]
+        self.geracoes_no_fitness_13 = estado["geracoes_no_fitness_13"]
+        self.estatisticas_busca_local["buscas"] = estado["buscas_locais"]
+        self.estatisticas_busca_local["avaliacoes"] = estado["avaliacoes_busca_local"]
+        self.estatisticas_busca_local["melhorias"] = estado["melhorias_busca_local"]
+        if self.cache_fitness is not None:
+            self.cache_fitness.acertos = estado["acertos_cache"]
+            self.cache_fitness.falhas = estado["falhas_cache"]
+            self.cache_fitness.remocoes = estado["remocoes_cache"]
+            self.cache_fitness.restaurar(
+                zip(map(empacotar, estado["cache_cromossomos"]), estado["cache_mascaras"])
             )
-        print(f"   Análise por categorias de restrições:")
-        for categoria, pontuacao in pontuacoes_parciais.items():
-            print(f"      • {categoria.capitalize()}: {pontuacao}")
-
-        print(f"\n🐟 RESPOSTA AO DESAFIO LÓGICO DE EINSTEIN:")
-        for posicao, casa in enumerate(melhor_cromossomo, 1):
-            if casa[4] == "Peixes":
-                print(f"   🎯 Conclusão: O {casa[1]} possui os Peixes (Casa {posicao})")
-                break
-
-        tempo_total = time.time() - tempo_inicio
-        print(f"\n⚡ MÉTRICAS DE PERFORMANCE COMPUTACIONAL:")
-        print(f"   Fitness final alcançado: {melhor_fitness}/15")
-        print(f"   Total de gerações evolutivas: {geracoes_executadas:,}")
-        print(f"   Tempo computacional total: {tempo_total:.2f} segundos")
-        print(f"   Eficiência por geração: {tempo_total/geracoes_executadas:.4f}s")
-        print(f"   Tamanho final da população: {self.tamanho_populacao:,} indivíduos")
-
-        if tempo_14:
-            print(f"   Tempo para atingir 14/15: {tempo_14:.2f}s")
-            if melhor_fitness == 15:
-                print(
-                    f"   Tempo para otimização final (14->15): {tempo_total - tempo_14:.2f}s"
-                )
+        else:
+            self.avaliacoes_diretas = estado["avaliacoes_diretas"]
+        self.marcos_fitness = dict(estado["marcos"])
+        self.completacoes_tentadas = set(estado["completacoes_tentadas"])
+        self.avaliacoes_completacao = estado["avaliacoes_completacao"]
+
+    # repassa o evento aos callbacks (sem callbacks o AG não formata nem imprime nada)
+    def _notificar(self, evento, **dados):
+        for callback in self.callbacks:
+            callback(evento, dados)
+
+    # avaliações efetivas: falhas do cache em lote e avulsas (sem cache, todas as
+    # avaliações em lote e avulsas) + vizinhos da busca local (avaliados por delta sobre
+    # a máscara do ponto de partida, que passa pelo cache) + combinações da completação
+    # exata (avaliadas em lote por tabelas, fora do cache)
+    def avaliacoes_realizadas(self):
+        if self.cache_fitness is None:
+            diretas = self.avaliacoes_diretas
+        else:
+            diretas = self.cache_fitness.falhas
+        return (
+            diretas
+            + self.estatisticas_busca_local["avaliacoes"]
+            + self.avaliacoes_completacao
+        )
 
-        print(f"\n🏁 EXPERIMENTO COMPUTACIONAL CONCLUÍDO")
-        print("=" * 80)
+    # avaliações efetivas e consultas ao cache (None sem cache)
+    def _avaliacoes(self):
+        if self.cache_fitness is None:
+            return self.avaliacoes_realizadas(), None
+        consultas = self.cache_fitness.acertos + self.cache_fitness.falhas
+        return self.avaliacoes_realizadas(), consultas
 
+    # monta o ResultadoAG da execução, avisa os callbacks e devolve (cromossomo, fitness)
+    def _finalizar(
+        self,
+        cromossomo,
+        valor,
+        motivo_parada,
+        tempo_inicio,
+        populacao,
+        percentual_diversidade,
+    ):
+        tempo_total = time.time() - tempo_inicio
+        geracoes = self.geracoes_executadas
+        if valor == 15 and 15 not in self.marcos_fitness:
+            self.marcos_fitness[15] = (geracoes, tempo_total)
+        marcos = dict(self.marcos_fitness)
+        avaliacoes, consultas = self._avaliacoes()
+
+        self.resultado = ResultadoAG(
+            cromossomo=cromossomo,
+            fitness=valor,
+            geracoes=geracoes,
+            avaliacoes=avaliacoes,
+            consultas_fitness=consultas,
+            tempo_total=tempo_total,
+            # tempo até 14: a primeira vez que o melhor chegou a 14 ou mais
+            tempo_ate_14=min(
+                (
+                    tempo
+                    for valor_marco, (_, tempo) in marcos.items()
+                    if valor_marco >= 14
+                ),
+                default=None,
+            ),
+            tempo_ate_15=marcos.get(15, (None, None))[1],
+            marcos=marcos,
+            motivo_parada=motivo_parada,
+        )
+        self._notificar(
+            "fim",
+            resultado=self.resultado,
+            tamanho_populacao=len(populacao),
+            percentual_diversidade=percentual_diversidade,
+        )
+        return cromossomo, valor
+
+
+# execução embutível do AG: semeia `random` e roda uma vez com a configuração dada
+# (inclusive o backend de fitness), sem imprimir nada (a saída fica a cargo dos
+# callbacks, ex.: [RelatorioConsole()]) // evento_parada (ex.: TokenCancelamento) cancela a
+# execução de outra thread ou processo
+def executar_ag(
+    configuracao=None, semente=None, callbacks=None, evento_parada=None
+) -> ResultadoAG:
+    configuracao = configuracao or ConfiguracaoAG()
+    if semente is not None:
+        random.seed(semente)
+    algoritmo = AlgoritmoGeneticoAvancado(
+        configuracao, callbacks, evento_parada=evento_parada
+    )
+    algoritmo.executar()
+    algoritmo.resultado.semente = semente
+    return algoritmo.resultado
+
+
+# versão em fluxo de executar_ag: entrega um InstantaneoGeracao por geração e devolve o
+# ResultadoAG no StopIteration // quem consome pode agregar, filtrar ou parar antes
+# fechando o gerador (o resultado fica registrado como "interrompida"). O estado do
+# random (e, pelo próprio AG, o backend de fitness) da execução é trocado a cada
+# yield, então execuções intercaladas (ex.: várias sementes consumidas em paralelo)
+# dão o mesmo resultado que rodadas em sequência
+def evoluir(configuracao=None, semente=None, callbacks=None, evento_parada=None):
+    configuracao = configuracao or ConfiguracaoAG()
+    estado_externo = random.getstate()
+    if semente is not None:
+        random.seed(semente)
+    algoritmo = AlgoritmoGeneticoAvancado(
+        configuracao, callbacks, evento_parada=evento_parada
+    )
+    geracoes = algoritmo.evoluir()
+    try:
+        while True:
+            try:
+                instantaneo = next(geracoes)
+            except StopIteration:
+                break
+            estado_proprio = random.getstate()
+            random.setstate(estado_externo)
+            try:
+                yield instantaneo
+            finally:
+                estado_externo = random.getstate()
+                random.setstate(estado_proprio)
+        algoritmo.resultado.semente = semente
+        return algoritmo.resultado
+    finally:
+        geracoes.close()
+        random.setstate(estado_externo)
+
+
+# continua a execução gravada no ponto de controle `caminho` até o fim, com a
+# configuração gravada e os campos sobrescritos por `parametros` (ex.: um
+# limite_geracoes maior) // com a mesma configuração, o resultado é o da execução
+# original sem interrupção
+def retomar_ag(
+    caminho, callbacks=None, evento_parada=None, **parametros
+) -> ResultadoAG:
+    estado = carregar_ponto_controle(caminho)
+    configuracao = replace(ConfiguracaoAG(**estado["configuracao"]), **parametros)
+    algoritmo = AlgoritmoGeneticoAvancado(
+        configuracao, callbacks, evento_parada=evento_parada, ponto_controle=estado
+    )
+    algoritmo.executar()
+    return algoritmo.resultado
+
+
+# motor exato: resolve por propagação de restrições e prova a unicidade da solução
+def executar_solucionador_exato():
+    print("=" * 80)
+    print("🔎 SOLUCIONADOR EXATO: backtracking com forward checking (AC-3 na raiz)")
+    print("=" * 80)
+
+    solucoes, estatisticas = resolver_exato()
+
+    for indice, solucao in enumerate(solucoes, 1):
+        print(f"\nSOLUÇÃO {indice}:")
+        imprimir_cromossomo_visual(solucao)
+
+    print(f"\n📊 ESTATÍSTICAS DA BUSCA:")
+    print(
+        f"   Domínios iniciais (permutações por atributo): {estatisticas['tamanho_dominios_iniciais']}"
+    )
+    print(f"   Domínios após AC-3: {estatisticas['tamanho_dominios_ac3']}")
+    print(
+        f"   Revisões de arco: {estatisticas['revisoes']} | Valores removidos: {estatisticas['valores_removidos']}"
+    )
+    print(f"   Nós visitados: {estatisticas['nos']} | Podas: {estatisticas['podas']}")
+    print(f"   Tempo: {estatisticas['tempo']*1000:.2f} ms")
+    print(f"   Soluções encontradas: {len(solucoes)}")
+    if len(solucoes) == 1:
+        print(f"   ✅ Solução única (busca exaustiva)")
+    print(
+        f"   Verificação pelo fitness do AG: {'15/15 em todas' if verificar_solucoes(solucoes) else 'FALHOU'}"
+    )
+
+    return solucoes, estatisticas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Desafio de Einstein: algoritmo genético ou solucionador exato"
+    )
+    parser.add_argument(
+        "--motor",
+        choices=MOTORES,
+        default="ag",
+        help="ag (algoritmo genético, padrão), exato (propagação de restrições), "
+        "tabu (busca tabu), recozimento (recozimento simulado), eda "
+        "(estimação de distribuição) ou ilhas (AG em paralelo com migração)",
+    )
+    parser.add_argument(
+        "--resfriamento",
+        choices=sorted(RESFRIAMENTOS),
+        default="geometrico",
+        help="agenda de resfriamento do motor recozimento",
+    )
+    parser.add_argument(
+        "--ilhas",
+        type=int,
+        default=4,
+        help="número de ilhas (populações em processos separados) do motor ilhas",
+    )
+    parser.add_argument(
+        "--topologia",
+        choices=TOPOLOGIAS,
+        default="anel",
+        help="topologia de migração do motor ilhas",
+    )
+    parser.add_argument(
+        "--busca-local",
+        choices=MODOS_BUSCA_LOCAL,
+        default=MODO_BUSCA_LOCAL,
+        help="busca local do motor ag: amostrada (vizinhos sorteados, padrão) ou pela "
+        "vizinhança completa de trocas (melhor, primeira ou plato)",
+    )
+    parser.add_argument(
+        "--perfil-fases",
+        nargs="?",
+        const="",
+        metavar="ARQUIVO",
+        help="cronometra cada fase da geração do motor ag (impresso no fim) e, com "
+        "ARQUIVO, exporta o perfil em JSON",
+    )
+    parser.add_argument(
+        "--limite-geracoes",
+        type=int,
+        metavar="N",
+        help="gerações dos motores ag, eda e de cada ilha, iterações do tabu e ciclos "
+        f"do recozimento (padrão: {LIMITE_GERACOES})",
+    )
+    parser.add_argument(
+        "--tempo-maximo",
+        type=float,
+        default=TEMPO_MAXIMO,
+        metavar="SEGUNDOS",
+        help="orçamento de tempo dos motores ag, tabu, recozimento, eda e ilhas (no ag "
+        "e em cada ilha, verificado também dentro da geração)",
+    )
+    parser.add_argument(
+        "--limite-avaliacoes",
+        type=int,
+        default=LIMITE_AVALIACOES,
+        metavar="N",
+        help="orçamento de avaliações de fitness dos motores ag, tabu, recozimento, eda "
+        "e ilhas (dividido entre as ilhas)",
+    )
+    parser.add_argument(
+        "--ponto-controle",
+        default=CAMINHO_PONTO_CONTROLE,
+        metavar="ARQUIVO",
+        help="grava o estado do motor ag em ARQUIVO a cada "
+        f"{INTERVALO_PONTO_CONTROLE:.0f}s (retomável com --retomar)",
+    )
+    parser.add_argument(
+        "--retomar",
+        metavar="ARQUIVO",
+        help="continua a execução do motor ag gravada no ponto de controle ARQUIVO",
+    )
+    parser.add_argument(
+        "--fitness-alvo",
+        type=int,
+        default=FITNESS_ALVO,
+        help="os motores ag, tabu, recozimento, eda e ilhas param ao atingir este fitness "
+        "(padrão: só na solução, 15)",
+    )
+    argumentos = parser.parse_args(argv)
 
-def main():
     print("🎓 DISCIPLINA: Inteligência Artificial")
     print("👨‍🏫 PROFESSOR: Tiago Bonini Borchartt")
     print("📚 TRABALHO: Resolução do Desafio de Einstein via Algoritmos Genéticos")
     print("-" * 80)
 
-    algoritmo_genetico = AlgoritmoGeneticoAvancado()
-    solucao_final, fitness_final = algoritmo_genetico.executar()
+    if argumentos.motor == "exato":
+        executar_solucionador_exato()
+        return
+
+    definir_backend_fitness(BACKEND_FITNESS)
+    limites = {
+        "tempo_maximo": argumentos.tempo_maximo,
+        "limite_avaliacoes": argumentos.limite_avaliacoes,
+        "fitness_alvo": argumentos.fitness_alvo,
+    }
+    if argumentos.limite_geracoes is not None:
+        limites["limite_geracoes"] = argumentos.limite_geracoes
+    if argumentos.motor in ("tabu", "recozimento", "eda", "ilhas"):
+        configuracao = ConfiguracaoAG(**limites)
+        callbacks = [RelatorioConsole()]
+        if argumentos.motor == "tabu":
+            motor = BuscaTabu(configuracao, callbacks)
+        elif argumentos.motor == "recozimento":
+            motor = RecozimentoSimulado(
+                configuracao, callbacks, resfriamento=argumentos.resfriamento
+            )
+        elif argumentos.motor == "eda":
+            motor = AlgoritmoEDA(configuracao, callbacks)
+        else:
+            motor = ModeloIlhas(
+                configuracao,
+                callbacks,
+                numero_ilhas=argumentos.ilhas,
+                topologia=argumentos.topologia,
+            )
+    else:
+        parametros = {
+            "perfil_fases": argumentos.perfil_fases is not None or PERFIL_FASES,
+            **limites,
+            "caminho_ponto_controle": argumentos.ponto_controle,
+        }
+        if argumentos.busca_local != MODO_BUSCA_LOCAL:
+            parametros["modo_busca_local"] = argumentos.busca_local
+        if argumentos.retomar:
+            # só as opções passadas na linha de comando substituem as gravadas
+            estado = carregar_ponto_controle(argumentos.retomar)
+            configuracao = ConfiguracaoAG(**estado["configuracao"])
+            parametros = {
+                campo: valor for campo, valor in parametros.items() if valor is not None
+            }
+        else:
+            estado = configuracao = None
+        motor = AlgoritmoGeneticoAvancado(
+            configuracao,
+            callbacks=[RelatorioConsole()],
+            ponto_controle=estado,
+            **parametros,
+        )
+    if argumentos.motor == "ag":
+        _, fitness_final = motor.executar()
+    else:
+        fitness_final = motor.executar().fitness
+    if argumentos.motor == "ag" and argumentos.perfil_fases:
+        motor.perfil.exportar_json(argumentos.perfil_fases)
+        print(f"   Perfil por fase exportado em {argumentos.perfil_fases}")
 
     print(f"\n🏆 RESULTADO FINAL:")
     if fitness_final == 15:
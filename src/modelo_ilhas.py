@@ -0,0 +1,261 @@
+"""
+Modelo de ilhas: várias populações do AG evoluindo em paralelo, uma por processo
+Cada ilha é um AlgoritmoGeneticoAvancado sem callbacks (silencioso) com semente própria
+e a ConfiguracaoAG do modelo (inclusive o backend de fitness). A cada
+`intervalo_migracao` gerações a ilha envia seus `numero_migrantes` melhores para outra
+ilha (anel ou destino aleatório) e recebe, sem bloquear, os migrantes que chegaram na
+sua fila. A primeira ilha a chegar em 15/15 (ou no fitness alvo) sinaliza o evento de
+parada compartilhado e as demais encerram na geração seguinte.
+Como MotorBusca, o modelo avisa os callbacks ("inicio_motor", "resumo_ilhas" e
+"fim_motor") e devolve um ResultadoAG com as avaliações somadas das ilhas. O orçamento
+é dividido entre elas: limite_avaliacoes em partes iguais, tempo_maximo como prazo
+comum de relógio; o evento_parada de quem chama é repassado ao evento compartilhado.
+"""
+
+import os
+import queue
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import replace
+from multiprocessing import Manager
+
+from motor_busca import MotorBusca
+
+TOPOLOGIAS = ("anel", "aleatoria")
+
+# intervalo (s) entre consultas ao evento_parada de quem chama enquanto as ilhas rodam
+INTERVALO_CANCELAMENTO = 0.05
+
+# motivos de parada de uma ilha que encerram as demais
+MOTIVOS_VITORIA = ("solucao", "fitness_alvo")
+
+
+# gancho de migração de uma ilha (chamado pelo AG a cada geração, população ordenada)
+class _Migracao:
+
+    def __init__(self, indice, filas, intervalo, numero_migrantes, topologia):
+        self.indice = indice
+        self.filas = filas
+        self.intervalo = intervalo
+        self.numero_migrantes = numero_migrantes
+        self.topologia = topologia
+        self.geracoes = 0
+        self.enviados = 0
+        self.recebidos = 0
+
+    def _destino(self):
+        if self.topologia == "anel":
+            return (self.indice + 1) % len(self.filas)
+        outras = [i for i in range(len(self.filas)) if i != self.indice]
+        return random.choice(outras)
+
+    def __call__(self, geracao, populacao):
+        self.geracoes = geracao
+        if len(self.filas) < 2 or geracao % self.intervalo != 0:
+            return []
+
+        migrantes = populacao[: self.numero_migrantes]
+        self.filas[self._destino()].put(migrantes)
+        self.enviados += len(migrantes)
+
+        imigrantes = []
+        while True:
+            try:
+                imigrantes.extend(self.filas[self.indice].get_nowait())
+            except queue.Empty:
+                break
+        self.recebidos += len(imigrantes)
+        return imigrantes
+
+
+# executa uma ilha no processo trabalhador // `prazo` (time.time() absoluto ou None) é
+# o fim do tempo_maximo comum: ilhas que começam atrasadas (mais ilhas que processos)
+# recebem só o que sobra dele // retorna as estatísticas e o resultado da ilha
+def _executar_ilha(
+    indice,
+    semente,
+    filas,
+    evento_parada,
+    intervalo,
+    numero_migrantes,
+    topologia,
+    configuracao,
+    prazo,
+):
+    # import tardio: main importa este módulo para o --motor ilhas
+    from main import AlgoritmoGeneticoAvancado
+
+    inicio = time.time()
+    if prazo is not None:
+        # prazo já vencido: a ilha para na primeira verificação do orçamento
+        configuracao = replace(configuracao, tempo_maximo=max(prazo - inicio, 1e-9))
+    random.seed(semente)
+    migracao = _Migracao(indice, filas, intervalo, numero_migrantes, topologia)
+    algoritmo = AlgoritmoGeneticoAvancado(
+        configuracao, migracao=migracao, evento_parada=evento_parada
+    )
+    algoritmo.executar()
+    resultado = algoritmo.resultado
+    if resultado.motivo_parada in MOTIVOS_VITORIA:
+        evento_parada.set()
+
+    return {
+        "ilha": indice,
+        "semente": semente,
+        "fitness": resultado.fitness,
+        "geracoes": resultado.geracoes,
+        "avaliacoes": resultado.avaliacoes,
+        "inicio": inicio,
+        "tempo": resultado.tempo_total,
+        "migrantes_enviados": migracao.enviados,
+        "migrantes_recebidos": migracao.recebidos,
+        "motivo_parada": resultado.motivo_parada,
+        "marcos": resultado.marcos,
+        "cromossomo": resultado.cromossomo,
+    }
+
+
+class ModeloIlhas(MotorBusca):
+
+    nome = "Modelo de ilhas"
+
+    # configuracao: ConfiguracaoAG de cada ilha (limite_avaliacoes é o total do modelo)
+    def __init__(
+        self,
+        configuracao=None,
+        callbacks=None,
+        evento_parada=None,
+        numero_ilhas=4,
+        intervalo_migracao=20,
+        numero_migrantes=10,
+        topologia="anel",
+        trabalhadores=None,
+        semente=None,
+    ):
+        if topologia not in TOPOLOGIAS:
+            raise ValueError(f"Topologia de migração desconhecida: {topologia!r}")
+        if numero_ilhas < 1:
+            raise ValueError("O modelo de ilhas precisa de pelo menos uma ilha")
+        super().__init__(configuracao, callbacks, evento_parada)
+        if self.configuracao.caminho_ponto_controle is not None:
+            raise ValueError("Pontos de controle não cobrem a migração entre ilhas")
+        self.numero_ilhas = numero_ilhas
+        self.intervalo_migracao = intervalo_migracao
+        self.numero_migrantes = numero_migrantes
+        self.topologia = topologia
+        self.trabalhadores = trabalhadores or min(numero_ilhas, os.cpu_count() or 1)
+        self.semente = random.getrandbits(32) if semente is None else semente
+        self.ilhas = []  # estatísticas de cada ilha da última execução
+
+    def descricao(self) -> str:
+        return (
+            f"🏝️  MODELO DE ILHAS: {self.numero_ilhas} ilhas em {self.trabalhadores} processos | "
+            f"migração {self.topologia} de {self.numero_migrantes} a cada {self.intervalo_migracao} gerações"
+        )
+
+    # configuração da ilha `indice`: a parte dela do limite de avaliações (as primeiras
+    # ilhas ficam com o resto da divisão)
+    def _configuracao_ilha(self, indice):
+        limite = self.configuracao.limite_avaliacoes
+        if limite is None:
+            return self.configuracao
+        parte, resto = divmod(limite, self.numero_ilhas)
+        return replace(
+            self.configuracao, limite_avaliacoes=max(1, parte + (indice < resto))
+        )
+
+    def executar(self):
+        self._iniciar()
+        inicio = time.time()
+        tempo_maximo = self.configuracao.tempo_maximo
+        prazo = None if tempo_maximo is None else inicio + tempo_maximo
+
+        with Manager() as gerenciador, ProcessPoolExecutor(
+            self.trabalhadores
+        ) as executor:
+            filas = [gerenciador.Queue() for _ in range(self.numero_ilhas)]
+            evento_parada = gerenciador.Event()
+            pendentes = {
+                executor.submit(
+                    _executar_ilha,
+                    indice,
+                    self.semente + indice,
+                    filas,
+                    evento_parada,
+                    self.intervalo_migracao,
+                    self.numero_migrantes,
+                    self.topologia,
+                    self._configuracao_ilha(indice),
+                    prazo,
+                )
+                for indice in range(self.numero_ilhas)
+            }
+
+            resultados = []
+            while pendentes:
+                if self.evento_parada is not None and self.evento_parada.is_set():
+                    evento_parada.set()
+                concluidos, pendentes = wait(
+                    pendentes, INTERVALO_CANCELAMENTO, return_when=FIRST_COMPLETED
+                )
+                for futuro in concluidos:
+                    resultados.append(futuro.result())
+                if evento_parada.is_set():
+                    # ilhas ainda na fila do executor nem chegam a começar
+                    for futuro in pendentes:
+                        futuro.cancel()
+                    pendentes = {
+                        futuro for futuro in pendentes if not futuro.cancelled()
+                    }
+
+        resultados.sort(key=lambda resultado: resultado["ilha"])
+        self.ilhas = resultados
+        self.contar(sum(resultado["avaliacoes"] for resultado in resultados))
+        self.marcos = self._marcos(resultados, inicio)
+
+        self.estatisticas = {
+            "ilhas_concluidas": len(resultados),
+            "ilhas_canceladas": self.numero_ilhas - len(resultados),
+        }
+        self._notificar(
+            "resumo_ilhas",
+            ilhas=resultados,
+            ilhas_canceladas=self.estatisticas["ilhas_canceladas"],
+        )
+        vencedora = max(
+            resultados,
+            key=lambda resultado: (resultado["fitness"], -resultado["tempo"]),
+            default=None,
+        )
+        if vencedora is None:  # cancelado antes de qualquer ilha começar
+            cromossomo, valor, motivo_parada = None, 0, "interrompida"
+        else:
+            self.estatisticas["ilha_vencedora"] = vencedora["ilha"]
+            cromossomo, valor = vencedora["cromossomo"], vencedora["fitness"]
+            motivo_parada = vencedora["motivo_parada"]
+            if motivo_parada not in MOTIVOS_VITORIA and (
+                self.evento_parada is not None and self.evento_parada.is_set()
+            ):
+                motivo_parada = "interrompida"
+
+        resultado = self._finalizar(
+            cromossomo,
+            valor,
+            max((resultado["geracoes"] for resultado in resultados), default=0),
+            motivo_parada,
+        )
+        resultado.semente = self.semente
+        return resultado
+
+    # marcos do modelo: para cada fitness, a primeira ilha a atingi-lo, com o tempo
+    # contado do início do modelo (as ilhas podem começar em momentos diferentes)
+    @staticmethod
+    def _marcos(resultados, inicio):
+        marcos = {}
+        for resultado in resultados:
+            atraso = resultado["inicio"] - inicio
+            for valor, (geracao, tempo) in resultado["marcos"].items():
+                if valor not in marcos or atraso + tempo < marcos[valor][1]:
+                    marcos[valor] = (geracao, atraso + tempo)
+        return marcos
@@ -0,0 +1,115 @@
+"""
+Base dos motores de busca alternativos ao AG (busca tabu, recozimento simulado, EDA)
+Os motores recebem a mesma ConfiguracaoAG do AG e usam dela os limites de execução
+(tempo_maximo, limite_avaliacoes e fitness_alvo; os demais campos são do AG). Toda
+avaliação de fitness passa por avaliar() ou contar() e entra no mesmo Orcamento que o
+AG usa, e o motor devolve um ResultadoAG. Como o AG, não imprimem nada: a cada etapa
+chamam os callbacks com (evento, dados) ("inicio_motor", "marco" e "fim_motor").
+"""
+
+import time
+from typing import Optional
+
+from configuracao_ag import ConfiguracaoAG, ResultadoAG
+from cromossomo import Cromossomo
+from einstein_rules import NUMERO_REGRAS, avaliar
+from orcamento import Orcamento
+
+
+class MotorBusca:
+
+    nome = "motor"
+
+    # configuracao: ConfiguracaoAG (padrão: a do AG) // evento_parada (ex.:
+    # TokenCancelamento) cancela a execução de outra thread ou processo
+    def __init__(self, configuracao=None, callbacks=None, evento_parada=None):
+        self.configuracao = configuracao or ConfiguracaoAG()
+        self.callbacks = list(callbacks or ())
+        self.evento_parada = evento_parada
+        self.avaliacoes = 0
+        self.marcos = {}
+        self.orcamento = None
+        self.estatisticas = {}
+        self.resultado = None
+        self._inicio = None
+
+    # linha de apresentação do motor (impressa pelo relatório no início)
+    def descricao(self) -> str:
+        return self.nome
+
+    def _iniciar(self) -> None:
+        configuracao = self.configuracao
+        self._inicio = time.time()
+        self.avaliacoes = 0
+        self.marcos = {}
+        self.orcamento = Orcamento(
+            configuracao.tempo_maximo,
+            configuracao.limite_avaliacoes,
+            self.evento_parada,
+            lambda: self.avaliacoes,
+        )
+        self._notificar("inicio_motor", motor=self)
+
+    # máscara de regras de um cromossomo, contada como uma avaliação
+    def avaliar(self, cromossomo: Cromossomo) -> int:
+        self.avaliacoes += 1
+        return avaliar(cromossomo)
+
+    # avaliações feitas fora de avaliar() (vizinhança inteira, delta, lote)
+    def contar(self, quantidade: int) -> None:
+        self.avaliacoes += quantidade
+
+    def tempo_decorrido(self) -> float:
+        return time.time() - self._inicio
+
+    # novo melhor fitness global na iteração (ou geração) `iteracao`
+    def _registrar_melhoria(self, iteracao: int, fitness: int) -> None:
+        if fitness in self.marcos:
+            return
+        tempo = self.tempo_decorrido()
+        self.marcos[fitness] = (iteracao, tempo)
+        self._notificar("marco", geracao=iteracao, fitness=fitness, tempo=tempo)
+
+    # motivo de parada pelo melhor fitness ou pelo orçamento, ou None para continuar
+    def _motivo_parada(self, melhor_fitness: int) -> Optional[str]:
+        if melhor_fitness == NUMERO_REGRAS:
+            return "solucao"
+        alvo = self.configuracao.fitness_alvo
+        if alvo is not None and melhor_fitness >= alvo:
+            return "fitness_alvo"
+        return self.orcamento.esgotado()
+
+    # monta o ResultadoAG (geracoes = iterações do motor), avisa os callbacks e o devolve
+    def _finalizar(
+        self,
+        cromossomo: Optional[Cromossomo],
+        fitness: int,
+        iteracoes: int,
+        motivo_parada: str,
+    ):
+        tempo_total = self.tempo_decorrido()
+        self.estatisticas["avaliacoes"] = self.avaliacoes
+        self.estatisticas["tempo"] = tempo_total
+        self.estatisticas["fitness"] = fitness
+        marcos = dict(self.marcos)
+        self.resultado = ResultadoAG(
+            cromossomo=cromossomo,
+            fitness=fitness,
+            geracoes=iteracoes,
+            avaliacoes=self.avaliacoes,
+            consultas_fitness=None,
+            tempo_total=tempo_total,
+            tempo_ate_14=min(
+                (tempo for valor, (_, tempo) in marcos.items() if valor >= 14),
+                default=None,
+            ),
+            tempo_ate_15=marcos.get(NUMERO_REGRAS, (None, None))[1],
+            marcos=marcos,
+            motivo_parada=motivo_parada,
+        )
+        self._notificar("fim_motor", motor=self, resultado=self.resultado)
+        return self.resultado
+
+    def _notificar(self, evento, **dados):
+        for callback in self.callbacks:
+            callback(evento, dados)
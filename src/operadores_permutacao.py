@@ -0,0 +1,125 @@
+"""
+Operadores de cruzamento que preservam permutações
+Cada uma das 5 colunas (atributos) é tratada como uma permutação e cruzada de forma
+independente, então filhos de pais válidos já nascem válidos (sem reparar_cromossomo).
+"""
+
+import random
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from cromossomo import Cromossomo
+
+Coluna = Sequence[int]
+OperadorColuna = Callable[[Coluna, Coluna], Tuple[List[int], List[int]]]
+
+
+# sorteia os pontos de corte [inicio, fim) de um segmento não vazio
+def _segmento() -> Tuple[int, int]:
+    inicio, fim = sorted(random.sample(range(6), 2))
+    return inicio, fim
+
+
+def _filho_pmx(pai1: Coluna, pai2: Coluna, inicio: int, fim: int) -> List[int]:
+    filho = [None] * 5
+    filho[inicio:fim] = pai1[inicio:fim]
+
+    # valores do segmento do pai2 que ficaram de fora seguem o mapeamento do segmento
+    for k in range(inicio, fim):
+        valor = pai2[k]
+        if valor in filho:
+            continue
+        posicao = k
+        while inicio <= posicao < fim:
+            posicao = pai2.index(pai1[posicao])
+        filho[posicao] = valor
+
+    for k in range(5):
+        if filho[k] is None:
+            filho[k] = pai2[k]
+    return filho
+
+
+# partially mapped crossover (PMX)
+def pmx(pai1: Coluna, pai2: Coluna) -> Tuple[List[int], List[int]]:
+    inicio, fim = _segmento()
+    return _filho_pmx(pai1, pai2, inicio, fim), _filho_pmx(pai2, pai1, inicio, fim)
+
+
+def _filho_ox(pai1: Coluna, pai2: Coluna, inicio: int, fim: int) -> List[int]:
+    filho = [None] * 5
+    filho[inicio:fim] = pai1[inicio:fim]
+    segmento = set(pai1[inicio:fim])
+
+    # completa a partir do fim do segmento, na ordem circular do pai2
+    restantes = [pai2[(fim + k) % 5] for k in range(5)]
+    restantes = [valor for valor in restantes if valor not in segmento]
+    for k, valor in zip(range(fim, fim + 5 - (fim - inicio)), restantes):
+        filho[k % 5] = valor
+    return filho
+
+
+# order crossover (OX)
+def ox(pai1: Coluna, pai2: Coluna) -> Tuple[List[int], List[int]]:
+    inicio, fim = _segmento()
+    return _filho_ox(pai1, pai2, inicio, fim), _filho_ox(pai2, pai1, inicio, fim)
+
+
+# cycle crossover (CX): ciclos alternados herdados de cada pai, posições preservadas
+def cx(pai1: Coluna, pai2: Coluna) -> Tuple[List[int], List[int]]:
+    filho1 = [None] * 5
+    filho2 = [None] * 5
+    do_pai1 = True
+
+    for inicio in range(5):
+        if filho1[inicio] is not None:
+            continue
+        posicao = inicio
+        while filho1[posicao] is None:
+            if do_pai1:
+                filho1[posicao], filho2[posicao] = pai1[posicao], pai2[posicao]
+            else:
+                filho1[posicao], filho2[posicao] = pai2[posicao], pai1[posicao]
+            posicao = pai1.index(pai2[posicao])
+        do_pai1 = not do_pai1
+
+    return filho1, filho2
+
+
+# cruzamento uniforme por coluna: cada filho herda a coluna inteira de um dos pais
+def uniforme_colunas(pai1: Coluna, pai2: Coluna) -> Tuple[List[int], List[int]]:
+    if random.random() < 0.5:
+        return list(pai1), list(pai2)
+    return list(pai2), list(pai1)
+
+
+OPERADORES_COLUNA: Dict[str, OperadorColuna] = {
+    "pmx": pmx,
+    "ox": ox,
+    "cx": cx,
+    "uniforme_colunas": uniforme_colunas,
+}
+
+
+# aplica o operador escolhido coluna a coluna // colunas com valores repetidos (pais
+# inválidos) não são permutações e caem no cruzamento uniforme por coluna
+def cruzamento_permutacao(
+    pai1: Cromossomo, pai2: Cromossomo, taxa_cruzamento: float, operador: str = "pmx"
+) -> Tuple[Cromossomo, Cromossomo]:
+    if random.random() > taxa_cruzamento:
+        return pai1, pai2
+
+    operador_coluna = OPERADORES_COLUNA[operador]
+    filho1 = bytearray(25)
+    filho2 = bytearray(25)
+
+    for atributo in range(5):
+        coluna1 = pai1[atributo::5]
+        coluna2 = pai2[atributo::5]
+        if len(set(coluna1)) == 5 and len(set(coluna2)) == 5:
+            nova1, nova2 = operador_coluna(coluna1, coluna2)
+        else:
+            nova1, nova2 = uniforme_colunas(coluna1, coluna2)
+        filho1[atributo::5] = bytes(nova1)
+        filho2[atributo::5] = bytes(nova2)
+
+    return bytes(filho1), bytes(filho2)
@@ -0,0 +1,84 @@
+"""
+Orçamentos de execução e cancelamento cooperativo do AG
+Um Orcamento junta os limites que não dependem da contagem de gerações: tempo de
+relógio, número de avaliações de fitness e um evento de parada externo (qualquer objeto
+com is_set(), ex.: threading.Event, multiprocessing.Event ou TokenCancelamento). O AG o
+consulta em pontos baratos: no início de cada geração, entre as fases mais caras, a cada
+iteração da busca local e a cada PASSO_VERIFICACAO_PARES pares do laço de descendentes.
+Esgotado, o motivo fica registrado e toda consulta seguinte o devolve, então os laços
+internos saem cedo e a geração é encerrada no próximo ponto de verificação.
+Nos pontos internos o evento de parada é lido no máximo a cada INTERVALO_EVENTO
+segundos, já que alguns eventos (ex.: Manager().Event()) são consultados por IPC.
+"""
+
+import multiprocessing
+import time
+from typing import Callable, Optional
+
+# intervalo mínimo entre leituras do evento de parada fora do início da geração
+INTERVALO_EVENTO = 0.01
+
+# no laço de descendentes, o orçamento é consultado a cada PASSO_VERIFICACAO_PARES pares
+PASSO_VERIFICACAO_PARES = 16
+
+
+class Orcamento:
+
+    # tempo_maximo em segundos a partir da criação; contar_avaliacoes() devolve as
+    # avaliações feitas até agora (obrigatório com limite_avaliacoes)
+    def __init__(
+        self,
+        tempo_maximo: Optional[float] = None,
+        limite_avaliacoes: Optional[int] = None,
+        evento_parada=None,
+        contar_avaliacoes: Optional[Callable[[], int]] = None,
+    ):
+        agora = time.perf_counter()
+        self.prazo = None if tempo_maximo is None else agora + tempo_maximo
+        self.limite_avaliacoes = limite_avaliacoes
+        self.contar_avaliacoes = contar_avaliacoes
+        self.evento_parada = evento_parada
+        self.motivo: Optional[str] = None
+        self._proxima_leitura_evento = agora
+
+    # motivo de parada ("tempo_maximo", "limite_avaliacoes" ou "interrompida") ou None
+    # // ler_evento força a leitura do evento de parada (início da geração)
+    def esgotado(self, ler_evento: bool = False) -> Optional[str]:
+        if self.motivo is not None:
+            return self.motivo
+        agora = time.perf_counter()
+        if self.prazo is not None and agora >= self.prazo:
+            self.motivo = "tempo_maximo"
+        elif (
+            self.limite_avaliacoes is not None
+            and self.contar_avaliacoes() >= self.limite_avaliacoes
+        ):
+            self.motivo = "limite_avaliacoes"
+        elif self.evento_parada is not None and (
+            ler_evento or agora >= self._proxima_leitura_evento
+        ):
+            self._proxima_leitura_evento = agora + INTERVALO_EVENTO
+            if self.evento_parada.is_set():
+                self.motivo = "interrompida"
+        return self.motivo
+
+
+# sinal de cancelamento compartilhável entre threads e processos filhos (um
+# multiprocessing.Event; para pools, passe um Manager().Event() em `evento`) // tem a
+# interface de evento (set/is_set), então serve direto como evento_parada do AG
+class TokenCancelamento:
+
+    def __init__(self, evento=None):
+        self.evento = evento if evento is not None else multiprocessing.Event()
+
+    def cancelar(self) -> None:
+        self.evento.set()
+
+    def cancelado(self) -> bool:
+        return self.evento.is_set()
+
+    def set(self) -> None:
+        self.evento.set()
+
+    def is_set(self) -> bool:
+        return self.evento.is_set()
@@ -0,0 +1,133 @@
+"""
+Perfil por fase do laço de gerações do AG
+Cronômetro de voltas com time.perf_counter_ns: cada marcar(fase) atribui à fase o tempo
+desde a marca anterior, e os tempos de cada fase são somados por geração. No fim, cada
+fase tem total, média por geração e percentis, e o perfil pode ser exportado em JSON.
+No laço de pares (cruzamento e mutação) só uma amostra dos pares é cronometrada por
+etapa, já que ler o relógio duas vezes por par custaria mais de 1% da geração.
+Desligado, o AG usa PerfilDesligado, cujos métodos não fazem nada.
+"""
+
+import json
+import math
+from collections import defaultdict
+from time import perf_counter_ns
+from typing import Dict, List
+
+# no laço de pares do AG, 1 a cada PASSO_AMOSTRA_PARES pares é cronometrado por etapa
+PASSO_AMOSTRA_PARES = 8
+
+
+# percentil pelo posto mais próximo sobre uma lista já ordenada (não vazia)
+def _percentil(ordenados: List[int], p: float) -> int:
+    return ordenados[max(1, math.ceil(p / 100 * len(ordenados))) - 1]
+
+
+class PerfilFases:
+
+    ativo = True
+
+    def __init__(self):
+        self.fases: Dict[str, List[int]] = {}  # fase -> ns em cada geração
+        self.geracoes = 0
+        self._geracao: Dict[str, int] = defaultdict(int)
+        self._marca = perf_counter_ns()
+
+    def _fechar_geracao(self) -> None:
+        if not self._geracao:
+            return
+        for fase, nanossegundos in self._geracao.items():
+            self.fases.setdefault(fase, []).append(nanossegundos)
+        self._geracao = defaultdict(int)
+        self.geracoes += 1
+
+    # começo de uma geração: fecha a anterior e zera o cronômetro
+    def iniciar_geracao(self) -> None:
+        self._fechar_geracao()
+        self._marca = perf_counter_ns()
+
+    # atribui à fase o tempo desde a última marca
+    def marcar(self, fase: str) -> None:
+        agora = perf_counter_ns()
+        self._geracao[fase] += agora - self._marca
+        self._marca = agora
+
+    # divide o tempo desde a última marca entre várias fases, na proporção dos tempos
+    # amostrados de cada uma (laços internos em que cronometrar toda iteração pesaria)
+    def dividir(self, amostras: Dict[str, int]) -> None:
+        agora = perf_counter_ns()
+        decorrido = agora - self._marca
+        total_amostras = sum(amostras.values())
+        for fase, amostra in amostras.items():
+            if total_amostras:
+                self._geracao[fase] += decorrido * amostra // total_amostras
+            else:
+                self._geracao[fase] += decorrido // len(amostras)
+        self._marca = agora
+
+    # reinicia a marca sem atribuir o tempo a nenhuma fase (pausas fora do AG)
+    def descartar(self) -> None:
+        self._marca = perf_counter_ns()
+
+    # por fase: total, gerações em que ocorreu, média, percentis e fração do total
+    def resumo(self) -> Dict[str, dict]:
+        self._fechar_geracao()
+        total_geral = sum(sum(tempos) for tempos in self.fases.values()) or 1
+        resumo = {}
+        for fase, tempos in self.fases.items():
+            ordenados = sorted(tempos)
+            total = sum(tempos)
+            resumo[fase] = {
+                "total_ns": total,
+                "geracoes": len(tempos),
+                "media_ns": total / len(tempos),
+                "p50_ns": _percentil(ordenados, 50),
+                "p90_ns": _percentil(ordenados, 90),
+                "p99_ns": _percentil(ordenados, 99),
+                "maximo_ns": ordenados[-1],
+                "fracao": total / total_geral,
+            }
+        return resumo
+
+    def exportar_json(self, caminho: str) -> None:
+        dados = {"geracoes": self.geracoes, "fases": self.resumo()}
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(dados, arquivo, ensure_ascii=False, indent=2)
+
+    def imprimir(self) -> None:
+        resumo = self.resumo()
+        if not resumo:
+            return
+        print(f"   Perfil por fase ({self.geracoes:,} gerações, tempos por geração):")
+        print(
+            f"      {'Fase':22s} {'Total':>9s} {'%':>6s} {'Média':>10s} {'p50':>10s} {'p90':>10s} {'p99':>10s}"
+        )
+        for fase, medidas in sorted(
+            resumo.items(), key=lambda item: item[1]["total_ns"], reverse=True
+        ):
+            print(
+                f"      {fase:22s} {medidas['total_ns'] / 1e9:8.2f}s {medidas['fracao'] * 100:5.1f}% "
+                f"{medidas['media_ns'] / 1e6:8.2f}ms {medidas['p50_ns'] / 1e6:8.2f}ms "
+                f"{medidas['p90_ns'] / 1e6:8.2f}ms {medidas['p99_ns'] / 1e6:8.2f}ms"
+            )
+
+
+# substituto sem custo quando o perfil está desligado
+class PerfilDesligado:
+
+    ativo = False
+
+    def iniciar_geracao(self) -> None:
+        pass
+
+    def marcar(self, fase: str) -> None:
+        pass
+
+    def dividir(self, amostras: Dict[str, int]) -> None:
+        pass
+
+    def descartar(self) -> None:
+        pass
+
+    def imprimir(self) -> None:
+        pass
@@ -0,0 +1,210 @@
+"""
+Pontos de controle (checkpoints) binários do AG
+Um ponto de controle guarda o estado completo do AlgoritmoGeneticoAvancado no início
+de uma geração: população, melhor global, parâmetros adaptativos, contadores de
+estagnação, marcos, estatísticas, completações já tentadas, o conteúdo do cache de
+fitness (em ordem LRU) e o estado do random. Retomado com a mesma configuração, o AG
+segue exatamente a mesma trajetória da execução original, com os mesmos acertos e
+falhas do cache e portanto a mesma contagem de avaliações (e o mesmo ponto de parada
+com limite_avaliacoes).
+Formato (little-endian): cabeçalho com assinatura, versão, tamanho e CRC32 do corpo;
+no corpo, a configuração em JSON, os escalares em campos de tamanho fixo e os
+cromossomos empacotados em base 5 (25 genes < 5 cabem num uint64: 8 bytes em vez de
+25); as máscaras do cache vão como uint16. A gravação vai para um arquivo temporário no mesmo diretório, com fsync, e
+substitui o anterior com os.replace, então o arquivo nunca fica pela metade.
+"""
+
+import json
+import math
+import os
+import struct
+import zlib
+from typing import Iterable, List
+
+import numpy as np
+
+from cromossomo import Cromossomo, TAMANHO_CROMOSSOMO
+
+ASSINATURA = b"AGPC"
+# 2: limite de combinações da completação; 3: cache de fitness; 4: avaliações da
+# completação exata
+VERSAO_FORMATO = 4
+
+# assinatura, versão, tamanho do corpo e CRC32 do corpo
+_CABECALHO = struct.Struct("<4sHQI")
+
+# escalares do estado, na ordem em que são gravados // tempo_atingiu_14 é NaN quando None
+CAMPOS_ESCALARES = (
+    ("geracao", "I"),
+    ("geracoes_executadas", "I"),
+    ("melhor_fitness_global", "B"),
+    ("tempo_decorrido", "d"),
+    ("tempo_atingiu_14", "d"),
+    ("percentual_diversidade", "d"),
+    ("tamanho_populacao", "I"),
+    ("taxa_cruzamento", "d"),
+    ("taxa_mutacao", "d"),
+    ("geracoes_sem_melhoria", "I"),
+    ("melhor_fitness_atual", "B"),
+    ("geracoes_no_fitness_14", "I"),
+    ("geracoes_no_fitness_13", "I"),
+    ("buscas_locais", "Q"),
+    ("avaliacoes_busca_local", "Q"),
+    ("melhorias_busca_local", "Q"),
+    ("acertos_cache", "Q"),
+    ("falhas_cache", "Q"),
+    ("remocoes_cache", "Q"),
+    ("avaliacoes_diretas", "Q"),
+    ("avaliacoes_completacao", "Q"),
+)
+_ESCALARES = struct.Struct("<" + "".join(formato for _, formato in CAMPOS_ESCALARES))
+
+_CONTAGEM = struct.Struct("<I")
+_MARCO = struct.Struct("<BId")  # fitness, geração, segundos
+_VERSAO_RANDOM = struct.Struct("<B")
+_GAUSS = struct.Struct("<?d")  # gauss_next do random (presente, valor)
+PALAVRAS_RANDOM = 625  # 624 palavras do Mersenne Twister + posição
+
+BASE_GENES = 5
+_POTENCIAS = BASE_GENES ** np.arange(TAMANHO_CROMOSSOMO, dtype=np.uint64)
+
+
+# cromossomos -> uint64 em base 5 (o gene i é o i-ésimo dígito)
+def empacotar_cromossomos(cromossomos: Iterable[Cromossomo]) -> bytes:
+    dados = b"".join(cromossomos)
+    if not dados:
+        return b""
+    genes = np.frombuffer(dados, dtype=np.uint8).reshape(-1, TAMANHO_CROMOSSOMO)
+    if genes.max() >= BASE_GENES:
+        raise ValueError("Cromossomo com gene fora do intervalo 0..4")
+    return (genes.astype(np.uint64) @ _POTENCIAS).astype("<u8").tobytes()
+
+
+def desempacotar_cromossomos(dados: bytes) -> List[Cromossomo]:
+    codigos = np.frombuffer(dados, dtype="<u8").astype(np.uint64)
+    genes = ((codigos[:, None] // _POTENCIAS) % BASE_GENES).astype(np.uint8).tobytes()
+    return [
+        genes[inicio : inicio + TAMANHO_CROMOSSOMO]
+        for inicio in range(0, len(genes), TAMANHO_CROMOSSOMO)
+    ]
+
+
+def _secao(dados: bytes) -> bytes:
+    return _CONTAGEM.pack(len(dados)) + dados
+
+
+# leitura sequencial do corpo, com erro claro se ele terminar antes do esperado
+class _Leitor:
+
+    def __init__(self, corpo: bytes):
+        self.corpo = corpo
+        self.posicao = 0
+
+    def ler(self, estrutura: struct.Struct) -> tuple:
+        if self.posicao + estrutura.size > len(self.corpo):
+            raise ValueError("Ponto de controle truncado")
+        valores = estrutura.unpack_from(self.corpo, self.posicao)
+        self.posicao += estrutura.size
+        return valores
+
+    def secao(self) -> bytes:
+        (tamanho,) = self.ler(_CONTAGEM)
+        if self.posicao + tamanho > len(self.corpo):
+            raise ValueError("Ponto de controle truncado")
+        dados = self.corpo[self.posicao : self.posicao + tamanho]
+        self.posicao += tamanho
+        return dados
+
+
+# estado (dict com "configuracao", os CAMPOS_ESCALARES, "marcos", "melhor_cromossomo",
+# "populacao", "completacoes_tentadas", "cache_cromossomos", "cache_mascaras" e
+# "estado_random") -> corpo binário
+def serializar_estado(estado: dict) -> bytes:
+    escalares = dict(estado)
+    if escalares["tempo_atingiu_14"] is None:
+        escalares["tempo_atingiu_14"] = math.nan
+    versao_random, palavras, gauss = estado["estado_random"]
+    melhor = estado["melhor_cromossomo"]
+
+    partes = [
+        _secao(json.dumps(estado["configuracao"]).encode("utf-8")),
+        _ESCALARES.pack(*(escalares[nome] for nome, _ in CAMPOS_ESCALARES)),
+        _secao(
+            b"".join(
+                _MARCO.pack(fitness, geracao, tempo)
+                for fitness, (geracao, tempo) in sorted(estado["marcos"].items())
+            )
+        ),
+        _secao(empacotar_cromossomos([melhor] if melhor is not None else [])),
+        _secao(empacotar_cromossomos(estado["populacao"])),
+        _secao(empacotar_cromossomos(estado["completacoes_tentadas"])),
+        _secao(empacotar_cromossomos(estado["cache_cromossomos"])),
+        _secao(np.array(estado["cache_mascaras"], dtype="<u2").tobytes()),
+        _VERSAO_RANDOM.pack(versao_random),
+        np.array(palavras, dtype="<u4").tobytes(),
+        _GAUSS.pack(gauss is not None, gauss or 0.0),
+    ]
+    return b"".join(partes)
+
+
+def desserializar_estado(corpo: bytes) -> dict:
+    leitor = _Leitor(corpo)
+    estado = {"configuracao": json.loads(leitor.secao().decode("utf-8"))}
+    estado.update(zip((nome for nome, _ in CAMPOS_ESCALARES), leitor.ler(_ESCALARES)))
+    if math.isnan(estado["tempo_atingiu_14"]):
+        estado["tempo_atingiu_14"] = None
+
+    marcos = leitor.secao()
+    estado["marcos"] = {
+        fitness: (geracao, tempo)
+        for fitness, geracao, tempo in _MARCO.iter_unpack(marcos)
+    }
+    melhor = desempacotar_cromossomos(leitor.secao())
+    estado["melhor_cromossomo"] = melhor[0] if melhor else None
+    estado["populacao"] = desempacotar_cromossomos(leitor.secao())
+    estado["completacoes_tentadas"] = set(desempacotar_cromossomos(leitor.secao()))
+    estado["cache_cromossomos"] = desempacotar_cromossomos(leitor.secao())
+    estado["cache_mascaras"] = np.frombuffer(leitor.secao(), dtype="<u2").tolist()
+    if len(estado["cache_mascaras"]) != len(estado["cache_cromossomos"]):
+        raise ValueError("Ponto de controle com cache de fitness inconsistente")
+
+    (versao_random,) = leitor.ler(_VERSAO_RANDOM)
+    palavras = leitor.ler(struct.Struct(f"<{PALAVRAS_RANDOM}I"))
+    tem_gauss, gauss = leitor.ler(_GAUSS)
+    estado["estado_random"] = (versao_random, palavras, gauss if tem_gauss else None)
+    if leitor.posicao != len(corpo):
+        raise ValueError("Ponto de controle com dados excedentes")
+    return estado
+
+
+# grava o ponto de controle de forma atômica // retorna o tamanho do arquivo em bytes
+def salvar_ponto_controle(caminho: str, estado: dict) -> int:
+    corpo = serializar_estado(estado)
+    dados = (
+        _CABECALHO.pack(ASSINATURA, VERSAO_FORMATO, len(corpo), zlib.crc32(corpo))
+        + corpo
+    )
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(dados)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, caminho)
+    return len(dados)
+
+
+# lê e valida (assinatura, versão, tamanho e CRC32) um ponto de controle
+def carregar_ponto_controle(caminho: str) -> dict:
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+    if len(dados) < _CABECALHO.size:
+        raise ValueError(f"Ponto de controle truncado: {caminho}")
+    assinatura, versao, tamanho, crc = _CABECALHO.unpack_from(dados)
+    if assinatura != ASSINATURA:
+        raise ValueError(f"Arquivo não é um ponto de controle do AG: {caminho}")
+    if versao != VERSAO_FORMATO:
+        raise ValueError(f"Versão de ponto de controle não suportada: {versao}")
+    corpo = dados[_CABECALHO.size :]
+    if len(corpo) != tamanho or zlib.crc32(corpo) != crc:
+        raise ValueError(f"Ponto de controle corrompido (CRC32/tamanho): {caminho}")
+    return desserializar_estado(corpo)
@@ -0,0 +1,57 @@
+"""
+Ranking da população por baldes de fitness (counting sort)
+O fitness simples só assume os valores inteiros 0..15, então a ordenação da população
+é feita em O(n) distribuindo os indivíduos em 16 baldes, que também dão acesso O(1) a
+todos os indivíduos de um mesmo fitness e às contagens por nível.
+"""
+
+from typing import List, Sequence, Tuple
+
+from cromossomo import Cromossomo
+from einstein_rules import NUMERO_REGRAS
+
+
+class RankingPopulacao:
+
+    def __init__(self, populacao: Sequence[Cromossomo], valores_fitness: Sequence[int]):
+        self.baldes: List[List[Cromossomo]] = [[] for _ in range(NUMERO_REGRAS + 1)]
+        for cromossomo, valor in zip(populacao, valores_fitness):
+            self.baldes[valor].append(cromossomo)
+
+        self.contagem = [len(balde) for balde in self.baldes]
+        self.tamanho = len(populacao)
+        self.melhor_fitness = max(
+            (valor for valor, n in enumerate(self.contagem) if n), default=0
+        )
+
+    # todos os indivíduos com o fitness dado, na ordem original da população
+    def nivel(self, valor: int) -> List[Cromossomo]:
+        return self.baldes[valor]
+
+    def quantidade(self, valor: int) -> int:
+        return self.contagem[valor]
+
+    def quantidade_abaixo(self, valor: int) -> int:
+        return sum(self.contagem[:valor])
+
+    def media(self) -> float:
+        soma = sum(valor * n for valor, n in enumerate(self.contagem))
+        return soma / self.tamanho
+
+    # os k melhores sem montar a população inteira (percorre só os baldes do topo)
+    def melhores(self, k: int) -> Tuple[List[Cromossomo], List[int]]:
+        cromossomos = []
+        valores = []
+        for valor in range(NUMERO_REGRAS, -1, -1):
+            faltam = k - len(cromossomos)
+            if faltam <= 0:
+                break
+            balde = self.baldes[valor][:faltam]
+            cromossomos.extend(balde)
+            valores.extend([valor] * len(balde))
+        return cromossomos, valores
+
+    # população inteira do melhor para o pior // estável: empates mantêm a ordem
+    # original, exatamente como sorted(..., reverse=True)
+    def ordenada(self) -> Tuple[List[Cromossomo], List[int]]:
+        return self.melhores(self.tamanho)
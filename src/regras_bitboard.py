@@ -0,0 +1,185 @@
+"""
+Motor de regras por bitboards para o Desafio de Einstein
+O cromossomo é convertido uma única vez em 25 máscaras de 5 bits (uma por valor de
+cada atributo, bit i = casa i) e as 15 regras viram operações inteiras.
+"""
+
+import random
+from itertools import product
+from typing import Callable, List, Sequence, Tuple
+
+from cromossomo import (
+    COR,
+    NACIONALIDADE,
+    BEBIDA,
+    CIGARRO,
+    ANIMAL,
+    VERMELHA,
+    VERDE,
+    BRANCA,
+    AMARELA,
+    AZUL,
+    INGLES,
+    SUECO,
+    DINAMARQUES,
+    NORUEGUES,
+    ALEMAO,
+    CHA,
+    CAFE,
+    LEITE,
+    CERVEJA,
+    AGUA,
+    PALL_MALL,
+    DUNHILL,
+    BLENDS,
+    BLUEMASTER,
+    PRINCE,
+    CACHORROS,
+    PASSAROS,
+    GATOS,
+    CAVALOS,
+    Cromossomo,
+)
+
+# máscaras dos 5 valores para cada uma das 5^5 colunas possíveis (inclusive inválidas)
+_MASCARAS_COLUNA = {
+    bytes(valores): tuple(
+        sum(1 << casa for casa, v in enumerate(valores) if v == valor)
+        for valor in range(5)
+    )
+    for valores in product(range(5), repeat=5)
+}
+
+# índice de cada valor usado pelas regras na tabela de máscaras (atributo * 5 + valor)
+_VERMELHA = COR * 5 + VERMELHA
+_VERDE = COR * 5 + VERDE
+_BRANCA = COR * 5 + BRANCA
+_AMARELA = COR * 5 + AMARELA
+_AZUL = COR * 5 + AZUL
+_INGLES = NACIONALIDADE * 5 + INGLES
+_SUECO = NACIONALIDADE * 5 + SUECO
+_DINAMARQUES = NACIONALIDADE * 5 + DINAMARQUES
+_NORUEGUES = NACIONALIDADE * 5 + NORUEGUES
+_ALEMAO = NACIONALIDADE * 5 + ALEMAO
+_CHA = BEBIDA * 5 + CHA
+_CAFE = BEBIDA * 5 + CAFE
+_LEITE = BEBIDA * 5 + LEITE
+_CERVEJA = BEBIDA * 5 + CERVEJA
+_AGUA = BEBIDA * 5 + AGUA
+_PALL_MALL = CIGARRO * 5 + PALL_MALL
+_DUNHILL = CIGARRO * 5 + DUNHILL
+_BLENDS = CIGARRO * 5 + BLENDS
+_BLUEMASTER = CIGARRO * 5 + BLUEMASTER
+_PRINCE = CIGARRO * 5 + PRINCE
+_CACHORROS = ANIMAL * 5 + CACHORROS
+_PASSAROS = ANIMAL * 5 + PASSAROS
+_GATOS = ANIMAL * 5 + GATOS
+_CAVALOS = ANIMAL * 5 + CAVALOS
+
+
+# máscara de posições (bit i = casa i) para cada um dos 25 valores de atributo,
+# indexada por atributo * 5 + valor
+def mascaras_posicao(cromossomo: Cromossomo) -> Tuple[int, ...]:
+    return (
+        _MASCARAS_COLUNA[cromossomo[0::5]]
+        + _MASCARAS_COLUNA[cromossomo[1::5]]
+        + _MASCARAS_COLUNA[cromossomo[2::5]]
+        + _MASCARAS_COLUNA[cromossomo[3::5]]
+        + _MASCARAS_COLUNA[cromossomo[4::5]]
+    )
+
+
+# avalia as 15 regras e retorna a máscara de satisfação (bit k = regra k + 1)
+def avaliar_bitboard(cromossomo: Cromossomo) -> int:
+    m = mascaras_posicao(cromossomo)
+
+    verde = m[_VERDE]
+    branca = m[_BRANCA]
+    noruegues = m[_NORUEGUES]
+    blends = m[_BLENDS]
+    vizinhos_blends = (blends << 1) | (blends >> 1)
+    cavalos = m[_CAVALOS]
+    primeiro_noruegues = noruegues & -noruegues
+
+    return (
+        (noruegues & 1)  # r1: primeira casa
+        | bool(m[_VERMELHA] & m[_INGLES]) << 1  # r2
+        | bool(m[_SUECO] & m[_CACHORROS]) << 2  # r3
+        | bool(m[_DINAMARQUES] & m[_CHA]) << 3  # r4
+        # r5: primeira Branca logo à direita da primeira Verde
+        | bool(verde and (branca & -branca) == (verde & -verde) << 1) << 4
+        | bool(verde & m[_CAFE]) << 5  # r6
+        | bool(m[_PALL_MALL] & m[_PASSAROS]) << 6  # r7
+        | bool(m[_AMARELA] & m[_DUNHILL]) << 7  # r8
+        | bool(m[_LEITE] & 0b00100) << 8  # r9: casa do meio
+        | bool(vizinhos_blends & m[_GATOS]) << 9  # r10
+        | bool(((cavalos << 1) | (cavalos >> 1)) & m[_DUNHILL]) << 10  # r11
+        | bool(m[_BLUEMASTER] & m[_CERVEJA]) << 11  # r12
+        | bool(m[_ALEMAO] & m[_PRINCE]) << 12  # r13
+        # r14: vizinhos do primeiro Norueguês
+        | bool(((primeiro_noruegues << 1) | (primeiro_noruegues >> 1)) & m[_AZUL]) << 13
+        | bool(vizinhos_blends & m[_AGUA]) << 14  # r15
+    )
+
+
+# gera uma função por regra (máscaras de posição -> bool) a partir da descrição
+# declarativa (ESPECIFICACAO_REGRAS), usada para reavaliar regras isoladamente
+def compilar_regras(
+    especificacao: Sequence[tuple],
+) -> List[Callable[[Sequence[int]], bool]]:
+    avaliadores = []
+    for tipo, atributo_a, valor_a, atributo_b, valor_b in especificacao:
+        a = atributo_a * 5 + valor_a
+        if tipo == "casa":
+            bit_casa = 1 << valor_b
+            avaliadores.append(lambda m, a=a, bit=bit_casa: bool(m[a] & bit))
+            continue
+
+        b = atributo_b * 5 + valor_b
+        if tipo == "mesma_casa":
+            avaliadores.append(lambda m, a=a, b=b: bool(m[a] & m[b]))
+        elif tipo == "esquerda":
+
+            def esquerda(m, a=a, b=b):
+                x = m[a]
+                y = m[b]
+                return bool(x) and (y & -y) == (x & -x) << 1
+
+            avaliadores.append(esquerda)
+        elif tipo == "ao_lado":
+            avaliadores.append(
+                lambda m, a=a, b=b: bool(((m[a] << 1) | (m[a] >> 1)) & m[b])
+            )
+        else:  # ao_lado_primeira
+
+            def ao_lado_primeira(m, a=a, b=b):
+                x = m[a] & -m[a]
+                return bool(((x << 1) | (x >> 1)) & m[b])
+
+            avaliadores.append(ao_lado_primeira)
+
+    return avaliadores
+
+
+# compara o motor de bitboards com as regras originais (REGRAS) em cromossomos aleatórios,
+# incluindo cromossomos com valores repetidos // retorna os cromossomos divergentes
+def verificar_equivalencia(amostras: int = 10000) -> List[Cromossomo]:
+    from einstein_rules import REGRAS
+
+    divergentes = []
+    for indice in range(amostras):
+        colunas = [random.sample(range(5), 5) for _ in range(5)]
+        genes = bytearray(
+            colunas[atributo][casa] for casa in range(5) for atributo in range(5)
+        )
+        # metade das amostras recebe genes sobrescritos (valores duplicados)
+        if indice % 2:
+            for _ in range(random.randint(1, 4)):
+                genes[random.randrange(25)] = random.randrange(5)
+        cromossomo = bytes(genes)
+
+        esperado = sum(1 << k for k, regra in enumerate(REGRAS) if regra(cromossomo))
+        if avaliar_bitboard(cromossomo) != esperado:
+            divergentes.append(cromossomo)
+
+    return divergentes
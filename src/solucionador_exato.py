@@ -0,0 +1,171 @@
+"""
+Solucionador exato do Desafio de Einstein por propagação de restrições
+As variáveis são as 5 colunas do cromossomo e o domínio de cada uma são as 120
+permutações (ranks de tabelas_permutacao), representado como um inteiro de 120 bits.
+As regras de uma coluna filtram os domínios (consistência de nó), as regras entre duas
+colunas viram tabelas de suporte (arco-consistência AC-3 na raiz e forward checking na
+busca) e o backtracking enumera todas as soluções, provando a unicidade.
+"""
+
+import time
+from typing import Dict, List, Tuple
+
+from cromossomo import Cromossomo, NUMERO_ATRIBUTOS
+from einstein_rules import ATRIBUTOS_REGRAS, fitness
+from tabelas_permutacao import NUMERO_PERMUTACOES, TABELAS_REGRAS, desranquear
+
+DOMINIO_COMPLETO = (1 << NUMERO_PERMUTACOES) - 1
+
+
+# domínio inicial de cada coluna: permutações que satisfazem as regras de uma coluna só
+def _dominios_iniciais() -> List[int]:
+    dominios = [DOMINIO_COMPLETO] * NUMERO_ATRIBUTOS
+    for tabela, atributos in zip(TABELAS_REGRAS, ATRIBUTOS_REGRAS):
+        if len(atributos) == 1:
+            (a,) = atributos
+            dominios[a] &= sum(
+                1 << rank for rank in range(NUMERO_PERMUTACOES) if tabela[rank]
+            )
+    return dominios
+
+
+# suportes das restrições binárias: SUPORTES[(a, b)][rank_a] = bits dos ranks de b
+# compatíveis com rank_a em todas as regras que envolvem o par (nos dois sentidos)
+def _construir_suportes() -> Dict[Tuple[int, int], List[int]]:
+    tabelas_par: Dict[Tuple[int, int], List[bytes]] = {}
+    for tabela, atributos in zip(TABELAS_REGRAS, ATRIBUTOS_REGRAS):
+        if len(atributos) == 2:
+            tabelas_par.setdefault(atributos, []).append(tabela)
+
+    suportes = {}
+    for (a, b), tabelas in tabelas_par.items():
+        suporte_a = [0] * NUMERO_PERMUTACOES
+        suporte_b = [0] * NUMERO_PERMUTACOES
+        for rank_a in range(NUMERO_PERMUTACOES):
+            base = rank_a * NUMERO_PERMUTACOES
+            for rank_b in range(NUMERO_PERMUTACOES):
+                if all(tabela[base + rank_b] for tabela in tabelas):
+                    suporte_a[rank_a] |= 1 << rank_b
+                    suporte_b[rank_b] |= 1 << rank_a
+        suportes[(a, b)] = suporte_a
+        suportes[(b, a)] = suporte_b
+    return suportes
+
+
+DOMINIOS_INICIAIS = _dominios_iniciais()
+SUPORTES = _construir_suportes()
+
+# colunas ligadas a cada coluna por ao menos uma regra binária
+VIZINHOS_RESTRICAO = [
+    [b for b in range(NUMERO_ATRIBUTOS) if (a, b) in SUPORTES]
+    for a in range(NUMERO_ATRIBUTOS)
+]
+
+
+def _ranks(dominio: int) -> List[int]:
+    ranks = []
+    while dominio:
+        bit = dominio & -dominio
+        ranks.append(bit.bit_length() - 1)
+        dominio ^= bit
+    return ranks
+
+
+# união dos suportes em b de todos os valores ainda possíveis em a
+def _suporte_dominio(dominios: List[int], a: int, b: int) -> int:
+    suporte = SUPORTES[(a, b)]
+    alcancaveis = 0
+    for rank in _ranks(dominios[a]):
+        alcancaveis |= suporte[rank]
+    return alcancaveis
+
+
+# AC-3 sobre os domínios (bitsets) // retorna False se algum domínio esvaziar
+def arco_consistencia(dominios: List[int], estatisticas: Dict[str, int]) -> bool:
+    fila = [(a, b) for a in range(NUMERO_ATRIBUTOS) for b in VIZINHOS_RESTRICAO[a]]
+    while fila:
+        a, b = fila.pop()
+        estatisticas["revisoes"] += 1
+        reduzido = dominios[b] & _suporte_dominio(dominios, a, b)
+        if reduzido == dominios[b]:
+            continue
+        estatisticas["valores_removidos"] += bin(dominios[b] ^ reduzido).count("1")
+        dominios[b] = reduzido
+        if not reduzido:
+            return False
+        fila.extend((b, c) for c in VIZINHOS_RESTRICAO[b] if c != a)
+    return True
+
+
+def _buscar(
+    dominios: List[int],
+    atribuidos: Dict[int, int],
+    solucoes: List[Cromossomo],
+    estatisticas: Dict[str, int],
+    todas: bool,
+) -> bool:
+    if len(atribuidos) == NUMERO_ATRIBUTOS:
+        solucoes.append(desranquear([atribuidos[a] for a in range(NUMERO_ATRIBUTOS)]))
+        return not todas
+
+    # heurística MRV: coluna livre com o menor domínio
+    atributo = min(
+        (a for a in range(NUMERO_ATRIBUTOS) if a not in atribuidos),
+        key=lambda a: bin(dominios[a]).count("1"),
+    )
+
+    for rank in _ranks(dominios[atributo]):
+        estatisticas["nos"] += 1
+        atribuidos[atributo] = rank
+
+        # forward checking: filtra as colunas livres ligadas à coluna atribuída
+        novos = list(dominios)
+        novos[atributo] = 1 << rank
+        consistente = True
+        for b in VIZINHOS_RESTRICAO[atributo]:
+            if b in atribuidos:
+                continue
+            novos[b] &= SUPORTES[(atributo, b)][rank]
+            if not novos[b]:
+                consistente = False
+                break
+
+        if consistente:
+            if _buscar(novos, atribuidos, solucoes, estatisticas, todas):
+                return True
+        else:
+            estatisticas["podas"] += 1
+
+        del atribuidos[atributo]
+
+    return False
+
+
+# resolve o desafio exatamente // retorna todas as soluções (ou só a primeira, com
+# todas=False) e as estatísticas da busca // com ac3=False a busca parte só da
+# consistência de nó e fica apenas com o forward checking
+def resolver_exato(
+    todas: bool = True, ac3: bool = True
+) -> Tuple[List[Cromossomo], dict]:
+    inicio = time.perf_counter()
+    estatisticas = {"nos": 0, "podas": 0, "revisoes": 0, "valores_removidos": 0}
+
+    dominios = list(DOMINIOS_INICIAIS)
+    estatisticas["tamanho_dominios_iniciais"] = [bin(d).count("1") for d in dominios]
+
+    solucoes: List[Cromossomo] = []
+    consistente = True
+    if ac3:
+        consistente = arco_consistencia(dominios, estatisticas)
+        estatisticas["tamanho_dominios_ac3"] = [bin(d).count("1") for d in dominios]
+    if consistente:
+        _buscar(dominios, {}, solucoes, estatisticas, todas)
+
+    estatisticas["solucoes"] = len(solucoes)
+    estatisticas["tempo"] = time.perf_counter() - inicio
+    return solucoes, estatisticas
+
+
+# confere as soluções do solucionador com a função de fitness do AG
+def verificar_solucoes(solucoes: List[Cromossomo]) -> bool:
+    return all(fitness(solucao) == 15 for solucao in solucoes)
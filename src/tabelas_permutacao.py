@@ -0,0 +1,124 @@
+"""
+Tabelas de consulta sobre permutações das colunas do cromossomo
+Cada coluna de um cromossomo válido é uma das 5! = 120 permutações; com as colunas
+ranqueadas (código de Lehmer), o fitness vira ~15 consultas em tabelas pré-calculadas.
+As tabelas são construídas uma única vez na importação (~0.1 s).
+"""
+
+from itertools import permutations
+from typing import List, Sequence, Tuple
+
+from cromossomo import Cromossomo
+from einstein_rules import (
+    ATRIBUTOS_REGRAS,
+    ESPECIFICACAO_REGRAS,
+    CONTAGEM_REGRAS,
+)
+from regras_bitboard import compilar_regras
+
+NUMERO_PERMUTACOES = 120
+
+# permutações em ordem lexicográfica: PERMUTACOES[rank] = valores nas casas 0..4
+PERMUTACOES = list(permutations(range(5)))
+
+
+# rank lexicográfico da permutação pelo código de Lehmer
+def ranquear_permutacao(permutacao: Sequence[int]) -> int:
+    rank = 0
+    restantes = list(range(5))
+    for posicao, valor in enumerate(permutacao):
+        indice = restantes.index(valor)
+        rank = rank * (5 - posicao) + indice
+        restantes.pop(indice)
+    return rank
+
+
+# consulta direta coluna (bytes) -> rank, para ranquear cromossomos sem recalcular o código
+RANK_COLUNA = {bytes(p): ranquear_permutacao(p) for p in PERMUTACOES}
+
+# máscaras de posição dos 5 valores em cada permutação (bit i = casa i)
+MASCARAS_PERMUTACAO = [
+    tuple(1 << p.index(valor) for valor in range(5)) for p in PERMUTACOES
+]
+
+Genoma = Tuple[int, int, int, int, int]
+
+
+# cromossomo válido -> 5 ranks (um por atributo) // KeyError para colunas com repetição
+def ranquear(cromossomo: Cromossomo) -> Genoma:
+    return (
+        RANK_COLUNA[cromossomo[0::5]],
+        RANK_COLUNA[cromossomo[1::5]],
+        RANK_COLUNA[cromossomo[2::5]],
+        RANK_COLUNA[cromossomo[3::5]],
+        RANK_COLUNA[cromossomo[4::5]],
+    )
+
+
+# 5 ranks -> cromossomo compacto
+def desranquear(genoma: Sequence[int]) -> Cromossomo:
+    colunas = [PERMUTACOES[rank] for rank in genoma]
+    return bytes(colunas[atributo][casa] for casa in range(5) for atributo in range(5))
+
+
+# constrói a tabela de uma regra: 120 entradas (uma coluna) ou 120 x 120 (duas colunas)
+def _construir_tabela(regra, atributos: Tuple[int, ...]) -> bytes:
+    mascaras = [0] * 25
+    if len(atributos) == 1:
+        (a,) = atributos
+        tabela = bytearray(NUMERO_PERMUTACOES)
+        for rank, valores in enumerate(MASCARAS_PERMUTACAO):
+            mascaras[a * 5 : a * 5 + 5] = valores
+            tabela[rank] = regra(mascaras)
+        return bytes(tabela)
+
+    a, b = atributos
+    tabela = bytearray(NUMERO_PERMUTACOES * NUMERO_PERMUTACOES)
+    for rank_a, valores_a in enumerate(MASCARAS_PERMUTACAO):
+        mascaras[a * 5 : a * 5 + 5] = valores_a
+        base = rank_a * NUMERO_PERMUTACOES
+        for rank_b, valores_b in enumerate(MASCARAS_PERMUTACAO):
+            mascaras[b * 5 : b * 5 + 5] = valores_b
+            tabela[base + rank_b] = regra(mascaras)
+    return bytes(tabela)
+
+
+# uma tabela por regra, na ordem de REGRAS; índice rank_a * 120 + rank_b para regras de
+# duas colunas (atributos em ordem crescente, ver ATRIBUTOS_REGRAS) e rank para as demais
+TABELAS_REGRAS = [
+    _construir_tabela(regra, atributos)
+    for regra, atributos in zip(compilar_regras(ESPECIFICACAO_REGRAS), ATRIBUTOS_REGRAS)
+]
+
+_REGRAS_UNARIAS = [
+    (1 << k, TABELAS_REGRAS[k], atributos[0])
+    for k, atributos in enumerate(ATRIBUTOS_REGRAS)
+    if len(atributos) == 1
+]
+_REGRAS_BINARIAS = [
+    (1 << k, TABELAS_REGRAS[k], atributos[0], atributos[1])
+    for k, atributos in enumerate(ATRIBUTOS_REGRAS)
+    if len(atributos) == 2
+]
+
+
+# máscara de satisfação (bit k = regra k + 1) de um genoma ranqueado
+def avaliar_ranqueado(genoma: Sequence[int]) -> int:
+    mascara = 0
+    for bit, tabela, a in _REGRAS_UNARIAS:
+        if tabela[genoma[a]]:
+            mascara |= bit
+    for bit, tabela, a, b in _REGRAS_BINARIAS:
+        if tabela[genoma[a] * NUMERO_PERMUTACOES + genoma[b]]:
+            mascara |= bit
+    return mascara
+
+
+# fitness simples (número de regras satisfeitas) de um genoma ranqueado
+def fitness_ranqueado(genoma: Sequence[int]) -> int:
+    return CONTAGEM_REGRAS[avaliar_ranqueado(genoma)]
+
+
+# atalho para avaliar uma lista de genomas
+def fitness_genomas(genomas: List[Genoma]) -> List[int]:
+    return [CONTAGEM_REGRAS[avaliar_ranqueado(genoma)] for genoma in genomas]
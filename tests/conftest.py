@@ -0,0 +1,8 @@
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# os módulos de src/ se importam pelo nome (como em python src/main.py)
+if os.path.join(RAIZ, "src") not in sys.path:
+    sys.path.insert(0, os.path.join(RAIZ, "src"))
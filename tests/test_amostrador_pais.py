@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from amostrador_pais import AmostradorPais
+
+SEMENTE = 2024
+VALORES = [0, 3, 15, 7, 7, 1, 12, 0, 9, 4]
+SORTEIOS = 60000
+
+
+def _frequencias(indices):
+    contagem = [0] * len(VALORES)
+    for i in indices:
+        contagem[i] += 1
+    return [n / len(indices) for n in contagem]
+
+
+def _esperadas():
+    pesos = [v + 1 for v in VALORES]
+    return [p / sum(pesos) for p in pesos]
+
+
+@pytest.mark.parametrize("metodo", ["roleta", "roleta_bisect"])
+def test_roleta_proporcional_ao_fitness(metodo):
+    random.seed(SEMENTE)
+    amostrador = AmostradorPais(VALORES)
+    sortear = getattr(amostrador, metodo)
+    frequencias = _frequencias([sortear() for _ in range(SORTEIOS)])
+    for obtida, esperada in zip(frequencias, _esperadas()):
+        assert abs(obtida - esperada) < 0.01
+
+
+def test_tabela_de_alias_preserva_probabilidades():
+    amostrador = AmostradorPais(VALORES)
+    n = amostrador.tamanho
+    # probabilidade exata de cada índice: célula própria + células que apontam para ele
+    exatas = [amostrador._probabilidade[i] / n for i in range(n)]
+    for i in range(n):
+        exatas[amostrador._alias[i]] += (1.0 - amostrador._probabilidade[i]) / n
+    for exata, esperada in zip(exatas, _esperadas()):
+        assert exata == pytest.approx(esperada)
+
+
+def test_sus_tem_contagens_deterministicas():
+    random.seed(SEMENTE)
+    amostrador = AmostradorPais(VALORES)
+    quantidade = 100
+    esperadas = [e * quantidade for e in _esperadas()]
+    for _ in range(200):
+        indices = amostrador.sus(quantidade)
+        assert len(indices) == quantidade
+        assert indices == sorted(indices)
+        for i, esperada in enumerate(esperadas):
+            # ponteiros igualmente espaçados: cada índice recebe o piso ou o teto
+            assert abs(indices.count(i) - esperada) < 1.0 + 1e-9
+    assert amostrador.sus(0) == []
+
+
+def test_torneio_respeita_limite_e_escolhe_o_melhor():
+    random.seed(SEMENTE)
+    amostrador = AmostradorPais(VALORES)
+    for limite in (1, 3, 6):
+        indices = amostrador.torneios(2000, 3, limite=limite)
+        assert all(0 <= i < limite for i in indices)
+    # torneio com todos os candidatos sempre devolve o melhor
+    assert set(amostrador.torneios(100, len(VALORES))) == {VALORES.index(15)}
+
+
+def test_lotes_ficam_no_intervalo():
+    random.seed(SEMENTE)
+    amostrador = AmostradorPais(VALORES)
+    for indices in (amostrador.roletas(1000), amostrador.hibridos(1000)):
+        assert len(indices) == 1000
+        assert all(0 <= i < len(VALORES) for i in indices)
+
+
+def test_populacao_vazia():
+    with pytest.raises(ValueError):
+        AmostradorPais([])
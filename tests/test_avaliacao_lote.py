@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from avaliacao_lote import fitness_populacao, mascaras_lote, populacao_para_array
+from einstein_rules import (
+    BACKENDS_FITNESS,
+    avaliar,
+    backend_fitness,
+    contar_regras,
+    definir_backend_fitness,
+)
+from genetic_algorithm import cromossomo_aleatorio
+
+SEMENTE = 2024
+AMOSTRAS = 5000
+
+
+# metade válidos, metade com genes sobrescritos (valores repetidos nas colunas)
+def _amostras():
+    random.seed(SEMENTE)
+    cromossomos = []
+    for indice in range(AMOSTRAS):
+        genes = bytearray(cromossomo_aleatorio())
+        if indice % 2:
+            for _ in range(random.randint(1, 4)):
+                genes[random.randrange(25)] = random.randrange(5)
+        cromossomos.append(bytes(genes))
+    return cromossomos
+
+
+@pytest.fixture(params=BACKENDS_FITNESS)
+def backend(request):
+    anterior = backend_fitness()
+    definir_backend_fitness(request.param)
+    yield request.param
+    definir_backend_fitness(anterior)
+
+
+def test_mascaras_lote_igual_avaliar(backend):
+    cromossomos = _amostras()
+    mascaras = mascaras_lote(populacao_para_array(cromossomos)).tolist()
+    divergentes = [
+        cromossomo
+        for cromossomo, mascara in zip(cromossomos, mascaras)
+        if mascara != avaliar(cromossomo)
+    ]
+    assert divergentes == []
+
+
+def test_fitness_populacao_igual_avaliar(backend):
+    cromossomos = _amostras()
+    esperado = [contar_regras(avaliar(cromossomo)) for cromossomo in cromossomos]
+    assert fitness_populacao(cromossomos) == esperado
+
+
+def test_fitness_populacao_vazia():
+    assert fitness_populacao([]) == []
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from avaliacao_lote import mascaras_lote, populacao_para_array
+from avaliacao_paralela import AvaliadorParalelo
+from configuracao_ag import ConfiguracaoAG
+from dominios_reduzidos import amostrar_reduzidos
+from einstein_rules import backend_fitness, definir_backend_fitness
+from main import AlgoritmoGeneticoAvancado
+
+
+@pytest.fixture(autouse=True)
+def preservar_backend():
+    anterior = backend_fitness()
+    definir_backend_fitness("bitboard")
+    yield
+    definir_backend_fitness(anterior)
+
+
+def _configuracao(**parametros):
+    return ConfiguracaoAG(
+        tamanho_populacao=400,
+        trabalhadores_fitness=2,
+        limiar_fitness_paralelo=100,
+        **parametros,
+    )
+
+
+def test_mascaras_paralelas_iguais_as_seriais():
+    random.seed(11)
+    populacao_array = populacao_para_array(amostrar_reduzidos(3000))
+    avaliador = AvaliadorParalelo(2, limiar_serial=0)
+    try:
+        paralelas = avaliador.mascaras(populacao_array)
+    finally:
+        avaliador.fechar()
+    assert paralelas.tolist() == mascaras_lote(populacao_array).tolist()
+    assert avaliador.estatisticas["lotes_paralelo"] == 1
+
+
+def test_ag_fecha_o_avaliador_ao_terminar():
+    random.seed(11)
+    algoritmo = AlgoritmoGeneticoAvancado(_configuracao(limite_geracoes=5))
+    algoritmo.executar()
+    assert algoritmo.avaliador_paralelo.estatisticas["lotes_paralelo"] > 0
+    assert algoritmo.avaliador_paralelo._pool is None
+
+
+def test_ag_fecha_o_avaliador_com_o_gerador_fechado_antes():
+    random.seed(11)
+    algoritmo = AlgoritmoGeneticoAvancado(_configuracao(limite_geracoes=50))
+    geracoes = algoritmo.evoluir()
+    next(geracoes)
+    assert algoritmo.avaliador_paralelo._pool is not None
+    geracoes.close()
+    assert algoritmo.avaliador_paralelo._pool is None
+    assert algoritmo.resultado.motivo_parada == "interrompida"
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from cromossomo import trocar
+from einstein_rules import (
+    BACKENDS_FITNESS,
+    MOVIMENTOS_TROCA,
+    avaliar,
+    avaliar_troca,
+    avaliar_vizinhanca,
+    backend_fitness,
+    definir_backend_fitness,
+)
+from genetic_algorithm import cromossomo_aleatorio, gerar_movimento
+
+SEMENTE = 2024
+AMOSTRAS = 2000
+
+
+# metade válidos, metade com genes sobrescritos (valores repetidos nas colunas)
+def _amostras():
+    random.seed(SEMENTE)
+    cromossomos = []
+    for indice in range(AMOSTRAS):
+        genes = bytearray(cromossomo_aleatorio())
+        if indice % 2:
+            for _ in range(random.randint(1, 4)):
+                genes[random.randrange(25)] = random.randrange(5)
+        cromossomos.append(bytes(genes))
+    return cromossomos
+
+
+@pytest.fixture(params=BACKENDS_FITNESS)
+def backend(request):
+    anterior = backend_fitness()
+    definir_backend_fitness(request.param)
+    yield request.param
+    definir_backend_fitness(anterior)
+
+
+def test_avaliar_troca_igual_avaliar(backend):
+    divergentes = []
+    for cromossomo in _amostras():
+        mascara = avaliar(cromossomo)
+        for _ in range(5):
+            atributo, casa1, casa2 = gerar_movimento()
+            vizinho = trocar(cromossomo, atributo, casa1, casa2)
+            if avaliar_troca(vizinho, mascara, atributo) != avaliar(vizinho):
+                divergentes.append((cromossomo, atributo, casa1, casa2))
+    assert divergentes == []
+
+
+def test_avaliar_vizinhanca_igual_avaliar(backend):
+    divergentes = []
+    for cromossomo in _amostras()[:500]:
+        mascaras = avaliar_vizinhanca(cromossomo, avaliar(cromossomo))
+        assert len(mascaras) == len(MOVIMENTOS_TROCA)
+        for movimento, mascara in zip(MOVIMENTOS_TROCA, mascaras):
+            if mascara != avaliar(trocar(cromossomo, *movimento)):
+                divergentes.append((cromossomo, movimento))
+    assert divergentes == []
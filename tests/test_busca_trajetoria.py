@@ -0,0 +1,84 @@
+import random
+import threading
+
+import pytest
+
+from busca_trajetoria import BuscaTabu, RecozimentoSimulado
+from configuracao_ag import ConfiguracaoAG, ResultadoAG
+from einstein_rules import (
+    avaliar,
+    backend_fitness,
+    contar_regras,
+    definir_backend_fitness,
+)
+
+MOTORES = [BuscaTabu, RecozimentoSimulado]
+
+
+@pytest.fixture(autouse=True)
+def preservar_backend():
+    anterior = backend_fitness()
+    definir_backend_fitness("bitboard")
+    yield
+    definir_backend_fitness(anterior)
+
+
+@pytest.mark.parametrize("motor", MOTORES)
+def test_resolve_em_silencio_e_devolve_resultado(motor, capsys):
+    random.seed(1)
+    resultado = motor().executar()
+    assert isinstance(resultado, ResultadoAG)
+    assert resultado.motivo_parada == "solucao"
+    assert resultado.fitness == 15
+    assert contar_regras(avaliar(resultado.cromossomo)) == 15
+    assert resultado.tempo_ate_15 is not None
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("motor", MOTORES)
+def test_limite_avaliacoes(motor):
+    random.seed(1)
+    resultado = motor(ConfiguracaoAG(limite_avaliacoes=200)).executar()
+    assert resultado.motivo_parada == "limite_avaliacoes"
+    # tabu: uma vizinhança (50) por iteração; recozimento: um bloco de verificação
+    assert 200 <= resultado.avaliacoes <= 300
+
+
+@pytest.mark.parametrize("motor", MOTORES)
+def test_fitness_alvo_e_cancelamento(motor):
+    random.seed(1)
+    resultado = motor(ConfiguracaoAG(fitness_alvo=12)).executar()
+    assert resultado.motivo_parada in ("fitness_alvo", "solucao")
+    assert resultado.fitness >= 12
+
+    evento = threading.Event()
+    evento.set()
+    resultado = motor(evento_parada=evento).executar()
+    assert resultado.motivo_parada == "interrompida"
+
+
+@pytest.mark.parametrize("motor", MOTORES)
+def test_callbacks_recebem_inicio_marcos_e_fim(motor):
+    random.seed(1)
+    eventos = []
+    resultado = motor(callbacks=[lambda evento, dados: eventos.append(evento)]).executar()
+    assert eventos[0] == "inicio_motor"
+    assert eventos[-1] == "fim_motor"
+    assert eventos.count("marco") == len(resultado.marcos)
+
+
+# sem limite_avaliacoes na configuração o motor não para por avaliações: os tetos de
+# iterações (tabu) e ciclos (recozimento) vêm de limite_geracoes
+def test_limite_geracoes_da_configuracao():
+    configuracao = ConfiguracaoAG(limite_geracoes=5)
+
+    random.seed(0)
+    resultado = BuscaTabu(configuracao).executar()
+    assert resultado.motivo_parada == "limite_geracoes"
+    assert resultado.geracoes == 5
+
+    random.seed(0)
+    resultado = RecozimentoSimulado(configuracao, passos_por_ciclo=1000).executar()
+    assert resultado.motivo_parada == "limite_geracoes"
+    assert resultado.geracoes == 5
+    assert resultado.avaliacoes == 1 + 5 * 1000
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from busca_vizinhanca import MODOS_BUSCA_LOCAL
+from cache_fitness import CacheFitness
+from cromossomo import empacotar
+from dominios_reduzidos import amostrar_reduzidos
+from einstein_rules import avaliar, fitness
+from genetic_algorithm import busca_local, cromossomo_aleatorio
+
+
+def test_restaurar_respeita_tamanho_maximo():
+    random.seed(5)
+    populacao = amostrar_reduzidos(50)
+    grande = CacheFitness(100)
+    grande.fitness_populacao(populacao)
+    entradas = grande.entradas()
+
+    pequeno = CacheFitness(10)
+    pequeno.restaurar(entradas)
+    assert pequeno.entradas() == entradas[-10:]  # ficam as mais recentemente usadas
+    assert pequeno.remocoes == len(entradas) - 10
+
+    # o cache segue correto e limitado depois da restauração
+    for cromossomo in populacao:
+        assert pequeno.avaliar(cromossomo) == avaliar(cromossomo)
+        assert len(pequeno.entradas()) <= 10
+    assert pequeno.entradas()[-1][0] == empacotar(populacao[-1])
+
+
+@pytest.mark.parametrize("modo", MODOS_BUSCA_LOCAL)
+def test_busca_local_incremental_pelo_cache(modo):
+    random.seed(8)
+    cromossomos = [cromossomo_aleatorio() for _ in range(20)]
+    cache = CacheFitness(100)
+
+    random.seed(9)
+    diretos = [busca_local(c, fitness, 15, modo, incremental=True) for c in cromossomos]
+    random.seed(9)
+    pelo_cache = [
+        busca_local(
+            c, cache.fitness, 15, modo, incremental=True, funcao_avaliar=cache.avaliar
+        )
+        for c in cromossomos
+    ]
+    assert pelo_cache == diretos
+    assert cache.falhas == len(set(cromossomos))  # só o ponto de partida vai ao cache
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from configuracao_ag import ConfiguracaoAG
+from einstein_rules import backend_fitness, definir_backend_fitness
+from main import AlgoritmoGeneticoAvancado
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def preservar_backend():
+    anterior = backend_fitness()
+    definir_backend_fitness("bitboard")
+    yield
+    definir_backend_fitness(anterior)
+
+
+def test_backend_da_configuracao_vale_so_durante_o_ag():
+    backends = []
+    algoritmo = AlgoritmoGeneticoAvancado(
+        ConfiguracaoAG(
+            tamanho_populacao=100, limite_geracoes=3, backend_fitness="regras"
+        ),
+        callbacks=[lambda evento, dados: backends.append(backend_fitness())],
+    )
+    geracoes = algoritmo.evoluir()
+    for _ in geracoes:
+        assert backend_fitness() == "bitboard"  # quem consome mantém o seu backend
+    assert backends and set(backends) == {"regras"}
+    assert backend_fitness() == "bitboard"
+
+    algoritmo.executar()
+    assert backend_fitness() == "bitboard"
+
+
+def test_motores_nao_dependem_do_ponto_de_entrada():
+    codigo = (
+        "import sys\n"
+        "from busca_trajetoria import BuscaTabu\n"
+        "from configuracao_ag import ConfiguracaoAG\n"
+        "BuscaTabu(ConfiguracaoAG(limite_avaliacoes=100)).executar()\n"
+        "assert 'main' not in sys.modules\n"
+    )
+    ambiente = dict(os.environ, PYTHONPATH=os.path.join(RAIZ, "src"))
+    subprocess.run([sys.executable, "-c", codigo], env=ambiente, check=True)
@@ -0,0 +1,81 @@
+import random
+
+import numpy as np
+import pytest
+
+from configuracao_ag import ConfiguracaoAG
+from cromossomo import NUMERO_ATRIBUTOS, NUMERO_CASAS
+from eda_permutacoes import AlgoritmoEDA, amostrar_matrizes, matrizes_iniciais
+from einstein_rules import backend_fitness, definir_backend_fitness
+
+
+@pytest.fixture(autouse=True)
+def preservar_backend():
+    anterior = backend_fitness()
+    definir_backend_fitness("bitboard")
+    yield
+    definir_backend_fitness(anterior)
+
+
+def _colunas_validas(genes):
+    ordenados = np.sort(genes, axis=1)  # (N, casa, atributo) -> valores por coluna
+    return bool((ordenados == np.arange(NUMERO_CASAS)[None, :, None]).all())
+
+
+# sorteio sempre no topo do intervalo: o caso em que o arredondamento leva o sorteio
+# ao total acumulado
+class _GeradorNoTopo:
+
+    def permutation(self, n):
+        return np.arange(n)
+
+    def random(self, forma):
+        return np.ones(forma)
+
+
+def test_amostragem_sem_repeticao_com_sorteio_no_total():
+    genes = amostrar_matrizes(matrizes_iniciais(), 50, _GeradorNoTopo())
+    assert _colunas_validas(genes)
+
+
+def test_amostragem_sem_repeticao_com_probabilidades_degeneradas():
+    gerador = np.random.default_rng(3)
+    matrizes = np.zeros((NUMERO_ATRIBUTOS, NUMERO_CASAS, 5))
+    matrizes[:, :, 0] = 1.0  # toda a massa no mesmo valor em todas as casas
+    matrizes[0, 2] = [0, 0, 0, 0, 1e-300]
+    genes = amostrar_matrizes(matrizes, 2000, gerador)
+    assert _colunas_validas(genes)
+
+
+def test_sem_geracoes_devolve_resultado_vazio():
+    resultado = AlgoritmoEDA(max_geracoes=0).executar()
+    assert resultado.cromossomo is None
+    assert resultado.fitness == 0
+    assert resultado.geracoes == 0
+    assert resultado.motivo_parada == "limite_geracoes"
+
+
+def test_orcamento_e_silencio(capsys):
+    random.seed(1)
+    resultado = AlgoritmoEDA(
+        ConfiguracaoAG(limite_avaliacoes=1200), tamanho_populacao=500
+    ).executar()
+    assert resultado.motivo_parada == "limite_avaliacoes"
+    assert resultado.avaliacoes == 1500  # 3 gerações inteiras de 500
+    assert resultado.cromossomo is not None
+    assert capsys.readouterr().out == ""
+
+
+def test_resolve_com_semente():
+    random.seed(4)
+    resultado = AlgoritmoEDA(max_geracoes=600).executar()
+    assert resultado.motivo_parada == "solucao"
+    assert resultado.fitness == 15
+    assert 15 in resultado.marcos
+
+
+def test_limite_geracoes_da_configuracao():
+    random.seed(1)
+    resultado = AlgoritmoEDA(ConfiguracaoAG(limite_geracoes=3)).executar()
+    assert resultado.motivo_parada == "limite_geracoes"
+    assert resultado.geracoes == 3
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from experimentos import (
+    VERSAO_CONTAGEM,
+    agregar,
+    executar_campanha,
+    executar_configuracao,
+)
+
+# configuração curta com a completação exata ligada (padrão)
+PARAMETROS = {"tamanho_populacao": 200, "limite_geracoes": 30}
+CAMPOS_TEMPO = ("tempo_ate_14", "tempo_ate_15", "tempo_total")
+
+
+def _sem_tempos(execucao):
+    return {
+        campo: valor for campo, valor in execucao.items() if campo not in CAMPOS_TEMPO
+    }
+
+
+def test_linha_reprodutivel_pela_semente():
+    primeira = executar_configuracao("curta", PARAMETROS, 5)
+    segunda = executar_configuracao("curta", PARAMETROS, 5)
+    assert _sem_tempos(primeira) == _sem_tempos(segunda)
+    assert primeira["versao_contagem"] == VERSAO_CONTAGEM
+
+
+def test_agregados_de_avaliacoes():
+    execucoes = [
+        executar_configuracao("curta", PARAMETROS, semente) for semente in (1, 2, 3)
+    ]
+    avaliacoes = sorted(execucao["avaliacoes"] for execucao in execucoes)
+    resumo = agregar(execucoes)["curta"]["avaliacoes"]
+    assert (resumo["minimo"], resumo["mediana"], resumo["maximo"]) == (
+        avaliacoes[0],
+        avaliacoes[1],
+        avaliacoes[2],
+    )
+
+
+# linhas sem versão (gravadas antes do campo existir) ou da versão anterior
+@pytest.mark.parametrize("versao", [None, VERSAO_CONTAGEM - 1])
+def test_campanha_refaz_linhas_de_outra_contagem(tmp_path, versao):
+    saida = str(tmp_path / "campanha")
+    antiga = executar_configuracao("curta", PARAMETROS, 1)
+    antiga["avaliacoes"] = 1
+    if versao is None:
+        del antiga["versao_contagem"]
+    else:
+        antiga["versao_contagem"] = versao
+    with open(f"{saida}.jsonl", "w", encoding="utf-8") as arquivo:
+        arquivo.write(json.dumps(antiga) + "\n")
+
+    resultado = executar_campanha({"curta": PARAMETROS}, [1], saida, trabalhadores=1)
+    (execucao,) = resultado["execucoes"]
+    assert execucao["versao_contagem"] == VERSAO_CONTAGEM
+    assert execucao["avaliacoes"] > 1
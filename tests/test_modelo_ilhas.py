@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from configuracao_ag import ConfiguracaoAG, ResultadoAG
+from einstein_rules import backend_fitness, definir_backend_fitness
+from modelo_ilhas import ModeloIlhas
+
+TAMANHO_POPULACAO = 200
+
+
+@pytest.fixture(autouse=True)
+def preservar_backend():
+    anterior = backend_fitness()
+    definir_backend_fitness("bitboard")
+    yield
+    definir_backend_fitness(anterior)
+
+
+def _modelo(callbacks=None, evento_parada=None, **parametros):
+    configuracao = ConfiguracaoAG(tamanho_populacao=TAMANHO_POPULACAO, **parametros)
+    return ModeloIlhas(
+        configuracao,
+        callbacks,
+        evento_parada,
+        numero_ilhas=2,
+        trabalhadores=2,
+        semente=11,
+    )
+
+
+def test_limite_avaliacoes_dividido_entre_as_ilhas():
+    eventos = []
+    modelo = _modelo(
+        [lambda evento, dados: eventos.append(evento)],
+        limite_avaliacoes=6000,
+        limiar_completacao_exata=None,
+    )
+    resultado = modelo.executar()
+
+    assert isinstance(resultado, ResultadoAG)
+    assert resultado.semente == 11
+    assert resultado.avaliacoes == sum(ilha["avaliacoes"] for ilha in modelo.ilhas)
+    assert len(modelo.ilhas) == 2
+    for ilha in modelo.ilhas:
+        assert ilha["motivo_parada"] in ("limite_avaliacoes", "solucao", "interrompida")
+        assert ilha["avaliacoes"] <= 3000 + TAMANHO_POPULACAO
+    assert resultado.motivo_parada in ("limite_avaliacoes", "solucao")
+    assert eventos == ["inicio_motor", "resumo_ilhas", "fim_motor"]
+
+
+def test_partes_do_limite_de_avaliacoes():
+    modelo = ModeloIlhas(ConfiguracaoAG(limite_avaliacoes=10), numero_ilhas=3)
+    partes = [modelo._configuracao_ilha(i).limite_avaliacoes for i in range(3)]
+    assert partes == [4, 3, 3]
+    modelo = ModeloIlhas(ConfiguracaoAG(backend_fitness="regras"), numero_ilhas=3)
+    assert modelo._configuracao_ilha(0).backend_fitness == "regras"
+
+
+def test_fitness_alvo_encerra_todas_as_ilhas():
+    resultado = _modelo(fitness_alvo=12).executar()
+    assert resultado.motivo_parada in ("fitness_alvo", "solucao")
+    assert resultado.fitness >= 12
+
+
+def test_evento_parada_de_quem_chama():
+    evento = threading.Event()
+    evento.set()
+    modelo = _modelo(evento_parada=evento)
+    resultado = modelo.executar()
+    assert resultado.motivo_parada == "interrompida"
+    assert all(ilha["motivo_parada"] == "interrompida" for ilha in modelo.ilhas)
+
+
+def test_ponto_controle_recusado():
+    with pytest.raises(ValueError):
+        ModeloIlhas(ConfiguracaoAG(caminho_ponto_controle="ilhas.agpc"))
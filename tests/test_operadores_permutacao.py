@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from genetic_algorithm import cromossomo_aleatorio
+from operadores_permutacao import OPERADORES_COLUNA, cruzamento_permutacao
+from tabelas_permutacao import RANK_COLUNA
+
+SEMENTE = 2024
+AMOSTRAS = 2000
+
+
+def _permutacao_aleatoria():
+    coluna = list(range(5))
+    random.shuffle(coluna)
+    return bytes(coluna)
+
+
+@pytest.mark.parametrize("operador", sorted(OPERADORES_COLUNA))
+def test_filhos_de_coluna_sao_permutacoes(operador):
+    random.seed(SEMENTE)
+    operador_coluna = OPERADORES_COLUNA[operador]
+    for _ in range(AMOSTRAS):
+        pai1 = _permutacao_aleatoria()
+        pai2 = _permutacao_aleatoria()
+        filho1, filho2 = operador_coluna(pai1, pai2)
+        assert sorted(filho1) == list(range(5))
+        assert sorted(filho2) == list(range(5))
+        if operador in ("cx", "uniforme_colunas"):
+            # cx e uniforme mantêm cada valor na posição de um dos pais
+            assert all(g in (a, b) for g, a, b in zip(filho1, pai1, pai2))
+            assert all(g in (a, b) for g, a, b in zip(filho2, pai1, pai2))
+
+
+@pytest.mark.parametrize("operador", sorted(OPERADORES_COLUNA))
+def test_cruzamento_permutacao_gera_cromossomos_validos(operador):
+    random.seed(SEMENTE)
+    for _ in range(AMOSTRAS):
+        pai1 = cromossomo_aleatorio()
+        pai2 = cromossomo_aleatorio()
+        for filho in cruzamento_permutacao(pai1, pai2, 1.0, operador):
+            assert len(filho) == 25
+            assert all(filho[a::5] in RANK_COLUNA for a in range(5))
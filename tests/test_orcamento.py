@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+import completacao_exata
+import einstein_rules
+import main
+from configuracao_ag import ConfiguracaoAG
+from main import AlgoritmoGeneticoAvancado
+from orcamento import Orcamento
+
+TAMANHO_POPULACAO = 300
+
+
+# conta as avaliações reais: chamadas avulsas de avaliar (direto ou via fitness),
+# cromossomos avaliados em lote e combinações enumeradas pela completação exata
+@pytest.fixture
+def contador(monkeypatch):
+    chamadas = [0]
+    combinacoes = [0]
+    avaliar_original = einstein_rules.avaliar
+    lote_original = main.fitness_populacao
+    genomas_original = completacao_exata.fitness_genomas_lote
+
+    def avaliar(cromossomo):
+        chamadas[0] += 1
+        return avaliar_original(cromossomo)
+
+    def fitness_populacao(populacao):
+        chamadas[0] += len(populacao)
+        return lote_original(populacao)
+
+    def fitness_genomas_lote(genomas):
+        combinacoes[0] += len(genomas)
+        return genomas_original(genomas)
+
+    monkeypatch.setattr(einstein_rules, "avaliar", avaliar)
+    monkeypatch.setattr(main, "avaliar", avaliar)
+    monkeypatch.setattr(main, "fitness_populacao", fitness_populacao)
+    monkeypatch.setattr(completacao_exata, "fitness_genomas_lote", fitness_genomas_lote)
+    backend_anterior = einstein_rules.backend_fitness()
+    einstein_rules.definir_backend_fitness("bitboard")
+    yield chamadas, combinacoes
+    einstein_rules.definir_backend_fitness(backend_anterior)
+
+
+# com a completação exata no limiar padrão: na semente 4 o melhor chega a 14 antes do
+# limite de 20000 e a completação gasta parte do orçamento
+@pytest.mark.parametrize(
+    "semente, limite, completa", [(3, 5000, False), (4, 20000, True)]
+)
+def test_limite_avaliacoes_conta_todas_as_avaliacoes(
+    contador, semente, limite, completa
+):
+    chamadas, combinacoes = contador
+    random.seed(semente)
+    algoritmo = AlgoritmoGeneticoAvancado(
+        ConfiguracaoAG(
+            tamanho_populacao=TAMANHO_POPULACAO,
+            limite_avaliacoes=limite,
+            usar_cache_fitness=False,
+        )
+    )
+    assert algoritmo.limiar_completacao_exata is not None
+    algoritmo.executar()
+    resultado = algoritmo.resultado
+
+    # nenhuma avaliação fora dos contadores do AG
+    assert chamadas[0] == algoritmo.avaliacoes_diretas
+    assert combinacoes[0] == algoritmo.avaliacoes_completacao
+    assert (combinacoes[0] > 0) == completa
+    assert resultado.avaliacoes == (
+        chamadas[0]
+        + algoritmo.estatisticas_busca_local["avaliacoes"]
+        + combinacoes[0]
+    )
+    # para logo depois do limite: no máximo uma avaliação de população a mais
+    assert resultado.motivo_parada == "limite_avaliacoes"
+    assert limite <= resultado.avaliacoes <= limite + TAMANHO_POPULACAO
+
+
+def test_orcamento_esgotado_fica_registrado():
+    avaliacoes = [0]
+    orcamento = Orcamento(limite_avaliacoes=10, contar_avaliacoes=lambda: avaliacoes[0])
+    assert orcamento.esgotado() is None
+    avaliacoes[0] = 10
+    assert orcamento.esgotado() == "limite_avaliacoes"
+    avaliacoes[0] = 0
+    assert orcamento.esgotado() == "limite_avaliacoes"
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from configuracao_ag import ConfiguracaoAG
+from einstein_rules import backend_fitness, definir_backend_fitness
+from main import executar_ag, retomar_ag
+from ponto_controle import (
+    carregar_ponto_controle,
+    desempacotar_cromossomos,
+    empacotar_cromossomos,
+)
+from genetic_algorithm import cromossomo_aleatorio
+
+SEMENTE = 7
+GERACOES_INTERRUPCAO = 20
+GERACOES_TOTAIS = 40
+
+
+@pytest.fixture(autouse=True)
+def preservar_backend():
+    anterior = backend_fitness()
+    yield
+    definir_backend_fitness(anterior)
+
+
+def _configuracao(limite_geracoes, **parametros):
+    return ConfiguracaoAG(
+        tamanho_populacao=200, limite_geracoes=limite_geracoes, **parametros
+    )
+
+
+def _comparaveis(resultado):
+    return (
+        resultado.cromossomo,
+        resultado.fitness,
+        resultado.geracoes,
+        resultado.avaliacoes,
+        resultado.consultas_fitness,
+        resultado.motivo_parada,
+        {fitness: geracao for fitness, (geracao, _) in resultado.marcos.items()},
+    )
+
+
+def test_empacotamento_base5_ida_e_volta():
+    random.seed(SEMENTE)
+    cromossomos = [cromossomo_aleatorio() for _ in range(100)]
+    assert desempacotar_cromossomos(empacotar_cromossomos(cromossomos)) == cromossomos
+
+
+@pytest.mark.parametrize("usar_cache", [True, False])
+def test_retomada_exata_inclusive_avaliacoes(tmp_path, usar_cache):
+    caminho = str(tmp_path / "execucao.agpc")
+    continua = executar_ag(
+        _configuracao(GERACOES_TOTAIS, usar_cache_fitness=usar_cache), semente=SEMENTE
+    )
+
+    # intervalo 0: grava no início de toda geração; a última gravação é a da geração
+    # GERACOES_INTERRUPCAO, que a retomada executa de novo
+    executar_ag(
+        _configuracao(
+            GERACOES_INTERRUPCAO,
+            usar_cache_fitness=usar_cache,
+            caminho_ponto_controle=caminho,
+            intervalo_ponto_controle=0,
+        ),
+        semente=SEMENTE,
+    )
+    estado = carregar_ponto_controle(caminho)
+    assert estado["geracao"] == GERACOES_INTERRUPCAO
+    assert bool(estado["cache_cromossomos"]) == usar_cache
+
+    retomada = retomar_ag(
+        caminho, limite_geracoes=GERACOES_TOTAIS, caminho_ponto_controle=None
+    )
+    assert _comparaveis(retomada) == _comparaveis(continua)
@@ -0,0 +1,49 @@
+import random
+
+from einstein_rules import NUMERO_REGRAS
+from genetic_algorithm import cromossomo_aleatorio
+from ranking_populacao import RankingPopulacao
+
+SEMENTE = 2024
+
+
+def _populacao(tamanho):
+    populacao = [cromossomo_aleatorio() for _ in range(tamanho)]
+    valores = [random.randint(0, NUMERO_REGRAS) for _ in range(tamanho)]
+    return populacao, valores
+
+
+def test_ordenada_igual_a_sorted():
+    random.seed(SEMENTE)
+    for tamanho in (1, 2, 17, 300):
+        populacao, valores = _populacao(tamanho)
+        ranking = RankingPopulacao(populacao, valores)
+        cromossomos, ordenados = ranking.ordenada()
+
+        esperado = sorted(zip(valores, range(tamanho)), key=lambda par: par[0], reverse=True)
+        assert ordenados == [valor for valor, _ in esperado]
+        # estável: empates mantêm a ordem original
+        assert cromossomos == [populacao[i] for _, i in esperado]
+
+
+def test_estatisticas_consistentes():
+    random.seed(SEMENTE)
+    populacao, valores = _populacao(500)
+    ranking = RankingPopulacao(populacao, valores)
+
+    assert ranking.melhor_fitness == max(valores)
+    assert ranking.media() == sum(valores) / len(valores)
+    assert ranking.contagem == [valores.count(v) for v in range(NUMERO_REGRAS + 1)]
+    for valor in range(NUMERO_REGRAS + 1):
+        assert ranking.quantidade(valor) == valores.count(valor)
+        assert ranking.quantidade_abaixo(valor) == sum(v < valor for v in valores)
+        assert ranking.nivel(valor) == [c for c, v in zip(populacao, valores) if v == valor]
+
+
+def test_melhores_e_prefixo_da_ordenada():
+    random.seed(SEMENTE)
+    populacao, valores = _populacao(200)
+    ranking = RankingPopulacao(populacao, valores)
+    cromossomos, ordenados = ranking.ordenada()
+    for k in (0, 1, 10, 200, 250):
+        assert ranking.melhores(k) == (cromossomos[:k], ordenados[:k])
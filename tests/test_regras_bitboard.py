@@ -0,0 +1,18 @@
+import random
+
+from einstein_rules import MASCARA_COMPLETA, REGRAS
+from regras_bitboard import avaliar_bitboard, verificar_equivalencia
+from solucionador_exato import resolver_exato
+
+
+def test_bitboard_equivalente_as_regras():
+    random.seed(2024)
+    assert verificar_equivalencia(20000) == []
+
+
+def test_bitboard_solucao_satisfaz_todas():
+    solucoes, _ = resolver_exato()
+    for solucao in solucoes:
+        esperado = sum(1 << k for k, regra in enumerate(REGRAS) if regra(solucao))
+        assert esperado == MASCARA_COMPLETA
+        assert avaliar_bitboard(solucao) == MASCARA_COMPLETA
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from einstein_rules import avaliar, fitness
+from genetic_algorithm import cromossomo_aleatorio
+from tabelas_permutacao import (
+    NUMERO_PERMUTACOES,
+    PERMUTACOES,
+    RANK_COLUNA,
+    avaliar_ranqueado,
+    desranquear,
+    fitness_genomas,
+    fitness_ranqueado,
+    ranquear,
+    ranquear_permutacao,
+)
+
+SEMENTE = 2024
+AMOSTRAS = 5000
+
+
+def test_rank_de_lehmer_ida_e_volta():
+    assert len(PERMUTACOES) == NUMERO_PERMUTACOES
+    for rank, permutacao in enumerate(PERMUTACOES):
+        assert ranquear_permutacao(permutacao) == rank
+        assert RANK_COLUNA[bytes(permutacao)] == rank
+
+
+def test_ranquear_e_desranquear_sao_inversas():
+    random.seed(SEMENTE)
+    for _ in range(AMOSTRAS):
+        cromossomo = cromossomo_aleatorio()
+        genoma = ranquear(cromossomo)
+        assert desranquear(genoma) == cromossomo
+        assert all(genoma[a] == RANK_COLUNA[cromossomo[a::5]] for a in range(5))
+
+
+def test_ranquear_rejeita_coluna_com_repeticao():
+    genes = bytearray(cromossomo_aleatorio())
+    genes[0] = genes[5]
+    with pytest.raises(KeyError):
+        ranquear(bytes(genes))
+
+
+def test_tabelas_iguais_a_avaliacao_completa():
+    random.seed(SEMENTE)
+    divergentes = []
+    genomas = []
+    esperados = []
+    for _ in range(AMOSTRAS):
+        genoma = tuple(random.randrange(NUMERO_PERMUTACOES) for _ in range(5))
+        cromossomo = desranquear(genoma)
+        if avaliar_ranqueado(genoma) != avaliar(cromossomo):
+            divergentes.append(genoma)
+        assert fitness_ranqueado(genoma) == fitness(cromossomo)
+        genomas.append(genoma)
+        esperados.append(fitness(cromossomo))
+    assert divergentes == []
+    assert fitness_genomas(genomas) == esperados